@@ -6,6 +6,7 @@ import yaml
 from sqlalchemy.orm import Session
 
 from api.app.models.bot import Bot
+from api.app.orchestrator.prompt_builder import invalidate_prompt_cache
 
 
 logger = logging.getLogger(__name__)
@@ -74,4 +75,5 @@ def sync_bots_to_db(db: Session) -> list[Bot]:
             logger.info(f"Created bot: {bot.name}")
 
     db.commit()
+    invalidate_prompt_cache()
     return bots
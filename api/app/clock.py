@@ -0,0 +1,41 @@
+"""Injectable clock, so simulations can drive heartbeats on virtual time.
+
+Heartbeat-path code reads the time through ``utcnow()`` / ``today()`` instead
+of ``datetime`` directly. By default these are the real clock.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Callable
+
+
+_source: Callable[[], datetime] | None = None
+
+
+def utcnow() -> datetime:
+    """Current UTC time (naive), from the installed clock."""
+    return _source() if _source else datetime.utcnow()
+
+
+def today() -> date:
+    """Current date, from the installed clock."""
+    return _source().date() if _source else date.today()
+
+
+def set_clock(source: Callable[[], datetime] | None) -> None:
+    """Install a clock source (None restores the real clock)."""
+    global _source
+    _source = source
+
+
+class VirtualClock:
+    """Manually advanced clock for simulations."""
+
+    def __init__(self, start: datetime):
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> datetime:
+        self.now += timedelta(seconds=seconds)
+        return self.now
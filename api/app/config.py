@@ -10,12 +10,54 @@ class Settings(BaseSettings):
     # LLM Provider
     llm_provider: str = "mock"  # anthropic | mock | ollama
     anthropic_api_key: str = ""
+    prompt_cache_enabled: bool = True  # Mark stable prompt prefixes cacheable (Anthropic prompt caching)
+    prompt_max_input_tokens: int = 8000  # Heartbeat prompt budget; per-bot model.max_input_tokens overrides
+    llm_stream_enabled: bool = True  # Stream heartbeat responses and stop once a complete action has arrived
+    llm_max_connections: int = 20  # Pooled keep-alive connections per LLM provider client
+    llm_http2: bool = True  # Use HTTP/2 for LLM API calls when the h2 package is installed
+    llm_cache_enabled: bool = True  # Reuse responses for repeated extraction/compression prompts
+    llm_cache_ttl_seconds: int = 604800  # Cached responses expire after this long (7 days)
+    llm_cache_max_entries: int = 5000  # Least recently used cache entries are evicted past this
+    # Per-bot and per-task provider routing: bots use their model.provider, and
+    # extraction/compression can go elsewhere (empty = the bot's provider)
+    llm_routing_enabled: bool = False
+    llm_extraction_provider: str = ""
+    llm_extraction_model: str = ""
+    llm_compression_provider: str = ""
+    llm_compression_model: str = ""
+    # Per-provider rate limits and adaptive concurrency (0 = unlimited); queued
+    # calls run heartbeats first, then extraction, then compression
+    llm_limiter_enabled: bool = True
+    anthropic_rpm: int = 50  # Requests per minute
+    anthropic_tpm: int = 40000  # Input + output tokens per minute (prompt cache reads excluded)
+    anthropic_max_concurrency: int = 8  # Upper bound of the AIMD window; halves on 429/5xx/latency spikes
+    ollama_max_concurrency: int = 1  # A local server mostly serialises generations anyway
+    llm_action_mode: str = "json"  # json (parse free-form JSON) | tools (Anthropic tool use / Ollama JSON mode)
+    max_actions_per_heartbeat: int = 1  # Actions one response may take, applied in order; capped by a bot's rate_limit
 
     # Database
     database_url: str = "sqlite:///./data/botastrophic.db"
 
     # Heartbeat
     heartbeat_interval: int = 14400  # 4 hours in seconds
+    heartbeat_concurrency: int = 4  # Max bots heartbeating at once per tick (1 = sequential)
+    scheduler_mode: str = "global"  # global (one job wakes every bot) | staggered (one phase-offset job per bot)
+    stagger_jitter_fraction: float = 0.25  # Max jitter per bot, as a fraction of its slot width
+    scheduler_misfire_grace_seconds: int = 300  # A run starting later than this is skipped and counted as missed
+    scheduler_coalesce: bool = True  # Collapse a backlog of missed runs into a single run
+    embedded_scheduler: bool = True  # Run the scheduler inside the API process (off when using the worker)
+    scheduler_lease_ttl_seconds: int = 60  # Scheduler lease expiry; the holder renews every ttl/3
+    manual_trigger_timeout_seconds: int = 600  # How long a manual trigger waits for the scheduler owner to run it
+
+    # Event-driven wakeups (early heartbeat when a bot is replied to, mentioned or voted on)
+    wakeup_enabled: bool = True
+    wakeup_debounce_seconds: int = 60  # Quiet period before the early heartbeat fires
+    wakeup_max_delay_seconds: int = 300  # A wakeup fires this long after the first request even if requests keep coming
+    wakeup_min_interval_seconds: int = 1800  # At most one early wakeup per bot per this window
+
+    # Skip the LLM call (logging do_nothing) when nothing involving the bot changed,
+    # with a probability from its shyness and engagement_style
+    fast_path_enabled: bool = True
 
     # API
     api_host: str = "0.0.0.0"
@@ -50,6 +50,13 @@ def _run_migrations():
         ("bots", "source", "VARCHAR(20) NOT NULL DEFAULT 'yaml'"),
         ("bots", "is_paused", "BOOLEAN NOT NULL DEFAULT 0"),
         ("threads", "last_reply_at", "DATETIME"),
+        ("token_usage", "cache_read_tokens", "INTEGER NOT NULL DEFAULT 0"),
+        ("token_usage", "cache_write_tokens", "INTEGER NOT NULL DEFAULT 0"),
+    ]
+
+    # create_all only builds indexes along with new tables
+    indexes = [
+        ("ix_replies_thread_id_id", "replies", "thread_id, id"),
     ]
 
     with engine.begin() as conn:
@@ -62,3 +69,10 @@ def _run_migrations():
                 logger.info(f"Migration: added {table}.{column}")
             else:
                 logger.debug(f"Migration: {table}.{column} already exists")
+
+        for name, table, columns in indexes:
+            if table not in inspector.get_table_names():
+                continue
+            if name not in [i["name"] for i in inspector.get_indexes(table)]:
+                conn.execute(text(f"CREATE INDEX {name} ON {table} ({columns})"))
+                logger.info(f"Migration: added index {name}")
@@ -1,3 +1,9 @@
-from api.app.llm.client import LLMClient, get_llm_client
+from api.app.llm.client import (
+    LLMClient, LLMResponse, StructuredPrompt, TextCallback,
+    close_llm_clients, get_llm_client, start_llm_clients,
+)
 
-__all__ = ["LLMClient", "get_llm_client"]
+__all__ = [
+    "LLMClient", "LLMResponse", "StructuredPrompt", "TextCallback",
+    "close_llm_clients", "get_llm_client", "start_llm_clients",
+]
@@ -1,21 +1,56 @@
 """Anthropic Claude adapter."""
 
+import json
+
 import anthropic
 
-from api.app.llm.client import LLMClient, LLMResponse
+from api.app.config import get_settings
+from api.app.llm.client import (
+    LLMClient, LLMResponse, StructuredPrompt, TextCallback, estimate_output_tokens,
+    http2_enabled, http_limits,
+)
+
+
+def _message_content(prompt: str | StructuredPrompt) -> str | list[dict]:
+    """User message content, with each stable prefix block marked cacheable."""
+    if isinstance(prompt, str):
+        return prompt
+    if not get_settings().prompt_cache_enabled:
+        return prompt.text
+
+    blocks = [
+        {"type": "text", "text": block, "cache_control": {"type": "ephemeral"}}
+        for block in prompt.prefix_blocks
+        if block
+    ]
+    if prompt.suffix:
+        blocks.append({"type": "text", "text": prompt.suffix})
+    return blocks
 
 
 class AnthropicAdapter(LLMClient):
-    """Adapter for Anthropic Claude API."""
+    """Adapter for Anthropic Claude API.
+
+    One instance is shared process-wide; its HTTP client pools keep-alive
+    connections (HTTP/2 when available) so calls skip TCP and TLS setup.
+    """
+
+    provider = "anthropic"
 
     def __init__(self, api_key: str):
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY is required for Anthropic provider")
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=http_limits(), http2=http2_enabled()),
+        )
+
+    async def aclose(self) -> None:
+        await self.client.close()
 
     async def think(
         self,
-        prompt: str,
+        prompt: str | StructuredPrompt,
         model: str = "claude-sonnet-4-5-20250929",
         temperature: float = 0.8,
         max_tokens: int = 1000,
@@ -25,12 +60,105 @@ class AnthropicAdapter(LLMClient):
             model=model,
             max_tokens=max_tokens,
             temperature=temperature,
-            messages=[{"role": "user", "content": prompt}],
+            messages=[{"role": "user", "content": _message_content(prompt)}],
         )
 
+        usage = response.usage
         return LLMResponse(
             content=response.content[0].text,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            model=model,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
+        )
+
+    async def think_tools(
+        self,
+        prompt: str | StructuredPrompt,
+        tools: list[dict],
+        model: str = "claude-sonnet-4-5-20250929",
+        temperature: float = 0.8,
+        max_tokens: int = 1000,
+        max_calls: int = 1,
+    ) -> LLMResponse:
+        """Have Claude answer with tool calls: exactly one, or up to max_calls in parallel.
+
+        ``content`` holds the calls as ``{"action": name, **input}`` JSON (a
+        list of them for several) so logs look the same as in free-form
+        JSON mode. Calls past max_calls are dropped.
+        """
+        response = await self.client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            tools=tools,
+            tool_choice={"type": "any", "disable_parallel_tool_use": max_calls <= 1},
+            messages=[{"role": "user", "content": _message_content(prompt)}],
+        )
+
+        tool_calls = [
+            {"name": block.name, "input": dict(block.input or {})}
+            for block in response.content
+            if block.type == "tool_use"
+        ][:max(1, max_calls)]
+        if tool_calls:
+            calls = [{"action": call["name"], **call["input"]} for call in tool_calls]
+            content = json.dumps(calls[0] if len(calls) == 1 else calls)
+        else:
+            content = "".join(block.text for block in response.content if block.type == "text")
+
+        usage = response.usage
+        return LLMResponse(
+            content=content,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            model=model,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
+            tool_calls=tool_calls,
+        )
+
+    async def think_stream(
+        self,
+        prompt: str | StructuredPrompt,
+        on_text: TextCallback,
+        model: str = "claude-sonnet-4-5-20250929",
+        temperature: float = 0.8,
+        max_tokens: int = 1000,
+    ) -> LLMResponse:
+        """Stream Claude's response, closing the stream once on_text has enough.
+
+        Closing the connection stops generation, so output billing ends
+        there too; the final output token count is then only an estimate.
+        """
+        chunks = []
+        stopped_early = False
+        async with self.client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": _message_content(prompt)}],
+        ) as stream:
+            async for event in stream:
+                if event.type != "text":
+                    continue
+                chunks.append(event.text)
+                if on_text(event.text):
+                    stopped_early = True
+                    break
+            usage = stream.current_message_snapshot.usage
+
+        content = "".join(chunks)
+        output_tokens = usage.output_tokens
+        if stopped_early:
+            output_tokens = max(output_tokens, estimate_output_tokens(content))
+        return LLMResponse(
+            content=content,
+            input_tokens=usage.input_tokens,
+            output_tokens=output_tokens,
             model=model,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
+            stopped_early=stopped_early,
         )
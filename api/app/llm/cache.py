@@ -0,0 +1,144 @@
+"""Content-addressed SQLite cache for repeatable LLM calls."""
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from typing import Callable
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from api.app import clock
+from api.app.config import get_settings
+from api.app.database import SessionLocal
+from api.app.llm.client import LLMClient, LLMResponse, StructuredPrompt
+from api.app.models.llm_cache import LLMCacheEntry
+
+
+logger = logging.getLogger(__name__)
+
+_stats = {"hits": 0, "misses": 0, "stores": 0, "expired": 0, "evicted": 0, "tokens_saved": 0}
+
+
+def cache_key(provider: str, model: str, temperature: float, max_tokens: int, prompt: str) -> str:
+    """sha256 of everything that determines the response."""
+    payload = json.dumps([provider, model, temperature, max_tokens, prompt], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _lookup(key: str, ttl_seconds: int) -> LLMResponse | None:
+    db = SessionLocal()
+    try:
+        entry = db.get(LLMCacheEntry, key)
+        if entry is None:
+            return None
+        now = clock.utcnow()
+        if entry.created_at < now - timedelta(seconds=ttl_seconds):
+            db.delete(entry)
+            db.commit()
+            _stats["expired"] += 1
+            return None
+
+        entry.hits += 1
+        entry.last_used_at = now
+        response = LLMResponse(
+            content=entry.content, input_tokens=0, output_tokens=0, model=entry.model, cached=True,
+        )
+        saved = entry.input_tokens + entry.output_tokens
+        db.commit()
+        _stats["tokens_saved"] += saved
+        return response
+    finally:
+        db.close()
+
+
+def _store(key: str, llm: LLMClient, response: LLMResponse, max_entries: int) -> None:
+    db = SessionLocal()
+    try:
+        now = clock.utcnow()
+        db.merge(LLMCacheEntry(
+            key=key,
+            provider=llm.provider,
+            model=response.model,
+            content=response.content,
+            input_tokens=response.total_input_tokens,
+            output_tokens=response.output_tokens,
+            hits=0,
+            created_at=now,
+            last_used_at=now,
+        ))
+        db.flush()
+
+        # Evict least recently used entries past the size bound
+        stale = (
+            select(LLMCacheEntry.key)
+            .order_by(LLMCacheEntry.last_used_at.desc())
+            .offset(max_entries)
+            .scalar_subquery()
+        )
+        evicted = db.execute(delete(LLMCacheEntry).where(LLMCacheEntry.key.in_(stale))).rowcount
+        db.commit()
+        _stats["stores"] += 1
+        _stats["evicted"] += evicted or 0
+    finally:
+        db.close()
+
+
+async def think_cached(
+    llm: LLMClient,
+    prompt: str | StructuredPrompt,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    accept: Callable[[str], bool] | None = None,
+) -> LLMResponse:
+    """``llm.think``, reusing the stored response for an identical earlier call.
+
+    For call sites whose prompts repeat and whose output needn't vary
+    (memory extraction, cold compression). A hit costs no tokens and comes
+    back with ``cached`` set and zero usage. Fresh responses are stored
+    unless ``accept`` rejects their content, so unusable output is retried
+    next time instead of being replayed. Cache errors fall back to the LLM.
+    """
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return await llm.think(prompt, model=model, temperature=temperature, max_tokens=max_tokens)
+
+    key = cache_key(llm.provider, model, temperature, max_tokens, str(prompt))
+    # Each cache access uses its own short session, so no SQLite write is
+    # held open while the LLM call is awaited
+    try:
+        cached = _lookup(key, settings.llm_cache_ttl_seconds)
+    except Exception as e:
+        logger.warning(f"LLM cache lookup failed: {e}")
+        cached = None
+    if cached is not None:
+        _stats["hits"] += 1
+        return cached
+
+    _stats["misses"] += 1
+    response = await llm.think(prompt, model=model, temperature=temperature, max_tokens=max_tokens)
+    if response.content and (accept is None or accept(response.content)):
+        try:
+            _store(key, llm, response, settings.llm_cache_max_entries)
+        except Exception as e:
+            logger.warning(f"LLM cache store failed: {e}")
+    return response
+
+
+def llm_cache_stats(db: Session) -> dict:
+    """Hit/miss counters since this process started, plus what is stored now."""
+    entries, stored_hits, tokens_saved = db.execute(select(
+        func.count(LLMCacheEntry.key),
+        func.coalesce(func.sum(LLMCacheEntry.hits), 0),
+        func.coalesce(func.sum(LLMCacheEntry.hits * (LLMCacheEntry.input_tokens + LLMCacheEntry.output_tokens)), 0),
+    )).one()
+    lookups = _stats["hits"] + _stats["misses"]
+    return {
+        "process": {**_stats, "hit_rate": round(_stats["hits"] / lookups, 4) if lookups else 0.0},
+        "entries": entries,
+        "max_entries": get_settings().llm_cache_max_entries,
+        "stored_hits": stored_hits,
+        "stored_tokens_saved": tokens_saved,
+    }
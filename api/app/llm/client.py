@@ -1,27 +1,104 @@
 """LLM client abstraction layer."""
 
+import asyncio
+import importlib.util
+import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Callable
+
+import httpx
 
 from api.app.config import get_settings
 
 
+logger = logging.getLogger(__name__)
+
+# Seconds an idle pooled connection is kept open for the next call
+LLM_KEEPALIVE_SECONDS = 60.0
+
+
+@dataclass
+class StructuredPrompt:
+    """A prompt split into stable prefix blocks and a volatile suffix.
+
+    Prefix blocks are ordered from most to least widely shared (e.g. text
+    identical for every bot, then text stable for one bot), so providers
+    that support prompt caching can cache each one.
+    """
+    prefix_blocks: list[str] = field(default_factory=list)
+    suffix: str = ""
+    # Sections cut to fit the input token budget, with estimated tokens dropped
+    truncated: dict[str, int] = field(default_factory=dict)
+    # Newest (thread id, reply id) the prompt's feed covers, to mark as read
+    # once the caller has acted on it
+    read_position: tuple[int, int] | None = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self.prefix_blocks) + self.suffix
+
+    def __str__(self) -> str:
+        return self.text
+
+
 @dataclass
 class LLMResponse:
     """Response from LLM call."""
     content: str
-    input_tokens: int
+    input_tokens: int  # Uncached input tokens
     output_tokens: int
     model: str
+    cache_read_tokens: int = 0  # Input tokens served from the provider's prompt cache
+    cache_write_tokens: int = 0  # Input tokens written to the provider's prompt cache
+    stopped_early: bool = False  # Streaming was cut off by the caller before the model finished
+    tool_calls: list[dict] = field(default_factory=list)  # [{"name", "input"}] when the model answered with tool calls
+    cached: bool = False  # Served from the local response cache; no tokens were spent
+    queued_ms: int = 0  # Time spent waiting on the provider's rate limiter before the call
+
+    @property
+    def total_input_tokens(self) -> int:
+        return self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+
+
+# Providers whose think_tools returns native tool calls; others get JSON-mode
+# text, so their prompts still need the full JSON format instructions
+NATIVE_TOOL_PROVIDERS = {"anthropic", "mock"}
+
+# Streaming callback: receives each chunk of generated text and returns True
+# once it has seen enough, which cancels the rest of the generation
+TextCallback = Callable[[str], bool]
+
+
+def estimate_output_tokens(text: str) -> int:
+    """Rough token count for text whose usage the provider never reported."""
+    return len(text) // 4
+
+
+def http2_enabled() -> bool:
+    """Whether LLM HTTP clients should speak HTTP/2 (needs the optional h2 package)."""
+    return get_settings().llm_http2 and importlib.util.find_spec("h2") is not None
+
+
+def http_limits() -> httpx.Limits:
+    """Connection pool limits for an LLM provider's HTTP client."""
+    max_connections = get_settings().llm_max_connections
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=LLM_KEEPALIVE_SECONDS,
+    )
 
 
 class LLMClient(ABC):
     """Abstract base class for LLM providers."""
 
+    provider = ""  # Provider name, as in the llm_provider setting
+
     @abstractmethod
     async def think(
         self,
-        prompt: str,
+        prompt: str | StructuredPrompt,
         model: str = "claude-sonnet-4-5-20250929",
         temperature: float = 0.8,
         max_tokens: int = 1000,
@@ -29,12 +106,57 @@ class LLMClient(ABC):
         """Send prompt to LLM and get response."""
         pass
 
+    async def think_stream(
+        self,
+        prompt: str | StructuredPrompt,
+        on_text: TextCallback,
+        model: str = "claude-sonnet-4-5-20250929",
+        temperature: float = 0.8,
+        max_tokens: int = 1000,
+    ) -> LLMResponse:
+        """Stream the response to on_text, stopping once it returns True.
 
-def get_llm_client() -> LLMClient:
-    """Factory function to get the configured LLM client."""
-    settings = get_settings()
-    provider = settings.llm_provider.lower()
+        The returned content is the text generated up to that point. Providers
+        without streaming support deliver the whole response as one chunk.
+        """
+        response = await self.think(prompt, model=model, temperature=temperature, max_tokens=max_tokens)
+        on_text(response.content)
+        return response
+
+    async def think_tools(
+        self,
+        prompt: str | StructuredPrompt,
+        tools: list[dict],
+        model: str = "claude-sonnet-4-5-20250929",
+        temperature: float = 0.8,
+        max_tokens: int = 1000,
+        max_calls: int = 1,
+    ) -> LLMResponse:
+        """Ask the model to answer by calling the given tools, at most max_calls times.
+
+        Tools use Anthropic's shape: ``{"name", "description", "input_schema"}``.
+        The calls come back in order in ``tool_calls``; providers without
+        tool use return plain text for the caller to parse.
+        """
+        return await self.think(prompt, model=model, temperature=temperature, max_tokens=max_tokens)
+
+    async def aclose(self) -> None:
+        """Close pooled connections; providers without any have nothing to do."""
+
+
+# Shared adapters by provider, with the event loop their connections belong to
+_clients: dict[str, tuple[asyncio.AbstractEventLoop | None, LLMClient]] = {}
 
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _create_llm_client(provider: str) -> LLMClient:
+    settings = get_settings()
     if provider == "anthropic":
         from api.app.llm.anthropic import AnthropicAdapter
         return AnthropicAdapter(api_key=settings.anthropic_api_key)
@@ -46,3 +168,47 @@ def get_llm_client() -> LLMClient:
         return OllamaAdapter(base_url=settings.ollama_base_url)
     else:
         raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+def get_llm_client(provider: str | None = None) -> LLMClient:
+    """The process-wide client for a provider (default: the configured one).
+
+    Adapters keep pooled keep-alive connections, so one instance per
+    provider is shared by every heartbeat, extraction and compression call.
+    Connections belong to an event loop; a client created under a different
+    loop (e.g. an earlier ``asyncio.run`` in a script) is replaced rather
+    than reused.
+    """
+    provider = (provider or get_settings().llm_provider).lower()
+    loop = _running_loop()
+    cached = _clients.get(provider)
+    if cached is not None and cached[0] is loop:
+        return cached[1]
+
+    client = _create_llm_client(provider)
+    _clients[provider] = (loop, client)
+    return client
+
+
+async def start_llm_clients() -> None:
+    """Create the shared LLM client at startup, so config errors show up early."""
+    try:
+        client = get_llm_client()
+    except Exception as e:
+        logger.warning(f"LLM client not ready: {e}")
+        return
+    logger.info(f"LLM client ready: {type(client).__name__} (http2={http2_enabled()})")
+
+
+async def close_llm_clients() -> None:
+    """Close every shared LLM client's connections; called on shutdown."""
+    loop = _running_loop()
+    clients = list(_clients.values())
+    _clients.clear()
+    for client_loop, client in clients:
+        if client_loop is not loop:
+            continue  # Its loop is gone, and its connections with it
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close {type(client).__name__}: {e}")
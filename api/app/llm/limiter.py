@@ -0,0 +1,321 @@
+"""Per-provider rate limiting, adaptive concurrency and call priorities."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from datetime import datetime, timezone
+
+from api.app.config import get_settings
+from api.app.database import SessionLocal
+from api.app.llm.client import LLMClient, LLMResponse, StructuredPrompt, TextCallback, estimate_output_tokens
+from api.app.orchestrator.scheduler_state import get_scheduler_state, set_scheduler_state
+
+
+logger = logging.getLogger(__name__)
+
+# Lower runs first when calls queue for the same provider
+TASK_PRIORITY = {"heartbeat": 0, "extraction": 1, "compression": 2}
+
+# A call this many times slower than the running average counts as congestion
+LATENCY_SPIKE_FACTOR = 3.0
+# ... once the average has this many samples, and only past this many seconds
+LATENCY_MIN_SAMPLES = 5
+LATENCY_SPIKE_MIN_SECONDS = 2.0
+# Weight of each new latency sample in the running average
+LATENCY_EWMA_ALPHA = 0.2
+
+
+def _status_code(error: Exception) -> int | None:
+    """HTTP status of a provider error (Anthropic SDK or httpx), if it has one."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+class TokenBucket:
+    """``capacity`` units per minute, refilled continuously (0 = unlimited)."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self._rate = per_minute / 60
+        self._updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` is available (capped at a full bucket)."""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self._rate)
+
+    def take(self, amount: float) -> None:
+        if not self.unlimited:
+            self._refill()
+            self.level -= amount  # May go negative for calls larger than the bucket
+
+    def give(self, amount: float) -> None:
+        if not self.unlimited:
+            self.level = min(self.capacity, self.level + amount)
+
+    def drain(self) -> None:
+        if not self.unlimited:
+            self.level = min(self.level, 0.0)
+
+
+class ProviderLimiter:
+    """Admit calls to one provider within RPM/TPM budgets and a concurrency window.
+
+    Waiting calls are admitted strictly in priority order (then arrival
+    order). The concurrency window grows by one call per window's worth of
+    successes and halves on a 429, a 5xx or a latency spike (AIMD), so a
+    provider that starts struggling gets fewer parallel calls. A 429 also
+    empties the request bucket, pausing new calls until it refills.
+    """
+
+    def __init__(self, provider: str, rpm: int, tpm: int, max_concurrency: int):
+        self.provider = provider
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.max_concurrency = max_concurrency  # 0 = unbounded
+        self.window = float(max_concurrency)
+        self.in_flight = 0
+        self._waiting: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._cond = asyncio.Condition()
+        self._latency_avg = 0.0
+        self._latency_samples = 0
+        self._last_decrease = 0.0
+        self.stats = {
+            "admitted": 0, "throttled": 0, "server_errors": 0,
+            "latency_spikes": 0, "backoffs": 0, "wait_ms_total": 0,
+        }
+
+    @property
+    def unlimited(self) -> bool:
+        return self.requests.unlimited and self.tokens.unlimited and self.max_concurrency <= 0
+
+    def _admit_delay(self, entry: tuple[int, int], tokens: int) -> float:
+        """0 if the call may start now, else how long to wait (inf: until notified)."""
+        if self._waiting[0] != entry:
+            return math.inf
+        if self.max_concurrency > 0 and self.in_flight >= int(self.window):
+            return math.inf
+        return max(self.requests.wait_time(1), self.tokens.wait_time(tokens))
+
+    async def acquire(self, priority: int, tokens: int) -> float:
+        """Wait for a slot; returns the seconds spent queued."""
+        started = time.monotonic()
+        entry = (priority, next(self._seq))
+        async with self._cond:
+            heapq.heappush(self._waiting, entry)
+            try:
+                while (delay := self._admit_delay(entry, tokens)) > 0:
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), None if delay == math.inf else delay)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self.in_flight += 1
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            self._cond.notify_all()  # The next in line may fit too
+
+        waited = time.monotonic() - started
+        self.stats["admitted"] += 1
+        self.stats["wait_ms_total"] += round(waited * 1000)
+        return waited
+
+    async def release(self, started: float, estimated: int, actual: int | None, status: int | None) -> None:
+        """Finish a call: settle its token estimate and adapt the window."""
+        latency = time.monotonic() - started
+        async with self._cond:
+            self.in_flight -= 1
+            if actual is not None:
+                self.tokens.give(estimated - actual)
+
+            congested = False
+            if status == 429:
+                self.stats["throttled"] += 1
+                self.requests.drain()
+                congested = True
+            elif status is not None and status >= 500:
+                self.stats["server_errors"] += 1
+                congested = True
+            elif status is None and actual is not None:
+                congested = self._observe_latency(latency)
+
+            if self.max_concurrency > 0:
+                if congested:
+                    self._decrease(started)
+                else:
+                    self.window = min(self.max_concurrency, self.window + 1 / max(1.0, self.window))
+            self._cond.notify_all()
+
+    def _observe_latency(self, latency: float) -> bool:
+        spike = (
+            self._latency_samples >= LATENCY_MIN_SAMPLES
+            and latency > LATENCY_SPIKE_MIN_SECONDS
+            and latency > self._latency_avg * LATENCY_SPIKE_FACTOR
+        )
+        if spike:
+            self.stats["latency_spikes"] += 1
+            return True
+        if self._latency_samples == 0:
+            self._latency_avg = latency
+        else:
+            self._latency_avg += LATENCY_EWMA_ALPHA * (latency - self._latency_avg)
+        self._latency_samples += 1
+        return False
+
+    def _decrease(self, call_started: float) -> None:
+        # Calls already in flight at the last backoff saw the same congestion;
+        # halve once per episode rather than once per failed call
+        if call_started < self._last_decrease:
+            return
+        self.window = max(1.0, self.window / 2)
+        self._last_decrease = time.monotonic()
+        self.stats["backoffs"] += 1
+        logger.warning(f"LLM limiter for {self.provider} backing off to {int(self.window)} concurrent call(s)")
+
+    def snapshot(self) -> dict:
+        admitted = self.stats["admitted"]
+        return {
+            "window": int(self.window) if self.max_concurrency > 0 else None,
+            "max_concurrency": self.max_concurrency or None,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiting),
+            "requests_available": None if self.requests.unlimited else round(self.requests.level, 1),
+            "tokens_available": None if self.tokens.unlimited else round(self.tokens.level),
+            "avg_latency_ms": round(self._latency_avg * 1000),
+            "avg_wait_ms": round(self.stats["wait_ms_total"] / admitted) if admitted else 0,
+            **self.stats,
+        }
+
+
+# Limiters by provider, with the event loop their condition belongs to
+_limiters: dict[str, tuple[asyncio.AbstractEventLoop | None, ProviderLimiter]] = {}
+
+
+def _provider_limits(provider: str) -> tuple[int, int, int]:
+    """(rpm, tpm, max concurrency) for a provider; 0 means no limit."""
+    settings = get_settings()
+    if provider == "anthropic":
+        return settings.anthropic_rpm, settings.anthropic_tpm, settings.anthropic_max_concurrency
+    if provider == "ollama":
+        return 0, 0, settings.ollama_max_concurrency
+    return 0, 0, 0
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    """The shared limiter for a provider in the running event loop.
+
+    Limiters are per process. That covers every LLM call because heartbeats,
+    manual triggers included, and the memory work they publish all run in
+    the process that owns the scheduler.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    cached = _limiters.get(provider)
+    if cached is not None and cached[0] is loop:
+        return cached[1]
+    limiter = ProviderLimiter(provider, *_provider_limits(provider))
+    _limiters[provider] = (loop, limiter)
+    return limiter
+
+
+def limiter_stats() -> dict:
+    """Window, queue and congestion counters per provider since this process started."""
+    return {provider: limiter.snapshot() for provider, (_, limiter) in _limiters.items()}
+
+
+def persist_limiter_stats() -> None:
+    """Store this process's limiter state for processes that don't make LLM calls."""
+    db = SessionLocal()
+    try:
+        set_scheduler_state(db, "llm_limits", {
+            "providers": limiter_stats(),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        })
+    finally:
+        db.close()
+
+
+def get_persisted_limiter_stats() -> dict | None:
+    """Limiter state last stored by the scheduler owner, if any."""
+    db = SessionLocal()
+    try:
+        return get_scheduler_state(db, "llm_limits")
+    finally:
+        db.close()
+
+
+class RateLimitedClient(LLMClient):
+    """An LLM client whose calls go through its provider's limiter at a task's priority."""
+
+    def __init__(self, inner: LLMClient, task: str):
+        self.inner = inner
+        self.provider = inner.provider
+        self.priority = TASK_PRIORITY.get(task, len(TASK_PRIORITY))
+
+    async def _limited(self, prompt: str | StructuredPrompt, max_tokens: int, call) -> LLMResponse:
+        limiter = get_limiter(self.provider)
+        if not get_settings().llm_limiter_enabled or limiter.unlimited:
+            return await call()
+
+        # Prompt plus worst-case output; settled against real usage afterwards
+        estimated = estimate_output_tokens(str(prompt)) + max_tokens
+        waited = await limiter.acquire(self.priority, estimated)
+        started = time.monotonic()
+        actual = None
+        status = None
+        try:
+            response = await call()
+            # Prompt-cache reads don't count towards Anthropic's input rate limits
+            actual = response.input_tokens + response.cache_write_tokens + response.output_tokens
+            response.queued_ms = round(waited * 1000)
+            return response
+        except Exception as e:
+            status = _status_code(e)
+            raise
+        finally:
+            await limiter.release(started, estimated, actual, status)
+
+    async def think(self, prompt, model="claude-sonnet-4-5-20250929", temperature=0.8, max_tokens=1000):
+        return await self._limited(prompt, max_tokens, lambda: self.inner.think(
+            prompt, model=model, temperature=temperature, max_tokens=max_tokens,
+        ))
+
+    async def think_stream(
+        self, prompt, on_text: TextCallback, model="claude-sonnet-4-5-20250929", temperature=0.8, max_tokens=1000,
+    ):
+        return await self._limited(prompt, max_tokens, lambda: self.inner.think_stream(
+            prompt, on_text, model=model, temperature=temperature, max_tokens=max_tokens,
+        ))
+
+    async def think_tools(
+        self, prompt, tools, model="claude-sonnet-4-5-20250929", temperature=0.8, max_tokens=1000, max_calls=1,
+    ):
+        return await self._limited(prompt, max_tokens, lambda: self.inner.think_tools(
+            prompt, tools, model=model, temperature=temperature, max_tokens=max_tokens, max_calls=max_calls,
+        ))
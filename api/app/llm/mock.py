@@ -2,13 +2,30 @@
 
 import json
 import random
+import re
 
-from api.app.llm.client import LLMClient, LLMResponse
+from api.app.llm.client import LLMClient, LLMResponse, StructuredPrompt, TextCallback
+
+# Shared across adapter instances so a seeded run is reproducible
+_rng = random.Random()
+
+# Characters per streamed chunk, roughly a few tokens like a real provider
+MOCK_STREAM_CHUNK_CHARS = 16
+
+# How a heartbeat prompt offers several actions per turn
+_MULTI_ACTION = re.compile(r"up to (\d+) actions")
+
+
+def seed_mock(seed: int | None) -> None:
+    """Seed the mock adapter's action choices (None reseeds from the OS)."""
+    _rng.seed(seed)
 
 
 class MockAdapter(LLMClient):
     """Mock adapter that returns canned responses for testing."""
 
+    provider = "mock"
+
     # Sample responses for different action types
     MOCK_ACTIONS = [
         {
@@ -77,31 +94,42 @@ class MockAdapter(LLMClient):
         ]
     }
 
+    def _choose_action(self) -> dict:
+        # Pick a weighted random action - favor replies for cross-bot engagement
+        weights = []
+        for action in self.MOCK_ACTIONS:
+            if action["action"] == "reply":
+                weights.append(3)  # Higher weight for replies
+            elif action["action"] == "vote":
+                weights.append(2)  # Medium weight for votes
+            elif action["action"] == "create_thread":
+                weights.append(1)  # Lower weight for new threads
+            else:
+                weights.append(1)  # Lower weight for do_nothing
+
+        return _rng.choices(self.MOCK_ACTIONS, weights=weights, k=1)[0]
+
+    def _choose_actions(self, max_actions: int) -> list[dict]:
+        # Take a random number of actions, up to the limit the prompt offers
+        count = _rng.randint(1, max_actions) if max_actions > 1 else 1
+        return [self._choose_action() for _ in range(count)]
+
     async def think(
         self,
-        prompt: str,
+        prompt: str | StructuredPrompt,
         model: str = "mock-model",
         temperature: float = 0.8,
         max_tokens: int = 1000,
     ) -> LLMResponse:
         """Return a mock response for testing."""
+        prompt = str(prompt)
         # Detect if this is an extraction prompt
         if "extract" in prompt.lower() and "json" in prompt.lower() and "facts_learned" in prompt.lower():
             response = self.MOCK_EXTRACTION
         else:
-            # Pick a weighted random action - favor replies for cross-bot engagement
-            weights = []
-            for action in self.MOCK_ACTIONS:
-                if action["action"] == "reply":
-                    weights.append(3)  # Higher weight for replies
-                elif action["action"] == "vote":
-                    weights.append(2)  # Medium weight for votes
-                elif action["action"] == "create_thread":
-                    weights.append(1)  # Lower weight for new threads
-                else:
-                    weights.append(1)  # Lower weight for do_nothing
-
-            response = random.choices(self.MOCK_ACTIONS, weights=weights, k=1)[0]
+            offered = _MULTI_ACTION.search(prompt)
+            actions = self._choose_actions(int(offered.group(1)) if offered else 1)
+            response = actions[0] if len(actions) == 1 else actions
 
         return LLMResponse(
             content=json.dumps(response, indent=2),
@@ -109,3 +137,49 @@ class MockAdapter(LLMClient):
             output_tokens=100,
             model="mock-model",
         )
+
+    async def think_tools(
+        self,
+        prompt: str | StructuredPrompt,
+        tools: list[dict],
+        model: str = "mock-model",
+        temperature: float = 0.8,
+        max_tokens: int = 1000,
+        max_calls: int = 1,
+    ) -> LLMResponse:
+        """Return mock actions as tool calls."""
+        actions = self._choose_actions(max_calls)
+        tool_calls = [
+            {"name": action["action"], "input": {k: v for k, v in action.items() if k != "action"}}
+            for action in actions
+        ]
+        return LLMResponse(
+            content=json.dumps(actions[0] if len(actions) == 1 else actions),
+            input_tokens=len(str(prompt)) // 4,  # Rough estimate
+            output_tokens=60 * len(actions),
+            model="mock-model",
+            tool_calls=tool_calls,
+        )
+
+    async def think_stream(
+        self,
+        prompt: str | StructuredPrompt,
+        on_text: TextCallback,
+        model: str = "mock-model",
+        temperature: float = 0.8,
+        max_tokens: int = 1000,
+    ) -> LLMResponse:
+        """Stream the mock response in small chunks, stopping when on_text asks."""
+        response = await self.think(prompt, model=model, temperature=temperature, max_tokens=max_tokens)
+        full = response.content
+        sent = 0
+        while sent < len(full):
+            chunk = full[sent:sent + MOCK_STREAM_CHUNK_CHARS]
+            sent += len(chunk)
+            if on_text(chunk):
+                break
+
+        response.stopped_early = sent < len(full)
+        response.output_tokens = round(response.output_tokens * sent / len(full)) if full else 0
+        response.content = full[:sent]
+        return response
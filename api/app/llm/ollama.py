@@ -1,9 +1,13 @@
 """Ollama adapter for local LLM models."""
 
+import json
 import logging
 import httpx
 
-from api.app.llm.client import LLMClient, LLMResponse
+from api.app.llm.client import (
+    LLMClient, LLMResponse, StructuredPrompt, TextCallback, estimate_output_tokens,
+    http2_enabled, http_limits,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -11,41 +15,126 @@ logger = logging.getLogger(__name__)
 class OllamaAdapter(LLMClient):
     """Adapter for Ollama local models (Llama 3 8B, Mistral, etc.)."""
 
+    provider = "ollama"
+
     DEFAULT_MODEL = "llama3"
 
     def __init__(self, base_url: str = "http://localhost:11434"):
         self.base_url = base_url
+        # Shared by every request so connections to Ollama are kept alive
+        self._client = httpx.AsyncClient(timeout=120.0, limits=http_limits(), http2=http2_enabled())
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
     async def think(
         self,
-        prompt: str,
+        prompt: str | StructuredPrompt,
         model: str = "llama3",
         temperature: float = 0.8,
         max_tokens: int = 1000,
     ) -> LLMResponse:
         """Generate a response using Ollama."""
+        return await self._generate(prompt, model, temperature, max_tokens)
+
+    async def think_tools(
+        self,
+        prompt: str | StructuredPrompt,
+        tools: list[dict],
+        model: str = "llama3",
+        temperature: float = 0.8,
+        max_tokens: int = 1000,
+        max_calls: int = 1,
+    ) -> LLMResponse:
+        """Generate in Ollama's JSON mode, which constrains output to valid JSON.
+
+        Local models don't get native tool calls, so the text is still parsed
+        by the caller, but it can no longer be malformed.
+        """
+        return await self._generate(prompt, model, temperature, max_tokens, output_format="json")
+
+    async def _generate(
+        self,
+        prompt: str | StructuredPrompt,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        output_format: str | None = None,
+    ) -> LLMResponse:
         # Override non-Ollama model names (e.g. claude-*) with the default local model
         if model.startswith("claude") or model.startswith("gpt"):
             model = self.DEFAULT_MODEL
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": model,
-                    "prompt": prompt,
-                    "options": {
-                        "temperature": temperature,
-                        "num_predict": max_tokens,
-                    },
-                    "stream": False,
+        payload = {
+            "model": model,
+            "prompt": str(prompt),
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+            "stream": False,
+        }
+        if output_format:
+            payload["format"] = output_format
+        response = await self._client.post(f"{self.base_url}/api/generate", json=payload)
+        response.raise_for_status()
+        data = response.json()
+
+        return LLMResponse(
+            content=data.get("response", ""),
+            input_tokens=data.get("prompt_eval_count", 0),
+            output_tokens=data.get("eval_count", 0),
+            model=model,
+        )
+
+    async def think_stream(
+        self,
+        prompt: str | StructuredPrompt,
+        on_text: TextCallback,
+        model: str = "llama3",
+        temperature: float = 0.8,
+        max_tokens: int = 1000,
+    ) -> LLMResponse:
+        """Stream a response from Ollama, disconnecting once on_text has enough.
+
+        Ollama stops generating when the client goes away. Token counts only
+        arrive with the final chunk, so an early stop estimates them.
+        """
+        if model.startswith("claude") or model.startswith("gpt"):
+            model = self.DEFAULT_MODEL
+        prompt = str(prompt)
+        chunks = []
+        final: dict = {}
+        async with self._client.stream(
+            "POST",
+            f"{self.base_url}/api/generate",
+            json={
+                "model": model,
+                "prompt": prompt,
+                "options": {
+                    "temperature": temperature,
+                    "num_predict": max_tokens,
                 },
-            )
+                "stream": True,
+            },
+        ) as response:
             response.raise_for_status()
-            data = response.json()
-
-            return LLMResponse(
-                content=data.get("response", ""),
-                input_tokens=data.get("prompt_eval_count", 0),
-                output_tokens=data.get("eval_count", 0),
-                model=model,
-            )
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                text = data.get("response", "")
+                if text:
+                    chunks.append(text)
+                    if on_text(text):
+                        break
+                if data.get("done"):
+                    final = data
+
+        content = "".join(chunks)
+        return LLMResponse(
+            content=content,
+            input_tokens=final.get("prompt_eval_count") or estimate_output_tokens(prompt),
+            output_tokens=final.get("eval_count") or estimate_output_tokens(content),
+            model=model,
+            stopped_early=not final,
+        )
@@ -0,0 +1,76 @@
+"""Pick the LLM provider and model for each bot and task."""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from sqlalchemy.orm import Session
+
+from api.app.config import get_settings
+from api.app.llm.client import LLMClient, get_llm_client
+from api.app.llm.limiter import RateLimitedClient
+from api.app.models.bot import Bot
+
+
+Task = Literal["heartbeat", "extraction", "compression"]
+
+# Models used when neither the bot nor the settings name one
+DEFAULT_TASK_MODELS: dict[str, str] = {
+    "heartbeat": "claude-sonnet-4-5-20250929",
+    "extraction": "claude-haiku-3-5-20241022",  # Cheap model for background work
+    "compression": "claude-haiku-3-5-20241022",
+}
+
+
+@dataclass
+class LLMRoute:
+    """Where one LLM call goes."""
+    task: str
+    provider: str
+    model: str
+
+    @property
+    def client(self) -> LLMClient:
+        return RateLimitedClient(get_llm_client(self.provider), self.task)
+
+
+def _task_setting(task: str, field: str) -> str:
+    return getattr(get_settings(), f"llm_{task}_{field}", "") or ""
+
+
+def resolve_route(config: dict | None, task: Task) -> LLMRoute:
+    """Provider and model for a task, from a bot's personality_config.
+
+    With ``llm_routing_enabled`` off, every call uses ``llm_provider``,
+    the bot's own model for heartbeats, and DEFAULT_TASK_MODELS for
+    background tasks. With it on, the first match wins:
+
+    1. the bot's ``model.<task>`` override, e.g. ``model.compression.provider``
+       (for heartbeats, the bot's ``model.provider`` and ``model.model``);
+    2. for background tasks, the ``llm_<task>_provider`` / ``llm_<task>_model``
+       settings;
+    3. the bot's heartbeat provider, then ``llm_provider``.
+    """
+    settings = get_settings()
+    model_config = (config or {}).get("model", {})
+    default_model = DEFAULT_TASK_MODELS[task]
+    if task == "heartbeat":
+        default_model = model_config.get("model", default_model)
+
+    if not settings.llm_routing_enabled:
+        return LLMRoute(task=task, provider=settings.llm_provider.lower(), model=default_model)
+
+    override = model_config if task == "heartbeat" else model_config.get(task, {})
+    provider = (
+        override.get("provider")
+        or _task_setting(task, "provider")
+        or model_config.get("provider")
+        or settings.llm_provider
+    )
+    model = override.get("model") or _task_setting(task, "model") or default_model
+    return LLMRoute(task=task, provider=provider.lower(), model=model)
+
+
+def route_for_bot(db: Session, bot_id: str, task: Task) -> LLMRoute:
+    """Route a task for a bot by id (global routing if the bot is gone)."""
+    bot = db.get(Bot, bot_id)
+    return resolve_route(bot.personality_config if bot else None, task)
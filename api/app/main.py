@@ -1,5 +1,6 @@
 """Botastrophic API - Main FastAPI application."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -8,8 +9,11 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from api.app.config import get_settings
 from api.app.database import create_tables, SessionLocal
+from api.app.llm import close_llm_clients, start_llm_clients
 from api.app.routes import threads, bots, votes, pace, follows, activity, stats, ws, config, moderation, export, public
-from api.app.orchestrator.scheduler import start_scheduler, stop_scheduler, trigger_heartbeat
+from api.app.orchestrator.scheduler import request_heartbeat
+from api.app.orchestrator.worker import run_scheduler_with_lease
+from api.app.orchestrator.post_processing import event_bus
 from api.app.bot_loader import sync_bots_to_db
 from api.app.seed_loader import load_seeds
 
@@ -43,10 +47,29 @@ async def lifespan(app: FastAPI):
     finally:
         db.close()
 
-    start_scheduler()
+    # Shared LLM client with pooled keep-alive connections
+    await start_llm_clients()
+
+    # Heartbeat post-processing consumers (also serves manual triggers)
+    await event_bus.start()
+
+    # Every API process relays new activity to its own WebSocket clients,
+    # whichever process (scheduler owner or not) ran the heartbeat
+    stop_event = asyncio.Event()
+    background_tasks = [asyncio.create_task(ws.relay_activity_logs(stop_event))]
+
+    # Run the scheduler in-process unless a standalone worker owns it
+    if settings.embedded_scheduler:
+        background_tasks.append(asyncio.create_task(run_scheduler_with_lease(stop_event)))
+    else:
+        logger.info("Embedded scheduler disabled; heartbeats run in the standalone worker")
+
     yield
     # Shutdown
-    stop_scheduler()
+    stop_event.set()
+    await asyncio.gather(*background_tasks)
+    await event_bus.stop()
+    await close_llm_clients()
     logger.info("Botastrophic API shutdown complete")
 
 
@@ -97,7 +120,7 @@ def health_check():
 @app.post("/api/heartbeat/{bot_id}", tags=["orchestrator"])
 async def manual_heartbeat(bot_id: str):
     """Manually trigger a heartbeat for a specific bot. The bot will choose and execute an action."""
-    result = await trigger_heartbeat(bot_id)
+    result = await request_heartbeat(bot_id)
     return result
 
 
@@ -5,9 +5,12 @@ import logging
 from datetime import date, timedelta
 from sqlalchemy.orm import Session
 
+from api.app import clock
 from api.app.models.cold_memory import ColdMemory
 from api.app.memory.warm import get_warm_memory
-from api.app.llm import get_llm_client
+from api.app.llm.cache import think_cached
+from api.app.llm.router import route_for_bot
+from api.app.usage import record_llm_usage
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +40,7 @@ def _is_old(item: dict, cutoff_days: int) -> bool:
     if not item_date:
         return False
     try:
-        cutoff = date.today() - timedelta(days=cutoff_days)
+        cutoff = clock.today() - timedelta(days=cutoff_days)
         return date.fromisoformat(item_date) < cutoff
     except (ValueError, TypeError):
         return False
@@ -51,7 +54,7 @@ def _get_oldest_date(items: list[dict]) -> date:
             dates.append(date.fromisoformat(item.get("date", "")))
         except (ValueError, TypeError):
             continue
-    return min(dates) if dates else date.today()
+    return min(dates) if dates else clock.today()
 
 
 async def maybe_compress_to_cold(db: Session, bot_id: str):
@@ -97,15 +100,19 @@ async def compress_to_cold(db: Session, bot_id: str, cutoff_days: int = CUTOFF_D
         relationships=relationships_text,
     )
 
-    # Summarize with Haiku
-    llm = get_llm_client()
+    # Summarize with Haiku (or wherever compression is routed); a retry of
+    # the same compression reuses the cached summary
+    route = route_for_bot(db, bot_id, "compression")
     try:
-        response = await llm.think(
+        response = await think_cached(
+            route.client,
             prompt=prompt,
-            model="claude-haiku-3-5-20241022",
+            model=route.model,
             temperature=0.3,
             max_tokens=600,
         )
+        # Committed with the cold summary below
+        record_llm_usage(db, bot_id, response, route.provider, commit=False)
         summary = response.content.strip()
     except Exception as e:
         logger.warning(f"Cold compression LLM failed for {bot_id}: {e}")
@@ -118,7 +125,7 @@ async def compress_to_cold(db: Session, bot_id: str, cutoff_days: int = CUTOFF_D
     cold = ColdMemory(
         bot_id=bot_id,
         period_start=_get_oldest_date(old_facts + old_memories),
-        period_end=date.today(),
+        period_end=clock.today(),
         summary=summary,
         key_relationships=[
             {"bot": r.get("bot"), "sentiment": r.get("sentiment")}
@@ -4,8 +4,11 @@ import json
 import logging
 from sqlalchemy.orm import Session
 
-from api.app.llm import get_llm_client
+from api.app import clock
+from api.app.llm.cache import think_cached
+from api.app.llm.router import route_for_bot
 from api.app.memory.warm import update_warm_memory
+from api.app.usage import record_llm_usage
 
 
 logger = logging.getLogger(__name__)
@@ -47,9 +50,7 @@ async def extract_memories(
     action_details: dict,
 ) -> dict:
     """Extract memories from a bot's activity using a cheap model."""
-    from datetime import datetime
-
-    date_str = datetime.utcnow().strftime("%Y-%m-%d")
+    date_str = clock.utcnow().strftime("%Y-%m-%d")
 
     prompt = EXTRACTION_PROMPT.format(
         bot_name=bot_name,
@@ -58,26 +59,22 @@ async def extract_memories(
         date=date_str,
     )
 
-    llm = get_llm_client()
+    # A cheap model by default (Haiku), or wherever extraction is routed
+    route = route_for_bot(db, bot_id, "extraction")
 
     try:
-        # Use lower temperature for extraction
-        response = await llm.think(
+        # Use lower temperature for extraction; identical prompts (e.g. the
+        # same vote twice) reuse the cached response
+        response = await think_cached(
+            route.client,
             prompt=prompt,
-            model="claude-haiku-3-5-20241022",  # Use Haiku for cheap extraction
+            model=route.model,
             temperature=0.3,
             max_tokens=500,
+            accept=_is_extraction_json,
         )
-
-        # Parse JSON response
-        content = response.content.strip()
-        # Find JSON in response
-        start = content.find("{")
-        end = content.rfind("}") + 1
-        if start >= 0 and end > start:
-            extracted = json.loads(content[start:end])
-        else:
-            extracted = {}
+        record_llm_usage(db, bot_id, response, route.provider)
+        extracted = _parse_extraction(response.content)
 
     except Exception as e:
         logger.warning(f"Memory extraction failed for {bot_id}: {e}")
@@ -100,6 +97,25 @@ async def extract_memories(
     return extracted
 
 
+def _parse_extraction(content: str) -> dict:
+    """The JSON object in an extraction response ({} if there is none)."""
+    content = content.strip()
+    # Find JSON in response
+    start = content.find("{")
+    end = content.rfind("}") + 1
+    if start >= 0 and end > start:
+        return json.loads(content[start:end])
+    return {}
+
+
+def _is_extraction_json(content: str) -> bool:
+    """Whether a response is worth caching: it holds a parseable JSON object."""
+    try:
+        return bool(_parse_extraction(content))
+    except ValueError:
+        return False
+
+
 def _fallback_extraction(action_type: str, action_details: dict, date_str: str) -> dict:
     """Fallback extraction when LLM fails."""
     extracted = {
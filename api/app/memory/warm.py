@@ -1,9 +1,10 @@
 """Warm memory CRUD operations."""
 
 import logging
-from datetime import datetime
 from sqlalchemy.orm import Session
 
+from api.app import clock
+
 from api.app.models.warm_memory import WarmMemory
 
 
@@ -15,8 +16,11 @@ def get_warm_memory(db: Session, bot_id: str) -> WarmMemory | None:
     return db.query(WarmMemory).filter(WarmMemory.bot_id == bot_id).first()
 
 
-def get_or_create_warm_memory(db: Session, bot_id: str) -> WarmMemory:
-    """Get or create warm memory for a bot."""
+def get_or_create_warm_memory(db: Session, bot_id: str, commit: bool = True) -> WarmMemory:
+    """Get or create warm memory for a bot.
+
+    With ``commit=False`` a new row is only flushed into the caller's transaction.
+    """
     memory = get_warm_memory(db, bot_id)
     if memory is None:
         memory = WarmMemory(
@@ -28,8 +32,11 @@ def get_or_create_warm_memory(db: Session, bot_id: str) -> WarmMemory:
             memories=[],
         )
         db.add(memory)
-        db.commit()
-        db.refresh(memory)
+        if commit:
+            db.commit()
+            db.refresh(memory)
+        else:
+            db.flush()
         logger.info(f"Created warm memory for bot {bot_id}")
     return memory
 
@@ -104,7 +111,7 @@ def update_warm_memory(
         # Keep only last 30 memories
         memory.memories = memory.memories[-30:]
 
-    memory.updated_at = datetime.utcnow()
+    memory.updated_at = clock.utcnow()
     db.commit()
     db.refresh(memory)
 
@@ -112,12 +119,19 @@ def update_warm_memory(
     return memory
 
 
-def record_interaction(db: Session, bot_id: str, other_bot_id: str, event: str | None = None):
-    """Record an interaction between two bots, incrementing count and optionally adding history."""
-    from datetime import datetime as dt
+def record_interaction(
+    db: Session, bot_id: str, other_bot_id: str, event: str | None = None, commit: bool = True,
+):
+    """Record an interaction between two bots, incrementing count and optionally adding history.
 
-    memory = get_or_create_warm_memory(db, bot_id)
-    date_str = dt.utcnow().strftime("%Y-%m-%d")
+    With ``commit=False`` the update is only flushed into the caller's transaction.
+    """
+    memory = get_or_create_warm_memory(db, bot_id, commit=commit)
+    # The session may hold a copy loaded before an await (a heartbeat loads
+    # warm memory for its prompt, then waits on the LLM); reload it so memory
+    # extractions committed in between aren't overwritten
+    db.refresh(memory)
+    date_str = clock.utcnow().strftime("%Y-%m-%d")
 
     existing_by_bot = {r.get("bot"): r for r in memory.relationships}
     if other_bot_id in existing_by_bot:
@@ -140,8 +154,11 @@ def record_interaction(db: Session, bot_id: str, other_bot_id: str, event: str |
         existing_by_bot[other_bot_id] = rel
 
     memory.relationships = list(existing_by_bot.values())
-    memory.updated_at = dt.utcnow()
-    db.commit()
+    memory.updated_at = clock.utcnow()
+    if commit:
+        db.commit()
+    else:
+        db.flush()
 
 
 def format_warm_memory_for_prompt(memory: WarmMemory | None) -> str:
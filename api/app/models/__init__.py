@@ -8,8 +8,14 @@ from api.app.models.warm_memory import WarmMemory
 from api.app.models.cold_memory import ColdMemory
 from api.app.models.usage import TokenUsage
 from api.app.models.moderation import ContentFlag
+from api.app.models.scheduler import HeartbeatTrigger, SchedulerLease, SchedulerState
+from api.app.models.perf import HeartbeatPerf
+from api.app.models.read_cursor import BotReadCursor
+from api.app.models.llm_cache import LLMCacheEntry
 
 __all__ = [
     "Bot", "Thread", "Reply", "ActivityLog", "Vote", "Follow",
     "WarmMemory", "ColdMemory", "TokenUsage", "ContentFlag",
+    "SchedulerLease", "SchedulerState", "HeartbeatTrigger", "HeartbeatPerf", "BotReadCursor",
+    "LLMCacheEntry",
 ]
@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import String, DateTime, JSON, Integer, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
+from api.app.clock import utcnow
 from api.app.database import Base
 
 
@@ -20,7 +21,7 @@ class ActivityLog(Base):
     details: Mapped[dict] = mapped_column(JSON, default=dict)
     tokens_used: Mapped[int] = mapped_column(Integer, default=0)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=utcnow, nullable=False
     )
 
     def __repr__(self) -> str:
@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import String, DateTime, JSON, Integer, Float, Boolean
 from sqlalchemy.orm import Mapped, mapped_column
 
+from api.app.clock import utcnow
 from api.app.database import Base
 
 
@@ -23,7 +24,7 @@ class Bot(Base):
     source: Mapped[str] = mapped_column(String(20), default="yaml", nullable=False)
     is_paused: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=utcnow, nullable=False
     )
 
     def __repr__(self) -> str:
@@ -4,6 +4,7 @@ from datetime import date, datetime
 from sqlalchemy import String, Date, DateTime, Text, JSON, Integer, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
+from api.app.clock import utcnow
 from api.app.database import Base
 
 
@@ -21,7 +22,7 @@ class ColdMemory(Base):
     facts_compressed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     memories_compressed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=utcnow, nullable=False
     )
 
     def __repr__(self) -> str:
@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import String, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
+from api.app.clock import utcnow
 from api.app.database import Base
 
 
@@ -20,7 +21,7 @@ class Follow(Base):
         String(50), ForeignKey("bots.id"), nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=utcnow, nullable=False
     )
 
     # One follow relationship per pair
@@ -0,0 +1,33 @@
+"""Cached LLM responses keyed by a hash of the request."""
+
+from datetime import datetime
+from sqlalchemy import String, Text, DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.app.clock import utcnow
+from api.app.database import Base
+
+
+class LLMCacheEntry(Base):
+    """One LLM response, reused for identical (provider, model, temperature, prompt) calls.
+
+    Entries expire ``llm_cache_ttl_seconds`` after they were stored; past
+    ``llm_cache_max_entries`` the least recently used are evicted.
+    """
+
+    __tablename__ = "llm_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256 hex
+    provider: Mapped[str] = mapped_column(String(20), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    input_tokens: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    output_tokens: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    hits: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, nullable=False)
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime, default=utcnow, nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<LLMCacheEntry(key={self.key[:12]}, model={self.model}, hits={self.hits})>"
@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
+from api.app.clock import utcnow
 from api.app.database import Base
 
 
@@ -19,7 +20,7 @@ class ContentFlag(Base):
     flagged_by: Mapped[str] = mapped_column(String(50), nullable=False)  # "auto" or bot_id
     resolved: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=utcnow, nullable=False
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,26 @@
+"""Per-heartbeat stage timing model."""
+
+from datetime import datetime
+from sqlalchemy import String, DateTime, JSON, Integer, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.app.clock import utcnow
+from api.app.database import Base
+
+
+class HeartbeatPerf(Base):
+    """Stage durations (ms) for one heartbeat, e.g. {"llm": 2140, "parse": 1}."""
+
+    __tablename__ = "heartbeat_perf"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    bot_id: Mapped[str] = mapped_column(String(50), ForeignKey("bots.id"), nullable=False)
+    provider: Mapped[str] = mapped_column(String(20), nullable=False)
+    total_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    stages: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=utcnow, nullable=False, index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<HeartbeatPerf(bot={self.bot_id}, total_ms={self.total_ms})>"
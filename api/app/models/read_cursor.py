@@ -0,0 +1,33 @@
+"""Per-bot read cursor over the forum feed."""
+
+from datetime import datetime
+from sqlalchemy import String, Integer, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.app.clock import utcnow
+from api.app.database import Base
+
+
+class BotReadCursor(Base):
+    """The newest thread and reply each bot has been shown in its feed.
+
+    One row per bot, advanced when a heartbeat commits. Feed items past the
+    cursor are new to the bot; everything else it has already read.
+    """
+
+    __tablename__ = "bot_read_cursors"
+
+    bot_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("bots.id"), primary_key=True
+    )
+    last_thread_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_reply_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=utcnow, onupdate=utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<BotReadCursor(bot_id={self.bot_id}, thread={self.last_thread_id}, "
+            f"reply={self.last_reply_id})>"
+        )
@@ -1,9 +1,10 @@
 """Reply model."""
 
 from datetime import datetime
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from api.app.clock import utcnow
 from api.app.database import Base
 
 
@@ -11,6 +12,8 @@ class Reply(Base):
     """Reply to a thread or another reply."""
 
     __tablename__ = "replies"
+    # Covers the feed's newest-replies-per-thread window and reply counts
+    __table_args__ = (Index("ix_replies_thread_id_id", "thread_id", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     thread_id: Mapped[int] = mapped_column(
@@ -24,7 +27,7 @@ class Reply(Base):
         Integer, ForeignKey("replies.id"), nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=utcnow, nullable=False
     )
 
     # Relationships
@@ -0,0 +1,58 @@
+"""Scheduler coordination models shared by API and worker processes."""
+
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.app.database import Base
+
+
+class SchedulerLease(Base):
+    """Database-backed lease; only the current holder runs scheduled ticks."""
+
+    __tablename__ = "scheduler_leases"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    owner_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    acquired_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SchedulerLease(name={self.name}, owner={self.owner_id}, expires={self.expires_at})>"
+
+
+class SchedulerState(Base):
+    """Key/value scheduler state (e.g. pace) readable by every process."""
+
+    __tablename__ = "scheduler_state"
+
+    key: Mapped[str] = mapped_column(String(50), primary_key=True)
+    value: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<SchedulerState(key={self.key})>"
+
+
+class HeartbeatTrigger(Base):
+    """A manual heartbeat request, queued for whichever process owns the scheduler."""
+
+    __tablename__ = "heartbeat_triggers"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    bot_id: Mapped[str | None] = mapped_column(String(50), nullable=True)  # None = a full tick
+    # pending | running | done | cancelled (the requester gave up before it started)
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False, index=True)
+    result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    requested_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<HeartbeatTrigger(id={self.id}, bot={self.bot_id}, status={self.status})>"
@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy import String, Text, DateTime, JSON, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from api.app.clock import utcnow
 from api.app.database import Base
 
 
@@ -20,7 +21,7 @@ class Thread(Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     tags: Mapped[list] = mapped_column(JSON, default=list)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=utcnow, nullable=False
     )
     last_reply_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
@@ -19,61 +19,372 @@ class BotAction:
     query: str | None = None
     reason: str | None = None
     vote_value: int | None = None  # 1 for upvote, -1 for downvote
+    repaired: bool = False  # The JSON needed fixing up (quotes, commas, truncation) to parse
+    parse_failed: bool = False  # Nothing usable was found; this is the do_nothing fallback
 
 
-def parse_bot_action(response_text: str) -> BotAction:
-    """Extract JSON action from bot response, handling preamble."""
-    # Try direct parse first
+# Characters the scanner has to stop at inside strings and objects; it
+# jumps straight over everything else
+_STRING_STOPS_DOUBLE = re.compile(r'[\\"]')
+_STRING_STOPS_SINGLE = re.compile(r"[\\']")
+_OBJECT_STOPS = re.compile(r"[\"'{}]")
+_LIST_STOPS = re.compile(r"[{\]]")
+
+# Python literals models sometimes write instead of JSON ones
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def repair_json(text: str, truncated: bool = False) -> str:
+    """Rewrite common LLM JSON mistakes into valid JSON in one pass.
+
+    Handles single-quoted strings, raw newlines inside strings, trailing
+    commas, Python literals (True/False/None) and unquoted keys. With
+    ``truncated``, also closes an unfinished string and every open
+    object or array, dropping a dangling key or comma.
+    """
+    out: list[str] = []
+    # Open containers: [bracket, after_colon, output index of the last comma or opener]
+    stack: list[list] = []
+    quote = None
+    escaped = False
+    i = 0
+    n = len(text)
+    while i < n:
+        char = text[i]
+        if quote:
+            if escaped:
+                escaped = False
+                out.append("'" if char == "'" else "\\" + char)
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+                out.append('"')
+            elif char == '"':
+                out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            elif char == "\t":
+                out.append("\\t")
+            else:
+                out.append(char)
+        elif char in "\"'":
+            quote = char
+            out.append('"')
+        elif char in "{[":
+            out.append(char)
+            stack.append([char, False, len(out)])
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            if stack:
+                stack.pop()
+            out.append(char)
+        elif char == ",":
+            if stack:
+                stack[-1][1] = False
+                stack[-1][2] = len(out)
+            out.append(char)
+        elif char == ":":
+            if stack:
+                stack[-1][1] = True
+            out.append(char)
+        elif char.isalpha() or char == "_":
+            j = i + 1
+            while j < n and (text[j].isalnum() or text[j] == "_"):
+                j += 1
+            word = text[i:j]
+            if word in _PYTHON_LITERALS:
+                out.append(_PYTHON_LITERALS[word])
+            elif stack and stack[-1][0] == "{" and not stack[-1][1]:
+                out.append(f'"{word}"')  # Unquoted key
+            else:
+                out.append(word)
+            i = j
+            continue
+        else:
+            out.append(char)
+        i += 1
+
+    if truncated:
+        if quote:
+            out.append('"')
+        _drop_trailing_comma(out)
+        if stack and stack[-1][0] == "{" and not stack[-1][1]:
+            del out[stack[-1][2]:]  # Key with no value yet
+        elif out and out[-1].rstrip().endswith(":"):
+            out.append("null")
+        _drop_trailing_comma(out)
+        for bracket, _, _ in reversed(stack):
+            out.append("}" if bracket == "{" else "]")
+    return "".join(out)
+
+
+def _drop_trailing_comma(out: list[str]) -> None:
+    while out and out[-1].isspace():
+        out.pop()
+    if out and out[-1] == ",":
+        out.pop()
+
+
+def _load_action(candidate: str, truncated: bool = False) -> BotAction | None:
+    """Parse one candidate object as an action, repairing it if needed."""
+    if "action" not in candidate:
+        return None
+    repaired = False
     try:
-        data = json.loads(response_text.strip())
-        return _dict_to_action(data)
+        data = json.loads(candidate) if not truncated else None
     except json.JSONDecodeError:
-        pass
-
-    # Extract from markdown code fences (```json ... ``` or ``` ... ```)
-    fence_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-    if fence_match:
+        data = None
+    if data is None:
         try:
-            data = json.loads(fence_match.group(1))
-            return _dict_to_action(data)
+            data = json.loads(repair_json(candidate, truncated))
+            repaired = True
         except json.JSONDecodeError:
-            pass
+            return None
+    if not isinstance(data, dict) or "action" not in data:
+        return None
+    action = _dict_to_action(data)
+    action.repaired = repaired
+    return action
 
-    # Look for JSON block in response (bot may include thinking)
-    json_match = re.search(r'\{[^{}]*"action"[^{}]*\}', response_text, re.DOTALL)
-    if json_match:
-        try:
-            data = json.loads(json_match.group())
-            return _dict_to_action(data)
-        except json.JSONDecodeError:
-            pass
-
-    # Try to find a more complex JSON object with nested braces
-    json_match = re.search(r'\{.*"action".*\}', response_text, re.DOTALL)
-    if json_match:
-        # Find balanced braces
-        text = json_match.group()
-        depth = 0
-        start = 0
-        for i, char in enumerate(text):
-            if char == '{':
-                if depth == 0:
-                    start = i
-                depth += 1
-            elif char == '}':
-                depth -= 1
-                if depth == 0:
-                    try:
-                        data = json.loads(text[start:i+1])
-                        return _dict_to_action(data)
-                    except json.JSONDecodeError:
-                        continue
+
+def _opens_object(text: str, i: int) -> bool | None:
+    """Whether the text after a ``{`` at i-1 starts a JSON-like object.
+
+    None means the text ends before that can be told.
+    """
+    n = len(text)
+    while i < n and text[i].isspace():
+        i += 1
+    if i == n:
+        return None
+    if text[i] in "\"'}":
+        return True
+    if not (text[i].isalpha() or text[i] == "_"):
+        return False
+    # An unquoted key must be followed by a colon
+    while i < n and (text[i].isalnum() or text[i] == "_"):
+        i += 1
+    while i < n and text[i].isspace():
+        i += 1
+    if i == n:
+        return None
+    return text[i] == ":"
+
+
+class ActionStreamParser:
+    """Find JSON action objects in (possibly streamed) text in one pass.
+
+    Brace depth is tracked outside of quoted strings, so braces inside
+    content never confuse it, and each character is scanned once across
+    all chunks. A ``{`` only opens an object when followed by a quote,
+    ``}`` or an unquoted key, so prose like "{this}" is skipped. Each complete object is
+    parsed at most twice (as-is, then repaired), keeping the whole parse
+    linear in the response length. Top-level objects are collected whether
+    they stand alone or sit in a JSON array, up to ``max_actions``; once the
+    last wanted action (or the array's closing ``]``) arrives, the rest of a
+    stream can be cancelled.
+    """
+
+    def __init__(self, max_actions: int = 1):
+        self.text = ""
+        self.max_actions = max(1, max_actions)
+        self.actions: list[BotAction] = []
+        self.done = False  # No more actions are wanted from this text
+        self._pos = 0  # Next character to scan
+        self._depth = 0
+        self._start = 0  # Offset of the current top-level object
+        self._quote = None
+        self._escaped = False
+
+    @property
+    def action(self) -> BotAction | None:
+        """The first action found, if any."""
+        return self.actions[0] if self.actions else None
+
+    def feed(self, chunk: str) -> bool:
+        """Add a chunk; return True once every wanted action has been seen."""
+        if self.done:
+            return True
+        self.text += chunk
+
+        text = self.text
+        i = self._pos
+        n = len(text)
+        while i < n:
+            if self._escaped:
+                self._escaped = False
+                i += 1
+            elif self._quote:
+                match = (_STRING_STOPS_DOUBLE if self._quote == '"' else _STRING_STOPS_SINGLE).search(text, i)
+                if match is None:
+                    i = n
+                    break
+                i = match.start()
+                if text[i] == "\\":
+                    self._escaped = True
+                else:
+                    self._quote = None
+                i += 1
+            elif self._depth == 0:
+                if self.actions:
+                    # Past the first action, a top-level "]" closes the list
+                    match = _LIST_STOPS.search(text, i)
+                    i = match.start() if match else -1
+                else:
+                    i = text.find("{", i)
+                if i < 0:
+                    i = n
+                    break
+                if text[i] == "]":
+                    self.done = True
+                    self._pos = i + 1
+                    return True
+                opens = _opens_object(text, i + 1)
+                if opens is None:
+                    break  # Wait for the next chunk to see what follows
+                if opens:
+                    self._start = i
+                    self._depth = 1
+                i += 1
+            else:
+                match = _OBJECT_STOPS.search(text, i)
+                if match is None:
+                    i = n
+                    break
+                i = match.start()
+                char = text[i]
+                if char in "\"'":
+                    self._quote = char
+                elif char == "{":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        action = _load_action(text[self._start:i + 1])
+                        if action is not None:
+                            self.actions.append(action)
+                            if len(self.actions) >= self.max_actions:
+                                self.done = True
+                                self._pos = i + 1
+                                return True
+                i += 1
+        self._pos = i
+        return False
+
+    def finish(self) -> list[BotAction]:
+        """Call once the text is complete: salvage an action cut off mid-object."""
+        if not self.done and self._depth > 0:
+            action = _load_action(self.text[self._start:], truncated=True)
+            if action is not None:
+                self.actions.append(action)
+        self.done = True
+        return self.actions
+
+
+def parse_bot_actions(response_text: str, max_actions: int = 1) -> list[BotAction]:
+    """Extract up to max_actions JSON actions, in order, from a bot response.
+
+    Accepts a JSON array of actions or consecutive objects, with the same
+    tolerance for preamble, fences and broken JSON as a single action.
+    A do_nothing alongside real actions is dropped; if nothing parses the
+    result is a single do_nothing fallback.
+    """
+    parser = ActionStreamParser(max_actions)
+    parser.feed(response_text)
+    return finalize_actions(parser.finish())
+
+
+def finalize_actions(actions: list[BotAction]) -> list[BotAction]:
+    """Drop do_nothing entries from a list with real actions; never return it empty."""
+    taken = [action for action in actions if action.action != "do_nothing"]
+    if taken:
+        return taken
+    if actions:
+        return actions[:1]
 
     # Fallback: do nothing
-    return BotAction(
+    return [BotAction(
         action="do_nothing",
-        reason="Failed to parse bot response"
-    )
+        reason="Failed to parse bot response",
+        parse_failed=True,
+    )]
+
+
+def parse_bot_action(response_text: str) -> BotAction:
+    """Extract JSON action from bot response, handling preamble, fences and broken JSON."""
+    return parse_bot_actions(response_text)[0]
+
+
+# Actions as tools for providers with native tool use (Anthropic's shape)
+ACTION_TOOLS = [
+    {
+        "name": "create_thread",
+        "description": "Start a new thread for a genuinely new idea, question or topic.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "content": {"type": "string", "description": "2-4 paragraphs max"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["title", "content"],
+        },
+    },
+    {
+        "name": "reply",
+        "description": "Reply to a thread, or to a specific reply in it.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "thread_id": {"type": "integer"},
+                "parent_reply_id": {"type": ["integer", "null"]},
+                "content": {"type": "string"},
+            },
+            "required": ["thread_id", "content"],
+        },
+    },
+    {
+        "name": "vote",
+        "description": "Upvote (1) or downvote (-1) a thread or a reply; give thread_id or reply_id.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "thread_id": {"type": "integer"},
+                "reply_id": {"type": "integer"},
+                "value": {"type": "integer", "enum": [1, -1]},
+                "reason": {"type": "string"},
+            },
+            "required": ["value"],
+        },
+    },
+    {
+        "name": "web_search",
+        "description": "Search Wikipedia for facts to bring into the conversation.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string"},
+                "reason": {"type": "string"},
+            },
+            "required": ["query"],
+        },
+    },
+    {
+        "name": "do_nothing",
+        "description": "Sit this one out when nothing warrants a response.",
+        "input_schema": {
+            "type": "object",
+            "properties": {"reason": {"type": "string"}},
+            "required": ["reason"],
+        },
+    },
+]
+
+
+def action_from_tool_call(tool_call: dict) -> BotAction:
+    """Convert a native tool call ({"name", "input"}) to a BotAction."""
+    return _dict_to_action({**(tool_call.get("input") or {}), "action": tool_call.get("name")})
 
 
 def _dict_to_action(data: dict) -> BotAction:
@@ -0,0 +1,46 @@
+"""Local token estimates and budget-aware section fitting for prompts."""
+
+import math
+
+
+# Rough characters per token for English prose with the Claude/Llama tokenizers
+CHARS_PER_TOKEN = 4
+
+OMITTED_NOTE = "(Omitted to fit the prompt budget.)"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a tokenizer or network call."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _omitted_note(count: int) -> str:
+    return f"(... {count} more omitted to fit the prompt budget)"
+
+
+def fit_text(text: str, max_tokens: int, separator: str = "\n") -> tuple[str, int]:
+    """Trim text to roughly max_tokens, keeping whole leading pieces.
+
+    Text is cut at ``separator`` boundaries (e.g. lines, or blank lines
+    between feed threads) and a note says how many pieces were left out.
+    Returns the fitted text and the estimated number of tokens dropped.
+    """
+    total = estimate_tokens(text)
+    if total <= max_tokens:
+        return text, 0
+
+    pieces = text.split(separator)
+    kept: list[str] = []
+    used = 0
+    for i, piece in enumerate(pieces):
+        cost = estimate_tokens(piece + separator)
+        if used + cost + estimate_tokens(_omitted_note(len(pieces) - i)) > max_tokens:
+            break
+        kept.append(piece)
+        used += cost
+
+    if not kept:
+        return OMITTED_NOTE, total
+
+    fitted = separator.join(kept) + separator + _omitted_note(len(pieces) - len(kept))
+    return fitted, max(0, total - estimate_tokens(separator.join(kept)))
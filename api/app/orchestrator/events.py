@@ -0,0 +1,201 @@
+"""In-process asyncio event bus for heartbeat domain events."""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Literal
+
+from api.app.clock import utcnow
+from api.app.orchestrator.action_parser import BotAction
+
+
+logger = logging.getLogger(__name__)
+
+EventType = Literal["thread_created", "reply_posted", "vote_cast", "search_done", "idle"]
+
+# Domain event published for each executed action type
+ACTION_EVENT_TYPES: dict[str, EventType] = {
+    "create_thread": "thread_created",
+    "reply": "reply_posted",
+    "vote": "vote_cast",
+    "web_search": "search_done",
+    "do_nothing": "idle",
+}
+
+
+@dataclass
+class HeartbeatEvent:
+    """A bot action that has been durably committed."""
+    type: EventType
+    bot_id: str
+    bot_name: str
+    action: BotAction
+    result: dict
+    activity_log_id: int
+    tokens_used: int = 0
+    timestamp: datetime = field(default_factory=utcnow)
+    perf_id: int | None = None
+    # Activity log ids of every action from the same LLM response
+    batch_log_ids: list[int] = field(default_factory=list)
+    # Per-subscriber handling time (ms), filled in by the bus
+    stage_ms: dict[str, int] = field(default_factory=dict)
+    _pending: int = field(default=0, repr=False)
+
+
+Handler = Callable[[HeartbeatEvent], Awaitable[None]]
+CompletionHook = Callable[[HeartbeatEvent], None]
+
+
+@dataclass
+class _Subscriber:
+    name: str
+    handler: Handler
+    event_types: frozenset[str] | None
+    concurrency: int
+    queue: asyncio.Queue | None = None
+    tasks: list[asyncio.Task] = field(default_factory=list)
+    processed: int = 0
+    failed: int = 0
+    dropped: int = 0
+
+    def accepts(self, event: HeartbeatEvent) -> bool:
+        return self.event_types is None or event.type in self.event_types
+
+
+class EventBus:
+    """Fan out events to independent subscribers, each with its own queue and workers.
+
+    While started, ``publish`` only enqueues, so publishers never wait on
+    consumers. When not started (scripts, simulations) handlers run inline,
+    in subscription order, before ``publish`` returns.
+    """
+
+    def __init__(self, queue_size: int = 1000, on_complete: CompletionHook | None = None):
+        self.queue_size = queue_size
+        self.on_complete = on_complete  # Called once every subscriber has handled an event
+        self._subscribers: list[_Subscriber] = []
+        self._published: Counter = Counter()
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def subscribe(
+        self,
+        name: str,
+        handler: Handler,
+        event_types: set[str] | None = None,
+        concurrency: int = 1,
+    ) -> None:
+        """Register a handler for some (or, if event_types is None, all) event types."""
+        self._subscribers.append(_Subscriber(
+            name=name,
+            handler=handler,
+            event_types=frozenset(event_types) if event_types else None,
+            concurrency=max(1, concurrency),
+        ))
+
+    async def start(self) -> None:
+        """Start worker tasks for every subscriber."""
+        if self._running:
+            return
+        for sub in self._subscribers:
+            sub.queue = asyncio.Queue(maxsize=self.queue_size)
+            sub.tasks = [
+                asyncio.create_task(self._consume(sub), name=f"event-bus:{sub.name}:{i}")
+                for i in range(sub.concurrency)
+            ]
+        self._running = True
+        logger.info(f"Event bus started with {len(self._subscribers)} subscriber(s)")
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Drain queued events (up to timeout seconds), then stop workers."""
+        if not self._running:
+            return
+        self._running = False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(sub.queue.join() for sub in self._subscribers)),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Event bus stop timed out with events still queued")
+        for sub in self._subscribers:
+            for task in sub.tasks:
+                task.cancel()
+            await asyncio.gather(*sub.tasks, return_exceptions=True)
+            sub.tasks = []
+        logger.info("Event bus stopped")
+
+    async def publish(self, event: HeartbeatEvent) -> None:
+        """Deliver an event to every subscriber that accepts its type."""
+        self._published[event.type] += 1
+        subscribers = [sub for sub in self._subscribers if sub.accepts(event)]
+        event._pending = len(subscribers)
+        if not subscribers:
+            self._complete(event)
+
+        for sub in subscribers:
+            if self._running:
+                try:
+                    sub.queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    sub.dropped += 1
+                    logger.warning(f"Event bus queue full for {sub.name}; dropped {event.type}")
+                    self._finish(event)
+            else:
+                await self._handle(sub, event)
+
+    async def _consume(self, sub: _Subscriber) -> None:
+        while True:
+            event = await sub.queue.get()
+            try:
+                await self._handle(sub, event)
+            finally:
+                sub.queue.task_done()
+
+    async def _handle(self, sub: _Subscriber, event: HeartbeatEvent) -> None:
+        started = time.perf_counter()
+        try:
+            await sub.handler(event)
+            sub.processed += 1
+        except Exception as e:
+            sub.failed += 1
+            logger.warning(f"{sub.name} failed for {event.type} from {event.bot_id}: {e}")
+        finally:
+            event.stage_ms[sub.name] = round((time.perf_counter() - started) * 1000)
+            self._finish(event)
+
+    def _finish(self, event: HeartbeatEvent) -> None:
+        event._pending -= 1
+        if event._pending == 0:
+            self._complete(event)
+
+    def _complete(self, event: HeartbeatEvent) -> None:
+        if self.on_complete is None:
+            return
+        try:
+            self.on_complete(event)
+        except Exception as e:
+            logger.debug(f"Event completion hook failed for {event.type}: {e}")
+
+    def stats(self) -> dict:
+        """Published counts per event type and per-subscriber counters."""
+        return {
+            "running": self._running,
+            "published": dict(self._published),
+            "subscribers": {
+                sub.name: {
+                    "concurrency": sub.concurrency,
+                    "queued": sub.queue.qsize() if sub.queue and self._running else 0,
+                    "processed": sub.processed,
+                    "failed": sub.failed,
+                    "dropped": sub.dropped,
+                }
+                for sub in self._subscribers
+            },
+        }
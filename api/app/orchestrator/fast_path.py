@@ -0,0 +1,120 @@
+"""Cheap pre-LLM decision for heartbeats where nothing relevant changed."""
+
+import logging
+import random
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+
+from api.app.config import get_settings
+from api.app.models.bot import Bot
+from api.app.models.reply import Reply
+from api.app.models.thread import Thread
+from api.app.orchestrator.feed import FeedSnapshot, get_read_cursor
+from api.app.orchestrator.wakeups import mention_pattern
+
+
+logger = logging.getLogger(__name__)
+
+# Chance of sitting out a tick with nothing new in the feed, by engagement
+# style, before shyness scales it
+QUIET_SKIP_PROBABILITY = {"observer": 0.9, "reactive": 0.8, "active": 0.5}
+
+# Chance of sitting out a tick with new activity that doesn't involve the
+# bot, by engagement style, before shyness scales it
+UNINVOLVED_SKIP_PROBABILITY = {"observer": 0.6, "reactive": 0.3, "active": 0.0}
+
+# Most new posts scanned for mentions; past this the bot just gets its turn
+MENTION_SCAN_LIMIT = 200
+
+# Shared so a seeded simulation is reproducible
+_rng = random.Random()
+
+_stats = {"checked": 0, "skipped": 0}
+
+
+def seed_fast_path(seed: int | None) -> None:
+    """Seed the skip decisions (None reseeds from the OS)."""
+    _rng.seed(seed)
+
+
+def skip_probability(config: dict, feed_changed: bool) -> float:
+    """How likely the bot is to sit out a tick it isn't involved in.
+
+    Shyness (0-100) scales the engagement style's base chance: at 50 it is
+    used as-is, shyer bots skip more and bolder ones less.
+    """
+    behavior = config.get("behavior", {})
+    style = behavior.get("engagement_style", "active")
+    shyness = behavior.get("shyness", 25) / 100
+
+    table = UNINVOLVED_SKIP_PROBABILITY if feed_changed else QUIET_SKIP_PROBABILITY
+    base = table.get(style, table["active"])
+    return min(0.95, base * (0.5 + shyness))
+
+
+def has_unseen_mentions(db: Session, bot: Bot, last_thread_id: int, last_reply_id: int) -> bool:
+    """Whether posts past the read cursor reply to, or mention, the bot."""
+    parent = aliased(Reply)
+    replies = db.execute(
+        select(Reply.content, Thread.author_bot_id, parent.author_bot_id)
+        .join(Thread, Thread.id == Reply.thread_id)
+        .outerjoin(parent, parent.id == Reply.parent_reply_id)
+        .where(Reply.id > last_reply_id, Reply.author_bot_id != bot.id)
+        .order_by(Reply.id.desc())
+        .limit(MENTION_SCAN_LIMIT)
+    ).all()
+    threads = db.execute(
+        select(Thread.title, Thread.content)
+        .where(Thread.id > last_thread_id, Thread.author_bot_id != bot.id)
+        .order_by(Thread.id.desc())
+        .limit(MENTION_SCAN_LIMIT)
+    ).all()
+    if len(replies) == MENTION_SCAN_LIMIT or len(threads) == MENTION_SCAN_LIMIT:
+        return True
+
+    pattern = mention_pattern(bot.name, bot.id)
+    for content, thread_author, parent_author in replies:
+        if bot.id in (thread_author, parent_author) or pattern.search(content):
+            return True
+    return any(pattern.search(f"{title}\n{content}") for title, content in threads)
+
+
+def check_fast_path(db: Session, bot: Bot, snapshot: FeedSnapshot) -> str | None:
+    """Decide, without the LLM, whether the bot sits this heartbeat out.
+
+    Bots always get an LLM turn on their first heartbeat and when new posts
+    reply to or mention them. Otherwise they skip with a probability from
+    their shyness and engagement style: high when nothing has changed since
+    their read cursor, lower when there is new activity they aren't part of.
+
+    Returns the reason to log for a skipped turn, or None to call the LLM.
+    """
+    if not get_settings().fast_path_enabled:
+        return None
+
+    _stats["checked"] += 1
+    cursor = get_read_cursor(db, bot.id)
+    if cursor is None:
+        return None
+
+    feed_changed = (
+        snapshot.last_thread_id > cursor.last_thread_id
+        or snapshot.last_reply_id > cursor.last_reply_id
+    )
+
+    probability = skip_probability(bot.personality_config, feed_changed)
+    if probability <= 0 or _rng.random() >= probability:
+        return None
+    if feed_changed and has_unseen_mentions(db, bot, cursor.last_thread_id, cursor.last_reply_id):
+        return None
+
+    _stats["skipped"] += 1
+    if feed_changed:
+        return "New activity, but nothing involving me"
+    return "Nothing new since I last checked"
+
+
+def fast_path_stats() -> dict:
+    """Heartbeats checked and LLM calls skipped since this process started."""
+    return dict(_stats)
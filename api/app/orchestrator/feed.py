@@ -0,0 +1,321 @@
+"""Shared forum feed snapshot for heartbeat prompts."""
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
+
+from api.app.models.thread import Thread
+from api.app.models.reply import Reply
+from api.app.models.read_cursor import BotReadCursor
+from api.app.models.scheduler import SchedulerState
+from api.app.orchestrator.scheduler_state import set_scheduler_state
+
+
+logger = logging.getLogger(__name__)
+
+# Replies shown under each feed thread
+FEED_REPLIES_PER_THREAD = 5
+
+# Opening-post excerpt kept for threads a bot has read but that have new replies
+SEEN_THREAD_EXCERPT_CHARS = 150
+
+# Reply aliases for the feed query, built once rather than per heartbeat
+_newer_reply = aliased(Reply)
+_parent_reply = aliased(Reply)
+
+
+@dataclass
+class FeedReply:
+    id: int
+    author_bot_id: str
+    content: str
+    parent_reply_id: int | None = None
+    parent_author_bot_id: str | None = None
+
+
+@dataclass
+class FeedThread:
+    id: int
+    title: str
+    author_bot_id: str
+    content: str
+    reply_count: int
+    recent_replies: list[FeedReply] = field(default_factory=list)
+
+
+@dataclass
+class FeedSnapshot:
+    """The newest threads as of one forum write-version, plus their rendering."""
+    version: tuple
+    threads: list[FeedThread]
+    text: str
+    # Newest thread and reply ids in the forum at this version
+    last_thread_id: int = 0
+    last_reply_id: int = 0
+
+
+# Snapshots by feed size; reused until the forum's write-version changes
+_snapshots: dict[int, FeedSnapshot] = {}
+
+# Bumped by invalidate_feed_cache() so local writes never serve a stale feed
+_generation = 0
+
+# Scheduler state key whose token changes whenever a thread or reply is deleted
+FEED_DELETIONS_STATE = "feed_deletions"
+
+_stats = {"hits": 0, "misses": 0}
+
+
+def invalidate_feed_cache() -> None:
+    """Drop cached feed snapshots after threads or replies are written."""
+    global _generation
+    _generation += 1
+    _snapshots.clear()
+
+
+def record_feed_deletion(db: Session) -> None:
+    """Invalidate every process's feed snapshots after a thread or reply is deleted."""
+    set_scheduler_state(db, FEED_DELETIONS_STATE, {"token": uuid.uuid4().hex})
+    invalidate_feed_cache()
+
+
+def get_feed_version(db: Session) -> tuple:
+    """Cheap fingerprint of forum content, changed by any thread or reply write.
+
+    Covers writes made by other processes (API replicas, the worker) that
+    never call ``invalidate_feed_cache`` here: new posts raise the newest
+    thread or reply id (primary-key lookups), and deletions change the
+    token stored by ``record_feed_deletion``.
+    """
+    row = db.execute(select(
+        select(func.max(Thread.id)).scalar_subquery(),
+        select(func.max(Reply.id)).scalar_subquery(),
+        select(SchedulerState.value)
+        .where(SchedulerState.key == FEED_DELETIONS_STATE)
+        .scalar_subquery(),
+    )).one()
+    return (_generation, *row)
+
+
+def _recent_replies_query(thread_ids: list[int], per_thread: int):
+    """Newest ``per_thread`` replies of each thread, with their parents' authors.
+
+    Each thread's window starts at its ``per_thread``-th newest reply id,
+    found by a short seek on the (thread_id, id) index, so long threads
+    never load or rank every reply; content is fetched just for the rows kept.
+    """
+    newer, parent = _newer_reply, _parent_reply
+    window = (
+        select(
+            Thread.id.label("thread_id"),
+            select(newer.id)
+            .where(newer.thread_id == Thread.id)
+            .order_by(newer.id.desc())
+            .offset(per_thread - 1)
+            .limit(1)
+            .scalar_subquery()
+            .label("first_reply_id"),
+        )
+        .where(Thread.id.in_(thread_ids))
+        .subquery()
+    )
+    return (
+        select(
+            Reply.id,
+            Reply.thread_id,
+            Reply.author_bot_id,
+            Reply.content,
+            Reply.parent_reply_id,
+            parent.author_bot_id.label("parent_author_bot_id"),
+        )
+        .join(window, window.c.thread_id == Reply.thread_id)
+        .outerjoin(parent, parent.id == Reply.parent_reply_id)
+        .where(Reply.id >= func.coalesce(window.c.first_reply_id, 0))
+        .order_by(Reply.thread_id, Reply.id)
+    )
+
+
+def load_feed_threads(db: Session, limit: int = 10) -> list[FeedThread]:
+    """Load the newest threads with their most recent replies.
+
+    Two queries regardless of thread length: the threads, then one
+    index-bounded query for their last FEED_REPLIES_PER_THREAD replies.
+    """
+    reply_count = (
+        select(func.count(Reply.id))
+        .where(Reply.thread_id == Thread.id)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(Thread.id, Thread.title, Thread.author_bot_id, Thread.content, reply_count.label("reply_count"))
+        .order_by(Thread.created_at.desc())
+        .limit(limit)
+    ).all()
+    feed_threads = {
+        row.id: FeedThread(
+            id=row.id,
+            title=row.title,
+            author_bot_id=row.author_bot_id,
+            content=row.content,
+            reply_count=row.reply_count,
+        )
+        for row in rows
+    }
+    if not feed_threads:
+        return []
+
+    for row in db.execute(_recent_replies_query(list(feed_threads), FEED_REPLIES_PER_THREAD)):
+        feed_threads[row.thread_id].recent_replies.append(FeedReply(
+            id=row.id,
+            author_bot_id=row.author_bot_id,
+            content=row.content,
+            parent_reply_id=row.parent_reply_id,
+            parent_author_bot_id=row.parent_author_bot_id,
+        ))
+    return list(feed_threads.values())
+
+
+def _thread_header(thread: FeedThread) -> str:
+    return f"[Thread #{thread.id}: \"{thread.title}\" by {thread.author_bot_id} - {thread.reply_count} replies]"
+
+
+def _reply_line(reply: FeedReply) -> str:
+    prefix = f"  > {reply.author_bot_id}"
+    if reply.parent_author_bot_id:
+        prefix += f" (replying to {reply.parent_author_bot_id})"
+    return f"{prefix}: {reply.content[:300]}"
+
+
+def render_feed(threads: list[FeedThread], cursor: BotReadCursor | None = None) -> str:
+    """Render feed threads as prompt text.
+
+    With a read cursor, threads new to the bot are shown in full, threads
+    with new replies show only those replies under a short excerpt, and
+    threads with nothing new collapse to one-line stubs at the end.
+    """
+    if not threads:
+        return "No threads yet. You could start one!"
+
+    feed = []
+    stubs = []
+    for thread in threads:
+        if cursor is None or thread.id > cursor.last_thread_id:
+            feed.append(_thread_header(thread))
+            feed.append(f"  {thread.content[:400]}")
+
+            # Show recent replies with more content so bots can respond to specifics
+            for reply in thread.recent_replies:
+                feed.append(_reply_line(reply))
+            feed.append("")
+            continue
+
+        new_replies = [r for r in thread.recent_replies if r.id > cursor.last_reply_id]
+        if not new_replies:
+            stubs.append(_thread_header(thread))
+            continue
+
+        excerpt = thread.content[:SEEN_THREAD_EXCERPT_CHARS]
+        if len(thread.content) > SEEN_THREAD_EXCERPT_CHARS:
+            excerpt += "..."
+        feed.append(f"{_thread_header(thread)} (new replies)")
+        feed.append(f"  {excerpt}")
+        earlier = thread.reply_count - len(new_replies)
+        if len(new_replies) < len(thread.recent_replies):
+            # The loaded window reaches back into what the bot has read
+            feed.append(f"  ({earlier} earlier replies you've already read)")
+        elif earlier:
+            # Every loaded reply is new, so older unloaded ones may be unread too
+            feed.append(f"  ({earlier} earlier replies not shown)")
+        for reply in new_replies:
+            feed.append(_reply_line(reply))
+        feed.append("")
+
+    if stubs:
+        if not feed:
+            feed.append("Nothing new since you last checked.")
+            feed.append("")
+        feed.append("No new activity (already read):")
+        feed.extend(stubs)
+
+    return "\n".join(feed)
+
+
+def feed_read_position(
+    snapshot: FeedSnapshot, cursor: BotReadCursor | None, shown_text: str,
+) -> tuple[int, int]:
+    """Where to advance the read cursor after the bot was shown ``shown_text``.
+
+    Normally the newest thread and reply in the forum. When the prompt
+    budget cut feed threads holding unread posts, the position stops just
+    before the oldest unread thread or reply that was cut, so the bot sees
+    it next heartbeat (some posts it was shown may then repeat).
+    """
+    last_thread_id, last_reply_id = snapshot.last_thread_id, snapshot.last_reply_id
+    read_thread_id = cursor.last_thread_id if cursor else 0
+    read_reply_id = cursor.last_reply_id if cursor else 0
+    for thread in snapshot.threads:
+        if _thread_header(thread) in shown_text:
+            continue
+        if thread.id > read_thread_id:
+            last_thread_id = min(last_thread_id, thread.id - 1)
+        unread = [reply.id for reply in thread.recent_replies if reply.id > read_reply_id]
+        if unread:
+            last_reply_id = min(last_reply_id, min(unread) - 1)
+    return last_thread_id, last_reply_id
+
+
+def get_read_cursor(db: Session, bot_id: str) -> BotReadCursor | None:
+    """The bot's read cursor, or None if it has never been shown the feed."""
+    return db.get(BotReadCursor, bot_id)
+
+
+def advance_read_cursor(
+    db: Session, bot_id: str, last_thread_id: int, last_reply_id: int, commit: bool = True,
+) -> None:
+    """Mark everything up to these thread and reply ids as read by the bot."""
+    cursor = db.get(BotReadCursor, bot_id)
+    if cursor is None:
+        cursor = BotReadCursor(bot_id=bot_id)
+        db.add(cursor)
+    cursor.last_thread_id = max(cursor.last_thread_id or 0, last_thread_id)
+    cursor.last_reply_id = max(cursor.last_reply_id or 0, last_reply_id)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+
+
+def get_feed_snapshot(db: Session, limit: int = 10) -> FeedSnapshot:
+    """Get the feed for the forum's current write-version.
+
+    Every bot heartbeating against the same version (typically a whole tick,
+    until someone posts) shares one load and render. A heartbeat takes one
+    snapshot and hands it to both the fast path and the prompt builder.
+    """
+    version = get_feed_version(db)
+    snapshot = _snapshots.get(limit)
+    if snapshot is not None and snapshot.version == version:
+        _stats["hits"] += 1
+        return snapshot
+
+    _stats["misses"] += 1
+    threads = load_feed_threads(db, limit)
+    _, last_thread_id, last_reply_id, _ = version
+    snapshot = FeedSnapshot(
+        version=version,
+        threads=threads,
+        text=render_feed(threads),
+        last_thread_id=last_thread_id or 0,
+        last_reply_id=last_reply_id or 0,
+    )
+    _snapshots[limit] = snapshot
+    logger.debug(f"Feed snapshot rebuilt for version {version}")
+    return snapshot
+
+
+def feed_cache_stats() -> dict:
+    """Snapshot reuse counters since this process started."""
+    return dict(_stats)
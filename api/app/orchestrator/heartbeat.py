@@ -1,125 +1,40 @@
 """Heartbeat logic for bot actions."""
 
 import logging
-from datetime import datetime
+from typing import Literal
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
+from api.app import clock
+from api.app.config import get_settings
 from api.app.models.bot import Bot
 from api.app.models.thread import Thread
 from api.app.models.reply import Reply
 from api.app.models.activity_log import ActivityLog
 from api.app.models.vote import Vote
-from api.app.models.moderation import ContentFlag
-from api.app.llm import get_llm_client
-from api.app.orchestrator.prompt_builder import build_prompt
-from api.app.orchestrator.action_parser import parse_bot_action, BotAction
-from api.app.memory.extractor import extract_memories
-from api.app.memory.cold import maybe_compress_to_cold
+from api.app.models.perf import HeartbeatPerf
+from api.app.llm import LLMResponse
+from api.app.llm.router import resolve_route
+from api.app.orchestrator.prompt_builder import build_prompt, get_max_actions
+from api.app.orchestrator.action_parser import (
+    ACTION_TOOLS, ActionStreamParser, BotAction, action_from_tool_call, finalize_actions,
+)
+from api.app.orchestrator.events import ACTION_EVENT_TYPES, HeartbeatEvent
+from api.app.orchestrator.fast_path import check_fast_path
+from api.app.orchestrator.feed import advance_read_cursor, get_feed_snapshot, invalidate_feed_cache
+from api.app.orchestrator.post_processing import event_bus
+from api.app.orchestrator.perf import StageTimer
 from api.app.memory.warm import record_interaction
+from api.app.orchestrator.wakeups import find_mentioned_bots, request_wakeup
 from api.app.tools.web_search import WikipediaSearchTool
-from api.app.usage import check_usage_cap, record_usage
-from api.app.routes.ws import manager as ws_manager
+from api.app.usage import check_usage_cap, record_llm_usage
 
 
 logger = logging.getLogger(__name__)
 
 _wiki_search = WikipediaSearchTool()
 
-# Stopwords for Jaccard overlap
-_STOPWORDS = frozenset(
-    "a an the is are was were be been being have has had do does did will would "
-    "shall should may might can could of in to for on with at by from and or but "
-    "not no nor so yet both either neither each every all any few more most other "
-    "some such that this these those i me my we us our you your he him his she her "
-    "it its they them their what which who whom how when where why am if then than".split()
-)
-
-
-def _jaccard_overlap(text_a: str, text_b: str) -> float:
-    """Compute Jaccard word overlap between two texts."""
-    words_a = set(text_a.lower().split()) - _STOPWORDS
-    words_b = set(text_b.lower().split()) - _STOPWORDS
-    if not words_a or not words_b:
-        return 0.0
-    return len(words_a & words_b) / len(words_a | words_b)
-
-
-def _run_auto_moderation(db: Session, bot_id: str, action: BotAction, result: dict):
-    """Run auto-moderation checks after a bot action. Creates ContentFlag if issues found."""
-    if action.action not in ("create_thread", "reply"):
-        return
-
-    content = action.content or ""
-
-    # Low quality: under 20 characters
-    if len(content.strip()) < 20:
-        target_type = "thread" if action.action == "create_thread" else "reply"
-        target_id = result.get("thread_id") if action.action == "create_thread" else result.get("reply_id")
-        if target_id:
-            flag = ContentFlag(
-                target_type=target_type,
-                target_id=target_id,
-                flag_type="low_quality",
-                flagged_by="auto",
-            )
-            db.add(flag)
-            logger.info(f"Auto-flag: low quality content from {bot_id}")
-
-    # Repetition: Jaccard overlap > 0.6 with last 3 posts
-    recent_logs = (
-        db.query(ActivityLog)
-        .filter(
-            ActivityLog.bot_id == bot_id,
-            ActivityLog.action_type.in_(["create_thread", "reply"]),
-        )
-        .order_by(ActivityLog.created_at.desc())
-        .limit(3)
-        .all()
-    )
-    for log_entry in recent_logs:
-        prev_content = (log_entry.details or {}).get("raw_response", "")
-        if prev_content and _jaccard_overlap(content, prev_content) > 0.6:
-            target_type = "thread" if action.action == "create_thread" else "reply"
-            target_id = result.get("thread_id") if action.action == "create_thread" else result.get("reply_id")
-            if target_id:
-                flag = ContentFlag(
-                    target_type=target_type,
-                    target_id=target_id,
-                    flag_type="repetitive",
-                    flagged_by="auto",
-                )
-                db.add(flag)
-                logger.info(f"Auto-flag: repetitive content from {bot_id}")
-            break  # One flag per action is enough
-
-    # Frequency cap: 5+ posts in the last hour
-    one_hour_ago = datetime.utcnow().replace(microsecond=0)
-    from datetime import timedelta
-    one_hour_ago = one_hour_ago - timedelta(hours=1)
-    recent_count = (
-        db.query(func.count(ActivityLog.id))
-        .filter(
-            ActivityLog.bot_id == bot_id,
-            ActivityLog.action_type.in_(["create_thread", "reply"]),
-            ActivityLog.created_at >= one_hour_ago,
-        )
-        .scalar() or 0
-    )
-    if recent_count >= 5:
-        target_type = "thread" if action.action == "create_thread" else "reply"
-        target_id = result.get("thread_id") if action.action == "create_thread" else result.get("reply_id")
-        if target_id:
-            flag = ContentFlag(
-                target_type=target_type,
-                target_id=target_id,
-                flag_type="frequency",
-                flagged_by="auto",
-            )
-            db.add(flag)
-            logger.info(f"Auto-flag: frequency cap for {bot_id}")
-
-    db.commit()
+# What started a heartbeat: its regular schedule, an early wakeup, or an operator
+HeartbeatReason = Literal["scheduled", "wakeup", "manual"]
 
 
 def _update_author_reputation(
@@ -156,9 +71,100 @@ def _update_author_reputation(
             author.downvotes_received += 1
 
 
-async def execute_action(bot: Bot, action: BotAction, db: Session) -> dict:
-    """Execute the bot's chosen action."""
+def _emit_wakeups(db: Session, bot: Bot, action: BotAction, engaged_bot_ids: list[str]):
+    """Request early heartbeats for bots this action replied to, voted on, or mentioned."""
+    reasons = {other: f"{action.action} by {bot.id}" for other in engaged_bot_ids}
+    if action.action in ("create_thread", "reply"):
+        for other in find_mentioned_bots(db, action.content or "", bot.id):
+            reasons.setdefault(other, f"mentioned by {bot.id}")
+
+    for other, reason in reasons.items():
+        try:
+            request_wakeup(other, reason)
+        except Exception as e:
+            logger.warning(f"Failed to request wakeup for {other}: {e}")
+
+
+def _record_response_usage(db: Session, bot_id: str, response: LLMResponse, provider: str):
+    """Stage the token usage of an LLM response, including prompt-cache reads and writes."""
+    record_llm_usage(db, bot_id, response, provider, commit=False)
+
+
+def _record_failed_heartbeat(
+    db: Session, bot_id: str, actions: list[BotAction], response: LLMResponse, provider: str, error: str,
+):
+    """Record usage and an error log for a heartbeat whose actions were rolled back.
+
+    The LLM tokens were spent either way, so they still count towards the cap.
+    """
+    try:
+        _record_response_usage(db, bot_id, response, provider)
+        db.add(ActivityLog(
+            bot_id=bot_id,
+            action_type=actions[0].action,
+            details={
+                "success": False,
+                "action": actions[0].action,
+                "error": error,
+                "rolled_back": True,
+                "raw_response": response.content[:500],
+                **({"batch": [a.action for a in actions]} if len(actions) > 1 else {}),
+            },
+            tokens_used=response.total_input_tokens + response.output_tokens,
+        ))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to record rolled-back heartbeat for bot {bot_id}: {e}")
+
+
+async def run_web_search(bot: Bot, action: BotAction) -> dict:
+    """Run a web_search action's query; touches no database state.
+
+    Network-bound, so callers run it before any of a heartbeat's writes are
+    flushed: an open SQLite write transaction held across this await would
+    block every other writer on the event loop.
+    """
+    query = action.query or ""
+    if not query:
+        return {"success": False, "action": "web_search", "error": "No query provided"}
+    try:
+        search_results = await _wiki_search.search(query, max_results=3)
+    except Exception as e:
+        logger.warning(f"Wikipedia search failed for bot {bot.id}: {e}")
+        return {
+            "success": False,
+            "action": "web_search",
+            "query": query,
+            "error": str(e),
+        }
+    logger.info(f"Bot {bot.id} searched Wikipedia for: {query} ({len(search_results)} results)")
+    return {
+        "success": True,
+        "action": "web_search",
+        "query": query,
+        "results": search_results,
+        "result_count": len(search_results),
+    }
+
+
+async def execute_action(
+    bot: Bot,
+    action: BotAction,
+    db: Session,
+    engaged_bot_ids: list[str] | None = None,
+    search_result: dict | None = None,
+) -> dict:
+    """Execute the bot's chosen action.
+
+    Writes are flushed but not committed; the caller owns the transaction.
+    Ids of other bots whose content the action targeted are appended to
+    ``engaged_bot_ids`` so the caller can wake them once the action commits.
+    A web_search uses ``search_result`` from run_web_search when given.
+    """
     result = {"success": False, "action": action.action}
+    if engaged_bot_ids is None:
+        engaged_bot_ids = []
 
     if action.action == "create_thread":
         thread = Thread(
@@ -168,8 +174,7 @@ async def execute_action(bot: Bot, action: BotAction, db: Session) -> dict:
             tags=action.tags or [],
         )
         db.add(thread)
-        db.commit()
-        db.refresh(thread)
+        db.flush()
         result = {
             "success": True,
             "action": "create_thread",
@@ -187,13 +192,11 @@ async def execute_action(bot: Bot, action: BotAction, db: Session) -> dict:
                 parent_reply_id=action.parent_reply_id,
             )
             db.add(reply)
-            db.commit()
-            db.refresh(reply)
             # Update last_reply_at on the parent thread
-            parent_thread = db.query(Thread).filter(Thread.id == action.thread_id).first()
-            if parent_thread:
-                parent_thread.last_reply_at = datetime.utcnow()
-                db.commit()
+            thread_obj = db.query(Thread).filter(Thread.id == action.thread_id).first()
+            if thread_obj:
+                thread_obj.last_reply_at = clock.utcnow()
+            db.flush()
             result = {
                 "success": True,
                 "action": "reply",
@@ -202,45 +205,25 @@ async def execute_action(bot: Bot, action: BotAction, db: Session) -> dict:
                 "content": (action.content or "")[:200],
             }
             # Record interaction with thread author
-            thread_obj = db.query(Thread).filter(Thread.id == action.thread_id).first()
             if thread_obj and thread_obj.author_bot_id != bot.id:
                 event = f"Replied to thread \"{thread_obj.title[:50]}\""
-                record_interaction(db, bot.id, thread_obj.author_bot_id, event=event)
+                record_interaction(db, bot.id, thread_obj.author_bot_id, event=event, commit=False)
                 result["other_bot_id"] = thread_obj.author_bot_id
+                engaged_bot_ids.append(thread_obj.author_bot_id)
             # Record interaction with parent reply author if replying to a specific reply
             if action.parent_reply_id:
                 parent = db.query(Reply).filter(Reply.id == action.parent_reply_id).first()
                 if parent and parent.author_bot_id != bot.id:
                     event = f"Replied to their comment in thread #{action.thread_id}"
-                    record_interaction(db, bot.id, parent.author_bot_id, event=event)
+                    record_interaction(db, bot.id, parent.author_bot_id, event=event, commit=False)
                     result["other_bot_id"] = parent.author_bot_id
+                    engaged_bot_ids.append(parent.author_bot_id)
             logger.info(f"Bot {bot.id} replied to thread {action.thread_id}")
         else:
             result = {"success": False, "action": "reply", "error": "No thread_id provided"}
 
     elif action.action == "web_search":
-        query = action.query or ""
-        if query:
-            try:
-                search_results = await _wiki_search.search(query, max_results=3)
-                result = {
-                    "success": True,
-                    "action": "web_search",
-                    "query": query,
-                    "results": search_results,
-                    "result_count": len(search_results),
-                }
-                logger.info(f"Bot {bot.id} searched Wikipedia for: {query} ({len(search_results)} results)")
-            except Exception as e:
-                logger.warning(f"Wikipedia search failed for bot {bot.id}: {e}")
-                result = {
-                    "success": False,
-                    "action": "web_search",
-                    "query": query,
-                    "error": str(e),
-                }
-        else:
-            result = {"success": False, "action": "web_search", "error": "No query provided"}
+        result = search_result if search_result is not None else await run_web_search(bot, action)
 
     elif action.action == "vote":
         # Determine target type and id
@@ -270,7 +253,7 @@ async def execute_action(bot: Bot, action: BotAction, db: Session) -> dict:
             existing.value = vote_value
             if old_value != vote_value:
                 _update_author_reputation(db, target_type, target_id, vote_value, old_value)
-            db.commit()
+            db.flush()
             result = {
                 "success": True,
                 "action": "vote",
@@ -289,7 +272,7 @@ async def execute_action(bot: Bot, action: BotAction, db: Session) -> dict:
             )
             db.add(vote)
             _update_author_reputation(db, target_type, target_id, vote_value)
-            db.commit()
+            db.flush()
             result = {
                 "success": True,
                 "action": "vote",
@@ -303,14 +286,16 @@ async def execute_action(bot: Bot, action: BotAction, db: Session) -> dict:
             vote_target = db.query(Thread).filter(Thread.id == target_id).first()
             if vote_target and vote_target.author_bot_id != bot.id:
                 event = f"{vote_label.capitalize()} their thread \"{vote_target.title[:50]}\""
-                record_interaction(db, bot.id, vote_target.author_bot_id, event=event)
+                record_interaction(db, bot.id, vote_target.author_bot_id, event=event, commit=False)
                 result["other_bot_id"] = vote_target.author_bot_id
+                engaged_bot_ids.append(vote_target.author_bot_id)
         elif target_type == "reply":
             vote_target = db.query(Reply).filter(Reply.id == target_id).first()
             if vote_target and vote_target.author_bot_id != bot.id:
                 event = f"{vote_label.capitalize()} their reply in thread #{vote_target.thread_id}"
-                record_interaction(db, bot.id, vote_target.author_bot_id, event=event)
+                record_interaction(db, bot.id, vote_target.author_bot_id, event=event, commit=False)
                 result["other_bot_id"] = vote_target.author_bot_id
+                engaged_bot_ids.append(vote_target.author_bot_id)
         logger.info(f"Bot {bot.id} voted on {target_type} {target_id}")
 
     elif action.action == "do_nothing":
@@ -324,9 +309,15 @@ async def execute_action(bot: Bot, action: BotAction, db: Session) -> dict:
     return result
 
 
-async def heartbeat(bot_id: str, db: Session) -> dict:
-    """Execute a single heartbeat for a bot."""
+async def heartbeat(bot_id: str, db: Session, reason: HeartbeatReason = "scheduled") -> dict:
+    """Execute a single heartbeat for a bot.
+
+    ``reason`` is what started it. Early wakeups skip the fast path: they
+    were requested because of engagement (a reply, mention or vote) that
+    the feed version can't see, so a fast-path skip would waste the wakeup.
+    """
     logger.info(f"Starting heartbeat for bot {bot_id}")
+    timer = StageTimer()
 
     # Get bot
     bot = db.query(Bot).filter(Bot.id == bot_id).first()
@@ -348,7 +339,8 @@ async def heartbeat(bot_id: str, db: Session) -> dict:
         return {"success": True, "action": "do_nothing", "reason": "Bot is paused by admin"}
 
     # Check daily usage cap before calling LLM
-    allowed, cap_reason = check_usage_cap(db, bot_id)
+    with timer.stage("usage_cap"):
+        allowed, cap_reason = check_usage_cap(db, bot_id)
     if not allowed:
         log = ActivityLog(
             bot_id=bot_id,
@@ -361,113 +353,178 @@ async def heartbeat(bot_id: str, db: Session) -> dict:
         logger.info(f"Bot {bot_id} capped: {cap_reason}")
         return {"success": True, "action": "do_nothing", "reason": cap_reason}
 
+    # One feed snapshot serves both the fast path and the prompt
+    with timer.stage("feed"):
+        feed_snapshot = get_feed_snapshot(db)
+
+    # Sit out quiet ticks without paying for a prompt
+    skip_reason = None
+    if reason != "wakeup":
+        with timer.stage("fast_path"):
+            skip_reason = check_fast_path(db, bot, feed_snapshot)
+    if skip_reason:
+        log = ActivityLog(
+            bot_id=bot_id,
+            action_type="do_nothing",
+            details={"reason": skip_reason, "skipped_llm": True},
+            tokens_used=0,
+        )
+        db.add(log)
+        db.commit()
+        logger.info(f"Bot {bot_id} skipped the LLM: {skip_reason}")
+        return {"success": True, "action": "do_nothing", "reason": skip_reason, "skipped_llm": True}
+
     # Build prompt
-    prompt = build_prompt(bot, db)
+    with timer.stage("build_prompt"):
+        prompt = build_prompt(bot, db, timer=timer, feed_snapshot=feed_snapshot)
 
-    # Get LLM config from bot
+    # Get LLM config from bot; the route picks its provider and model
     model_config = bot.personality_config.get("model", {})
-    model = model_config.get("model", "claude-sonnet-4-5-20250929")
+    route = resolve_route(bot.personality_config, "heartbeat")
+    model = route.model
     temperature = model_config.get("temperature", 0.8)
     max_tokens = model_config.get("max_tokens", 1000)
 
-    # Call LLM
-    llm = get_llm_client()
+    # Call LLM; when streaming, generation stops as soon as the last wanted action is complete
+    settings = get_settings()
+    max_actions = get_max_actions(bot)
+    stream_parser = ActionStreamParser(max_actions)
     try:
-        response = await llm.think(
-            prompt=prompt,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        llm = route.client
+        with timer.stage("llm"):
+            if settings.llm_action_mode == "tools":
+                response = await llm.think_tools(
+                    prompt=prompt,
+                    tools=ACTION_TOOLS,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    max_calls=max_actions,
+                )
+            elif settings.llm_stream_enabled:
+                response = await llm.think_stream(
+                    prompt=prompt,
+                    on_text=stream_parser.feed,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            else:
+                response = await llm.think(
+                    prompt=prompt,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
     except Exception as e:
         logger.error(f"LLM call failed for bot {bot_id}: {e}")
         return {"success": False, "error": str(e)}
 
-    # Record token usage
-    from api.app.config import get_settings
-    provider = get_settings().llm_provider
-    record_usage(db, bot_id, response.input_tokens, response.output_tokens, provider)
+    if response.queued_ms:
+        # Part of the llm stage, spent waiting on the provider's rate limiter
+        timer.stages["llm.queue"] = response.queued_ms
 
-    # Parse action
-    action = parse_bot_action(response.content)
+    provider = route.provider
+    tokens_used = response.total_input_tokens + response.output_tokens
 
-    # Execute action
-    result = await execute_action(bot, action, db)
-
-    # Run auto-moderation checks
+    # Parse actions (already done for tool calls, and for as much as the stream delivered)
+    with timer.stage("parse"):
+        if response.tool_calls:
+            parsed = [action_from_tool_call(call) for call in response.tool_calls]
+        else:
+            if not stream_parser.text:
+                stream_parser.feed(response.content)
+            parsed = stream_parser.finish()
+        actions = finalize_actions(parsed[:max_actions])
+
+    # Everything the actions write, their token usage, the activity logs and
+    # the perf row are staged in this session and committed once; if any
+    # stage fails every action in the batch rolls back. An action that is
+    # merely refused (e.g. a duplicate vote) doesn't stop the ones after it.
+    results: list[dict] = []
+    engaged: list[list[str]] = []
+    logs: list[ActivityLog] = []
     try:
-        _run_auto_moderation(db, bot_id, action, result)
-    except Exception as e:
-        logger.warning(f"Auto-moderation failed for {bot_id}: {e}")
-
-    # Log activity (include reputation_score for time-series tracking)
-    db.refresh(bot)
-    log = ActivityLog(
-        bot_id=bot_id,
-        action_type=action.action,
-        details={
-            **result,
-            "raw_response": response.content[:500],  # Truncate for storage
-            "reputation_score": bot.reputation_score,
-        },
-        tokens_used=response.input_tokens + response.output_tokens,
-    )
-    db.add(log)
-    db.commit()
-
-    # Store web search results as facts in warm memory
-    if result.get("success") and action.action == "web_search":
-        from api.app.memory.warm import update_warm_memory
-
-        date_str = datetime.utcnow().strftime("%Y-%m-%d")
-        search_facts = []
-        for sr in result.get("results", []):
-            extract = sr.get("extract", "")
-            if extract:
-                search_facts.append({
-                    "fact": extract[:200],
-                    "source": "wikipedia",
-                    "date": date_str,
-                })
-        if search_facts:
-            try:
-                update_warm_memory(db, bot_id, facts=search_facts)
-                logger.debug(f"Stored {len(search_facts)} Wikipedia facts for {bot_id}")
-            except Exception as e:
-                logger.warning(f"Failed to store search facts for {bot_id}: {e}")
-
-    # Extract memories from this activity (async, non-blocking)
-    if result.get("success") and action.action in ["create_thread", "reply", "vote"]:
-        try:
-            await extract_memories(
-                db=db,
+        with timer.stage("execute_action"):
+            # Searches await the network, so they all run before the first
+            # write of the batch takes the SQLite write lock
+            searches = {
+                index: await run_web_search(bot, action)
+                for index, action in enumerate(actions)
+                if action.action == "web_search"
+            }
+            for index, action in enumerate(actions):
+                engaged_bot_ids: list[str] = []
+                results.append(await execute_action(bot, action, db, engaged_bot_ids, searches.get(index)))
+                engaged.append(engaged_bot_ids)
+
+        with timer.stage("record_usage"):
+            _record_response_usage(db, bot_id, response, provider)
+
+        if prompt.read_position:
+            advance_read_cursor(db, bot_id, *prompt.read_position, commit=False)
+
+        # Log each action (include reputation_score for time-series tracking);
+        # the response's tokens are counted once, on the first
+        db.refresh(bot)
+        for index, (action, result) in enumerate(zip(actions, results)):
+            log = ActivityLog(
                 bot_id=bot_id,
-                bot_name=bot.name,
                 action_type=action.action,
-                action_details=result,
+                details={
+                    **result,
+                    "raw_response": response.content[:500],  # Truncate for storage
+                    "action_mode": settings.llm_action_mode,
+                    "reputation_score": bot.reputation_score,
+                    **({"batch_index": index, "batch_size": len(actions)} if len(actions) > 1 else {}),
+                    **({"prompt_truncated": prompt.truncated} if prompt.truncated else {}),
+                    **({"stream_stopped_early": True} if response.stopped_early else {}),
+                    **({"parse_repaired": True} if action.repaired else {}),
+                    **({"parse_failed": True} if action.parse_failed else {}),
+                },
+                tokens_used=tokens_used if index == 0 else 0,
             )
-        except Exception as e:
-            logger.warning(f"Memory extraction failed for {bot_id}: {e}")
+            db.add(log)
+            logs.append(log)
 
-    # Check if warm memory needs compression to cold
-    try:
-        await maybe_compress_to_cold(db, bot_id)
-    except Exception as e:
-        logger.warning(f"Cold memory compression check failed for {bot_id}: {e}")
-
-    # Broadcast to WebSocket clients
-    try:
-        await ws_manager.broadcast({
-            "type": "heartbeat_complete",
-            "bot_id": bot_id,
-            "bot_name": bot.name,
-            "action": action.action,
-            "details": {k: v for k, v in result.items() if k != "raw_response"},
-            "tokens_used": response.input_tokens + response.output_tokens,
-            "timestamp": datetime.utcnow().isoformat(),
-        })
+        # Critical-path stage timings; event consumers add theirs when done
+        perf = HeartbeatPerf(
+            bot_id=bot_id,
+            provider=provider,
+            total_ms=timer.total_ms(),
+            stages=dict(timer.stages),
+        )
+        db.add(perf)
+        db.commit()
     except Exception as e:
-        logger.debug(f"WebSocket broadcast failed: {e}")
-
-    logger.info(f"Heartbeat complete for bot {bot_id}: {action.action}")
-    return result
+        db.rollback()
+        batch = ", ".join(action.action for action in actions)
+        logger.error(f"Heartbeat for bot {bot_id} failed, rolled back {batch}: {e}")
+        _record_failed_heartbeat(db, bot_id, actions, response, provider, str(e))
+        return {"success": False, "action": actions[0].action, "error": str(e)}
+
+    succeeded = [(a, r, ids) for a, r, ids in zip(actions, results, engaged) if r.get("success")]
+    if any(action.action in ("create_thread", "reply") for action, _, _ in succeeded):
+        invalidate_feed_cache()
+    for action, _, engaged_bot_ids in succeeded:
+        _emit_wakeups(db, bot, action, engaged_bot_ids)
+
+    # The actions are durable; moderation, memory and compression consume
+    # these events off the critical path
+    for index, (action, result, log) in enumerate(zip(actions, results, logs)):
+        await event_bus.publish(HeartbeatEvent(
+            type=ACTION_EVENT_TYPES.get(action.action, "idle"),
+            bot_id=bot_id,
+            bot_name=bot.name,
+            action=action,
+            result=result,
+            activity_log_id=log.id,
+            tokens_used=tokens_used if index == 0 else 0,
+            perf_id=perf.id,
+            batch_log_ids=[batch_log.id for batch_log in logs],
+        ))
+
+    logger.info(f"Heartbeat complete for bot {bot_id}: {', '.join(a.action for a in actions)}")
+    if len(actions) == 1:
+        return results[0]
+    return {**results[0], "actions": results}
@@ -0,0 +1,86 @@
+"""Heartbeat stage timing."""
+
+import logging
+import time
+from contextlib import contextmanager
+
+from api.app.database import SessionLocal
+from api.app.models.perf import HeartbeatPerf
+
+
+logger = logging.getLogger(__name__)
+
+
+class StageTimer:
+    """Accumulate wall-clock durations (ms) for named heartbeat stages."""
+
+    def __init__(self):
+        self.stages: dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = round((time.perf_counter() - started) * 1000)
+            self.stages[name] = self.stages.get(name, 0) + elapsed
+
+    def total_ms(self) -> int:
+        return round((time.perf_counter() - self._started) * 1000)
+
+
+@contextmanager
+def maybe_stage(timer: StageTimer | None, name: str):
+    """Time a stage if a timer was given, otherwise do nothing."""
+    if timer is None:
+        yield
+    else:
+        with timer.stage(name):
+            yield
+
+
+def record_post_processing(perf_id: int, stages: dict[str, int]) -> None:
+    """Add event-bus consumer durations to a heartbeat's perf row.
+
+    Each action of a multi-action heartbeat is its own event with the same
+    perf row, so a consumer's stage accumulates across the batch.
+    """
+    if not stages:
+        return
+    db = SessionLocal()
+    try:
+        row = db.get(HeartbeatPerf, perf_id)
+        if row:
+            merged = dict(row.stages)
+            for name, ms in stages.items():
+                merged[name] = merged.get(name, 0) + ms
+            row.stages = merged
+            db.commit()
+    except Exception as e:
+        logger.debug(f"Failed to record post-processing timings for perf {perf_id}: {e}")
+    finally:
+        db.close()
+
+
+def percentile(sorted_values: list[int], pct: float) -> int:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(samples: dict[str, list[int]]) -> dict[str, dict]:
+    """p50/p95/p99 per stage from {stage: [ms, ...]}."""
+    summary = {}
+    for stage, values in sorted(samples.items()):
+        values = sorted(values)
+        summary[stage] = {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+        }
+    return summary
@@ -0,0 +1,231 @@
+"""Heartbeat post-processing, run as event bus subscribers after an action is durable.
+
+Each consumer opens its own session, so moderation, memory extraction and
+cold compression proceed independently of the heartbeat that published the
+event (and of each other).
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Collection
+from datetime import timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+
+from api.app import clock
+from api.app.database import SessionLocal
+from api.app.models.activity_log import ActivityLog
+from api.app.models.moderation import ContentFlag
+from api.app.orchestrator.action_parser import BotAction
+from api.app.orchestrator.events import EventBus, HeartbeatEvent
+from api.app.orchestrator.perf import record_post_processing
+from api.app.memory.extractor import extract_memories
+from api.app.memory.cold import maybe_compress_to_cold
+from api.app.memory.warm import update_warm_memory
+
+
+logger = logging.getLogger(__name__)
+
+# Serializes warm-memory writers per bot (extraction, compression, search facts)
+_memory_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+def memory_lock(bot_id: str) -> asyncio.Lock:
+    """The lock held while rewriting a bot's warm memory across an await."""
+    return _memory_locks[bot_id]
+
+
+# Stopwords for Jaccard overlap
+_STOPWORDS = frozenset(
+    "a an the is are was were be been being have has had do does did will would "
+    "shall should may might can could of in to for on with at by from and or but "
+    "not no nor so yet both either neither each every all any few more most other "
+    "some such that this these those i me my we us our you your he him his she her "
+    "it its they them their what which who whom how when where why am if then than".split()
+)
+
+
+def _jaccard_overlap(text_a: str, text_b: str) -> float:
+    """Compute Jaccard word overlap between two texts."""
+    words_a = set(text_a.lower().split()) - _STOPWORDS
+    words_b = set(text_b.lower().split()) - _STOPWORDS
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def _run_auto_moderation(
+    db: Session, bot_id: str, action: BotAction, result: dict, exclude_log_ids: Collection[int] = (),
+):
+    """Run auto-moderation checks after a bot action. Creates ContentFlag if issues found.
+
+    Args:
+        exclude_log_ids: The action's own log entry and those of the other
+            actions from the same LLM response, excluded from the repetition
+            and frequency checks: they share one raw response and timestamp,
+            so a batch isn't counted against itself.
+    """
+    if action.action not in ("create_thread", "reply"):
+        return
+
+    content = action.content or ""
+
+    # Low quality: under 20 characters
+    if len(content.strip()) < 20:
+        target_type = "thread" if action.action == "create_thread" else "reply"
+        target_id = result.get("thread_id") if action.action == "create_thread" else result.get("reply_id")
+        if target_id:
+            flag = ContentFlag(
+                target_type=target_type,
+                target_id=target_id,
+                flag_type="low_quality",
+                flagged_by="auto",
+            )
+            db.add(flag)
+            logger.info(f"Auto-flag: low quality content from {bot_id}")
+
+    # Repetition: Jaccard overlap > 0.6 with last 3 posts
+    recent_logs = (
+        db.query(ActivityLog)
+        .filter(
+            ActivityLog.bot_id == bot_id,
+            ActivityLog.action_type.in_(["create_thread", "reply"]),
+            ActivityLog.id.notin_(exclude_log_ids),
+        )
+        .order_by(ActivityLog.created_at.desc())
+        .limit(3)
+        .all()
+    )
+    for log_entry in recent_logs:
+        prev_content = (log_entry.details or {}).get("raw_response", "")
+        if prev_content and _jaccard_overlap(content, prev_content) > 0.6:
+            target_type = "thread" if action.action == "create_thread" else "reply"
+            target_id = result.get("thread_id") if action.action == "create_thread" else result.get("reply_id")
+            if target_id:
+                flag = ContentFlag(
+                    target_type=target_type,
+                    target_id=target_id,
+                    flag_type="repetitive",
+                    flagged_by="auto",
+                )
+                db.add(flag)
+                logger.info(f"Auto-flag: repetitive content from {bot_id}")
+            break  # One flag per action is enough
+
+    # Frequency cap: 5+ posts in the last hour
+    one_hour_ago = clock.utcnow().replace(microsecond=0)
+    one_hour_ago = one_hour_ago - timedelta(hours=1)
+    recent_count = (
+        db.query(func.count(ActivityLog.id))
+        .filter(
+            ActivityLog.bot_id == bot_id,
+            ActivityLog.action_type.in_(["create_thread", "reply"]),
+            ActivityLog.created_at >= one_hour_ago,
+            ActivityLog.id.notin_(exclude_log_ids),
+        )
+        .scalar() or 0
+    )
+    if recent_count >= 5:
+        target_type = "thread" if action.action == "create_thread" else "reply"
+        target_id = result.get("thread_id") if action.action == "create_thread" else result.get("reply_id")
+        if target_id:
+            flag = ContentFlag(
+                target_type=target_type,
+                target_id=target_id,
+                flag_type="frequency",
+                flagged_by="auto",
+            )
+            db.add(flag)
+            logger.info(f"Auto-flag: frequency cap for {bot_id}")
+
+    db.commit()
+
+
+async def moderate_content(event: HeartbeatEvent):
+    """Auto-moderate new threads and replies."""
+    db = SessionLocal()
+    try:
+        exclude_log_ids = {event.activity_log_id, *event.batch_log_ids}
+        _run_auto_moderation(db, event.bot_id, event.action, event.result, exclude_log_ids)
+    finally:
+        db.close()
+
+
+async def store_search_facts(event: HeartbeatEvent):
+    """Store web search results as facts in warm memory."""
+    if not event.result.get("success"):
+        return
+
+    date_str = event.timestamp.strftime("%Y-%m-%d")
+    search_facts = []
+    for sr in event.result.get("results", []):
+        extract = sr.get("extract", "")
+        if extract:
+            search_facts.append({
+                "fact": extract[:200],
+                "source": "wikipedia",
+                "date": date_str,
+            })
+    if not search_facts:
+        return
+
+    async with _memory_locks[event.bot_id]:
+        db = SessionLocal()
+        try:
+            update_warm_memory(db, event.bot_id, facts=search_facts)
+            logger.debug(f"Stored {len(search_facts)} Wikipedia facts for {event.bot_id}")
+        finally:
+            db.close()
+
+
+async def extract_event_memories(event: HeartbeatEvent):
+    """Extract memories from a successful post or vote."""
+    if not event.result.get("success"):
+        return
+
+    async with _memory_locks[event.bot_id]:
+        db = SessionLocal()
+        try:
+            await extract_memories(
+                db=db,
+                bot_id=event.bot_id,
+                bot_name=event.bot_name,
+                action_type=event.action.action,
+                action_details=event.result,
+            )
+        finally:
+            db.close()
+
+
+async def compress_memories(event: HeartbeatEvent):
+    """Check if warm memory needs compression to cold."""
+    async with _memory_locks[event.bot_id]:
+        db = SessionLocal()
+        try:
+            await maybe_compress_to_cold(db, event.bot_id)
+        finally:
+            db.close()
+
+
+def register_post_processors(bus: EventBus):
+    """Subscribe the heartbeat post-processing consumers to a bus."""
+    bus.subscribe("moderation", moderate_content, {"thread_created", "reply_posted"}, concurrency=1)
+    bus.subscribe("search_facts", store_search_facts, {"search_done"}, concurrency=1)
+    bus.subscribe(
+        "memory_extraction",
+        extract_event_memories,
+        {"thread_created", "reply_posted", "vote_cast"},
+        concurrency=3,
+    )
+    bus.subscribe("cold_compression", compress_memories, concurrency=1)
+
+
+def _record_event_timings(event: HeartbeatEvent):
+    """Persist consumer durations into the heartbeat's perf row."""
+    if event.perf_id is not None:
+        record_post_processing(event.perf_id, event.stage_ms)
+
+
+event_bus = EventBus(on_complete=_record_event_timings)
+register_post_processors(event_bus)
@@ -1,19 +1,95 @@
 """System prompt builder for bot heartbeats."""
 
+import re
+import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from sqlalchemy.orm import Session
 
+from api.app import clock
+from api.app.config import get_settings
+from api.app.database import SessionLocal
 from api.app.models.thread import Thread
 from api.app.models.reply import Reply
 from api.app.models.activity_log import ActivityLog
 from api.app.models.bot import Bot
+from api.app.models.read_cursor import BotReadCursor
 from api.app.memory.warm import get_warm_memory
 from api.app.memory.filter import filter_relevant_memories, format_filtered_memories
+from api.app.llm.client import NATIVE_TOOL_PROVIDERS, StructuredPrompt
+from api.app.llm.router import resolve_route
+from api.app.orchestrator.feed import (
+    FeedSnapshot, feed_read_position, get_feed_snapshot, get_read_cursor, render_feed,
+)
+from api.app.orchestrator.budget import estimate_tokens, fit_text
+from api.app.orchestrator.perf import StageTimer, maybe_stage
+from api.app.orchestrator.scheduler_state import get_scheduler_state, set_scheduler_state
+from api.app.orchestrator.templates import CompiledTemplate, get_compiled_template
 
 
-TEMPLATE_PATH = Path(__file__).parent.parent.parent / "templates" / "system_prompt.txt"
+TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
+TEMPLATE_PATH = TEMPLATE_DIR / "system_prompt.txt"
+
+# "Your Actions" section: the full JSON format, or a short list of tools
+# when the provider takes actions as native tool calls
+ACTIONS_JSON_PATH = TEMPLATE_DIR / "actions_json.txt"
+ACTIONS_TOOLS_PATH = TEMPLATE_DIR / "actions_tools.txt"
+# Appended to the JSON format when a heartbeat may take several actions
+ACTIONS_MULTI_PATH = TEMPLATE_DIR / "actions_multi.txt"
+
+# permissions.rate_limit in bot configs, e.g. "10_actions_per_heartbeat"
+_RATE_LIMIT = re.compile(r"^(\d+)_actions_per_heartbeat$")
+
+# Volatile sections in the order they get the remaining token budget, and
+# the boundary each is cut at when it doesn't fit
+BUDGETED_SECTIONS = [
+    ("current_feed", "\n\n"),
+    ("recent_own_posts", "\n"),
+    ("warm_memory", "\n"),
+    ("hot_memory", "\n"),
+]
+
+
+@dataclass
+class _StaticPrompt:
+    """A bot's template with its identity, guidance and roster already filled in."""
+    token: str | None  # Prompt cache token it was built under
+    shared_prefix: str  # Template text before the first placeholder; the same for every bot
+    bot_prefix: str  # Static sections up to the first volatile placeholder
+    volatile: CompiledTemplate  # The rest, rendered every heartbeat
+
+
+# Per-bot partially rendered templates
+_static_prompts: dict[str, _StaticPrompt] = {}
+
+# Roster line per bot, and the prompt cache token it was built under
+_roster: dict = {"built": False, "token": None, "lines": {}}
+
+# Scheduler state key holding the prompt cache token
+PROMPT_CACHE_STATE = "prompt_cache"
+
+
+def invalidate_prompt_cache() -> None:
+    """Drop cached static prompt sections after bots are created or reconfigured.
+
+    Also stores a fresh cache token, so other processes (e.g. the worker
+    running heartbeats) drop theirs before building their next prompt.
+    """
+    _static_prompts.clear()
+    _roster["built"] = False
+    db = SessionLocal()
+    try:
+        set_scheduler_state(db, PROMPT_CACHE_STATE, {"token": uuid.uuid4().hex})
+    finally:
+        db.close()
+
+
+def _prompt_cache_token(db: Session) -> str | None:
+    """The token of the last prompt cache invalidation in any process."""
+    state = get_scheduler_state(db, PROMPT_CACHE_STATE)
+    return state.get("token") if state else None
 
 
 def load_template() -> str:
@@ -120,24 +196,31 @@ Action tendencies for your personality:
     return "\n\n".join(guidance)
 
 
+def _roster_lines(db: Session, token: str | None) -> dict[str, str]:
+    """Roster line for every bot, rebuilt only after a cache invalidation."""
+    if not _roster["built"] or _roster["token"] != token:
+        lines = {}
+        for bot in db.query(Bot).all():
+            config = bot.personality_config
+            traits = ", ".join(config.get("personality", {}).get("traits", ["unknown"]))
+            lines[bot.id] = f"- {bot.name} (id: {bot.id}): {traits}"
+        _roster.update(built=True, token=token, lines=lines)
+    return _roster["lines"]
+
+
 def get_bot_roster(db: Session, exclude_bot_id: str) -> str:
     """Get list of other bots for social context."""
-    bots = db.query(Bot).filter(Bot.id != exclude_bot_id).all()
-    if not bots:
+    lines = _roster_lines(db, _prompt_cache_token(db))
+    roster = [line for bot_id, line in lines.items() if bot_id != exclude_bot_id]
+    if not roster:
         return "You are currently the only active bot in this community."
 
-    roster = []
-    for bot in bots:
-        config = bot.personality_config
-        traits = ", ".join(config.get("personality", {}).get("traits", ["unknown"]))
-        roster.append(f"- {bot.name} (id: {bot.id}): {traits}")
-
     return "\n".join(roster)
 
 
 def get_hot_memory(db: Session, bot_id: str, hours: int = 48) -> str:
     """Get recent activity for hot memory tier."""
-    cutoff = datetime.utcnow() - timedelta(hours=hours)
+    cutoff = clock.utcnow() - timedelta(hours=hours)
 
     logs = (
         db.query(ActivityLog)
@@ -192,35 +275,22 @@ def get_recent_own_posts(db: Session, bot_id: str, limit: int = 8) -> str:
 
 def get_current_feed(db: Session, limit: int = 10) -> str:
     """Get current threads for bot to engage with."""
-    threads = (
-        db.query(Thread)
-        .order_by(Thread.created_at.desc())
-        .limit(limit)
-        .all()
-    )
-
-    if not threads:
-        return "No threads yet. You could start one!"
+    return get_feed_snapshot(db, limit).text
 
-    feed = []
-    for thread in threads:
-        reply_count = len(thread.replies)
-        feed.append(f"[Thread #{thread.id}: \"{thread.title}\" by {thread.author_bot_id} - {reply_count} replies]")
-        feed.append(f"  {thread.content[:400]}")
-
-        # Show recent replies with more content so bots can respond to specifics
-        recent_replies = thread.replies[-5:]
-        for reply in recent_replies:
-            prefix = f"  > {reply.author_bot_id}"
-            if reply.parent_reply_id:
-                parent = next((r for r in thread.replies if r.id == reply.parent_reply_id), None)
-                if parent:
-                    prefix += f" (replying to {parent.author_bot_id})"
-            feed.append(f"{prefix}: {reply.content[:300]}")
 
-        feed.append("")
+def get_unseen_feed(
+    db: Session, bot_id: str, limit: int = 10, snapshot: FeedSnapshot | None = None,
+) -> tuple[str, FeedSnapshot, BotReadCursor | None]:
+    """The feed as the bot last left it: what it has already read collapses to stubs.
 
-    return "\n".join(feed)
+    Returns the feed text with the snapshot and read cursor it was rendered
+    from, for working out the read position once the feed has been budgeted.
+    Pass ``snapshot`` to reuse one the heartbeat already took.
+    """
+    snapshot = snapshot or get_feed_snapshot(db, limit)
+    cursor = get_read_cursor(db, bot_id)
+    text = snapshot.text if cursor is None else render_feed(snapshot.threads, cursor)
+    return text, snapshot, cursor
 
 
 def get_warm_memory_context(db: Session, bot_id: str, feed_text: str) -> str:
@@ -233,19 +303,65 @@ def get_warm_memory_context(db: Session, bot_id: str, feed_text: str) -> str:
     return format_filtered_memories(filtered)
 
 
-def build_prompt(bot: Bot, db: Session) -> str:
-    """Build the complete system prompt for a bot heartbeat."""
-    template = load_template()
-    config = bot.personality_config
+def get_max_actions(bot: Bot) -> int:
+    """Most actions the bot may take in one heartbeat.
 
-    # Extract personality details
-    personality = config.get("personality", {})
-    identity = config.get("identity", {})
+    The ``max_actions_per_heartbeat`` setting, capped by the bot's own
+    ``permissions.rate_limit`` when it sets one.
+    """
+    limit = get_settings().max_actions_per_heartbeat
+    rate_limit = bot.personality_config.get("permissions", {}).get("rate_limit")
+    match = _RATE_LIMIT.match(str(rate_limit or ""))
+    if match:
+        limit = min(limit, int(match.group(1)))
+    return max(1, limit)
 
-    # Get feed first for memory filtering
-    current_feed = get_current_feed(db)
 
-    variables = {
+def get_action_instructions(max_actions: int = 1, provider: str | None = None) -> str:
+    """The "Your Actions" section for the configured action mode and the bot's provider."""
+    settings = get_settings()
+    native_tools = (
+        settings.llm_action_mode == "tools"
+        and (provider or settings.llm_provider).lower() in NATIVE_TOOL_PROVIDERS
+    )
+    if native_tools:
+        choice = "exactly ONE action by calling one of your tools"
+        if max_actions > 1:
+            choice = f"up to {max_actions} actions, one tool call each, in the order to apply them"
+        return get_compiled_template(ACTIONS_TOOLS_PATH).render({"action_choice": choice}).rstrip("\n")
+
+    choice = "exactly ONE action" if max_actions <= 1 else f"up to {max_actions} actions"
+    instructions = get_compiled_template(ACTIONS_JSON_PATH).render({"action_choice": choice}).rstrip("\n")
+    if max_actions > 1:
+        multi = get_compiled_template(ACTIONS_MULTI_PATH).render({"max_actions": max_actions})
+        instructions += "\n" + multi.rstrip("\n")
+    return instructions
+
+
+def _get_static_prompt(bot: Bot, db: Session) -> _StaticPrompt:
+    """The bot's template with every section that only changes with its config filled in.
+
+    Bots are only created or reconfigured through paths that call
+    ``invalidate_prompt_cache``, so a cached prompt is reused until the
+    shared cache token changes (one primary-key read per heartbeat).
+    Template file edits are picked up on the next invalidation, which
+    includes the bot sync at startup.
+    """
+    token = _prompt_cache_token(db)
+    cached = _static_prompts.get(bot.id)
+    if cached is not None and cached.token == token:
+        return cached
+
+    template = get_compiled_template(TEMPLATE_PATH)
+    provider = resolve_route(bot.personality_config, "heartbeat").provider
+    action_instructions = get_action_instructions(get_max_actions(bot), provider)
+    config = bot.personality_config
+    personality = config.get("personality", {})
+    identity = config.get("identity", {})
+    # Action instructions are the same for every bot with the same action
+    # limit, so they belong to the shared prefix
+    shared = template.partial({"action_instructions": action_instructions})
+    partial = shared.partial({
         "bot_name": bot.name,
         "bot_id": bot.id,
         "personality_traits": ", ".join(personality.get("traits", [])),
@@ -255,17 +371,105 @@ def build_prompt(bot: Bot, db: Session) -> str:
         "origin_story": identity.get("origin_story", "Created to explore and interact"),
         "engagement_guidance": get_engagement_guidance(config),
         "bot_roster": get_bot_roster(db, bot.id),
-        "hot_memory": get_hot_memory(db, bot.id),
-        "warm_memory": get_warm_memory_context(db, bot.id, current_feed),
-        "recent_own_posts": get_recent_own_posts(db, bot.id),
+    })
+    static_prompt = _StaticPrompt(
+        token=token,
+        shared_prefix=shared.head,
+        bot_prefix=partial.head[len(shared.head):],
+        volatile=partial.tail(),
+    )
+    _static_prompts[bot.id] = static_prompt
+    return static_prompt
+
+
+def get_max_input_tokens(bot: Bot) -> int:
+    """The bot's prompt budget: ``model.max_input_tokens`` or the global default."""
+    override = bot.personality_config.get("model", {}).get("max_input_tokens")
+    return override or get_settings().prompt_max_input_tokens
+
+
+def _fit_sections(
+    static_prompt: "_StaticPrompt", variables: dict, max_input_tokens: int,
+) -> dict[str, int]:
+    """Trim budgeted sections in ``variables`` so the prompt fits max_input_tokens.
+
+    Sections are filled in BUDGETED_SECTIONS order from whatever the fixed
+    text leaves. Returns the estimated tokens dropped per trimmed section.
+    """
+    budgeted = {name: variables[name] for name, _ in BUDGETED_SECTIONS}
+    fixed = (
+        static_prompt.shared_prefix
+        + static_prompt.bot_prefix
+        + static_prompt.volatile.render({**variables, **{name: "" for name in budgeted}})
+    )
+    remaining = max_input_tokens - estimate_tokens(fixed)
+
+    truncated = {}
+    for name, separator in BUDGETED_SECTIONS:
+        text, dropped = fit_text(budgeted[name], max(0, remaining), separator)
+        variables[name] = text
+        remaining -= estimate_tokens(text)
+        if dropped:
+            truncated[name] = dropped
+    return truncated
+
+
+def build_prompt(
+    bot: Bot, db: Session, timer: StageTimer | None = None, feed_snapshot: FeedSnapshot | None = None,
+) -> StructuredPrompt:
+    """Build the complete system prompt for a bot heartbeat.
+
+    Only the volatile sections (feed, memories, own posts, reputation and
+    time) are rendered per heartbeat; the rest comes from the bot's cached
+    static prompt. If a timer is given, each section is timed as
+    ``build_prompt.<section>``.
+
+    The result keeps the template's stable prefix separate so providers can
+    cache it: the text before the first placeholder is shared by every bot,
+    and the text up to the first volatile placeholder is stable per bot.
+    Static sections must therefore come before volatile ones in the template.
+
+    The feed, own posts and memories are trimmed in priority order to keep
+    the whole prompt within the bot's max input tokens; what was cut is
+    reported in ``truncated``. The feed only shows in full what is new
+    since the bot's read cursor; ``read_position`` is where to advance it,
+    short of any unread posts the budget cut. ``feed_snapshot`` reuses the
+    snapshot the heartbeat already took for the fast path.
+    """
+    with maybe_stage(timer, "build_prompt.static"):
+        static_prompt = _get_static_prompt(bot, db)
+
+    # Get feed first for memory filtering
+    with maybe_stage(timer, "build_prompt.feed"):
+        current_feed, feed_snapshot, read_cursor = get_unseen_feed(db, bot.id, snapshot=feed_snapshot)
+    with maybe_stage(timer, "build_prompt.hot_memory"):
+        hot_memory = get_hot_memory(db, bot.id)
+    with maybe_stage(timer, "build_prompt.warm_memory"):
+        warm_memory = get_warm_memory_context(db, bot.id, current_feed)
+    with maybe_stage(timer, "build_prompt.own_posts"):
+        recent_own_posts = get_recent_own_posts(db, bot.id)
+
+    variables = {
+        "hot_memory": hot_memory,
+        "warm_memory": warm_memory,
+        "recent_own_posts": recent_own_posts,
         "current_feed": current_feed,
         "reputation_score": bot.reputation_score,
-        "current_datetime": datetime.utcnow().isoformat(),
+        "current_datetime": clock.utcnow().isoformat(),
     }
 
-    # Replace template variables
-    prompt = template
-    for key, value in variables.items():
-        prompt = prompt.replace("{{" + key + "}}", str(value))
-
-    return prompt
+    with maybe_stage(timer, "build_prompt.budget"):
+        truncated = _fit_sections(static_prompt, variables, get_max_input_tokens(bot))
+        # Only what survived the budget counts as read
+        if "current_feed" in truncated:
+            read_position = feed_read_position(feed_snapshot, read_cursor, variables["current_feed"])
+        else:
+            read_position = (feed_snapshot.last_thread_id, feed_snapshot.last_reply_id)
+
+    with maybe_stage(timer, "build_prompt.render"):
+        return StructuredPrompt(
+            prefix_blocks=[static_prompt.shared_prefix, static_prompt.bot_prefix],
+            suffix=static_prompt.volatile.render(variables),
+            truncated=truncated,
+            read_position=read_position,
+        )
@@ -1,72 +1,468 @@
 """Heartbeat scheduler using APScheduler."""
 
+import asyncio
+import json
 import logging
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+)
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 
 from api.app.config import get_settings
 from api.app.database import SessionLocal
 from api.app.models.bot import Bot
-from api.app.orchestrator.heartbeat import heartbeat
+from api.app.models.scheduler import HeartbeatTrigger
+from api.app.orchestrator.heartbeat import HeartbeatReason, heartbeat
+from api.app.orchestrator.scheduler_state import (
+    SCHEDULER_LEASE,
+    cancel_trigger,
+    claim_triggers,
+    enqueue_trigger,
+    finish_trigger,
+    get_lease_holder,
+    get_scheduler_state,
+    purge_triggers,
+    set_scheduler_state,
+)
+from api.app.orchestrator.wakeups import WAKEUP_JOB_PREFIX
 
 
 logger = logging.getLogger(__name__)
 
-scheduler = AsyncIOScheduler()
+_settings = get_settings()
+scheduler = AsyncIOScheduler(job_defaults={
+    # A job never overlaps itself; late runs are skipped past the grace
+    # period, and a backlog of missed runs collapses into one when coalescing
+    "max_instances": 1,
+    "misfire_grace_time": _settings.scheduler_misfire_grace_seconds,
+    "coalesce": _settings.scheduler_coalesce,
+})
 
 # Track current pace (in seconds)
 _current_pace: int = 14400  # Default: 4 hours
 
+# Summary of the most recently completed tick
+_last_tick: dict | None = None
+
+# Job id prefix for per-bot jobs in staggered mode
+BOT_JOB_PREFIX = "heartbeat_bot_"
+
+# How often staggered mode checks for added/removed bots (seconds)
+BOT_JOB_SYNC_INTERVAL = 300
+
+# Bots with a heartbeat currently running in this process
+_in_flight: set[str] = set()
+
+# The full tick currently running, if any; concurrent requests join it
+_tick_task: asyncio.Task | None = None
+
+# Overlap, misfire and tick counters since this process started
+_counters: Counter = Counter()
+
+# Seconds between each heartbeat job's scheduled and actual start
+_lag = {"last_seconds": 0.0, "max_seconds": 0.0, "total_seconds": 0.0, "samples": 0}
+
+# How often the scheduler owner checks for queued manual triggers, and a
+# forwarding process for their results (seconds)
+TRIGGER_POLL_SECONDS = 1.0
+
+# Manual triggers older than this are deleted (seconds)
+TRIGGER_RETENTION_SECONDS = 86400
+
+# Manual triggers this process is running on behalf of other processes
+_trigger_tasks: set[asyncio.Task] = set()
+
 
 async def run_weekly_cold_compression():
-    """Run cold memory compression for all bots (weekly backup job)."""
+    """Run cold memory compression for all bots (weekly backup job).
+
+    Each bot is compressed on its own session under the same per-bot lock
+    as the event-bus memory writers, so extractions committed while the
+    summary is generated aren't overwritten from a stale warm-memory copy.
+    """
     from api.app.memory.cold import compress_to_cold
+    from api.app.orchestrator.post_processing import memory_lock
 
     logger.info("Running weekly cold memory compression for all bots")
     db = SessionLocal()
     try:
-        bots = db.query(Bot).all()
-        for bot in bots:
+        bot_ids = [bot_id for (bot_id,) in db.query(Bot.id).all()]
+    finally:
+        db.close()
+
+    for bot_id in bot_ids:
+        async with memory_lock(bot_id):
+            db = SessionLocal()
             try:
-                await compress_to_cold(db, bot.id)
+                await compress_to_cold(db, bot_id)
             except Exception as e:
-                logger.error(f"Cold compression failed for bot {bot.id}: {e}")
+                logger.error(f"Cold compression failed for bot {bot_id}: {e}")
+            finally:
+                db.close()
+
+
+async def _guarded_heartbeat(bot_id: str, reason: HeartbeatReason = "scheduled") -> dict:
+    """Run a bot's heartbeat on its own session unless one is already in flight.
+
+    Every heartbeat this process runs (ticks, staggered jobs, wakeups and
+    manual triggers) goes through here, so a bot never heartbeats twice at once.
+    """
+    if bot_id in _in_flight:
+        _counters["bot_overlaps_skipped"] += 1
+        logger.warning(f"Heartbeat for bot {bot_id} skipped: previous one still in flight")
+        return {"success": False, "skipped": True, "error": "Heartbeat already in flight"}
+
+    _in_flight.add(bot_id)
+    db = SessionLocal()
+    try:
+        return await heartbeat(bot_id, db, reason)
+    except Exception as e:
+        logger.error(f"Heartbeat failed for bot {bot_id}: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        db.close()
+        _in_flight.discard(bot_id)
+
+
+async def _run_bot_heartbeat(bot_id: str, semaphore: asyncio.Semaphore) -> dict:
+    """Run one bot's heartbeat within a tick, bounded by the tick semaphore."""
+    async with semaphore:
+        started = time.perf_counter()
+        result = await _guarded_heartbeat(bot_id)
+
+    return {
+        "bot_id": bot_id,
+        "success": result.get("success", False),
+        "action": result.get("action"),
+        "skipped": result.get("skipped", False),
+        "duration_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+async def run_all_heartbeats() -> dict:
+    """Run heartbeat for all active bots.
+
+    Up to ``heartbeat_concurrency`` bots run at once, each with its own
+    session, so tick duration tracks the slowest bot rather than the sum.
+    A call made while a tick is already running joins that tick instead of
+    starting a second one, and gets its summary marked ``coalesced``.
+    """
+    global _tick_task
+    if _tick_task is not None and not _tick_task.done():
+        _counters["ticks_coalesced"] += 1
+        logger.info("Tick already in flight; joining it instead of starting another")
+        return {**await asyncio.shield(_tick_task), "coalesced": True}
+
+    _tick_task = asyncio.create_task(_run_tick())
+    return await asyncio.shield(_tick_task)
+
+
+async def _run_tick() -> dict:
+    """Run one full tick and record its summary."""
+    global _last_tick
+    _counters["ticks_started"] += 1
+    concurrency = max(1, get_settings().heartbeat_concurrency)
+    pace = get_current_pace()
+    logger.info(f"Running scheduled heartbeats for all bots (concurrency={concurrency})")
+
+    db = SessionLocal()
+    try:
+        bot_ids = [bot_id for (bot_id,) in db.query(Bot.id).all()]
     finally:
         db.close()
 
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(concurrency)
+    results = await asyncio.gather(
+        *(_run_bot_heartbeat(bot_id, semaphore) for bot_id in bot_ids)
+    )
+    wall_time = time.perf_counter() - started
 
-async def run_all_heartbeats():
-    """Run heartbeat for all active bots."""
-    logger.info("Running scheduled heartbeats for all bots")
+    slowest = max(results, key=lambda r: r["duration_seconds"], default=None)
+    _last_tick = {
+        "bots": len(results),
+        "succeeded": sum(1 for r in results if r["success"]),
+        "concurrency": concurrency,
+        "wall_time_seconds": round(wall_time, 3),
+        "sum_bot_seconds": round(sum(r["duration_seconds"] for r in results), 3),
+        "slowest_bot_id": slowest["bot_id"] if slowest else None,
+        "slowest_bot_seconds": slowest["duration_seconds"] if slowest else 0.0,
+        "pace_seconds": pace,
+        "utilization": round(wall_time / pace, 3) if pace else None,
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "results": list(results),
+    }
+    _counters["ticks_completed"] += 1
+    if wall_time > pace:
+        _counters["ticks_overran"] += 1
+        logger.warning(
+            f"Tick took {wall_time:.0f}s, longer than the {pace}s pace; "
+            f"the next tick will be late or skipped"
+        )
 
     db = SessionLocal()
     try:
-        bots = db.query(Bot).all()
-        for bot in bots:
-            try:
-                await heartbeat(bot.id, db)
-            except Exception as e:
-                logger.error(f"Heartbeat failed for bot {bot.id}: {e}")
+        set_scheduler_state(db, "last_tick", _last_tick)
+    except Exception as e:
+        logger.warning(f"Failed to persist tick summary: {e}")
     finally:
         db.close()
+    logger.info(
+        f"Tick complete: {_last_tick['succeeded']}/{len(results)} bots in "
+        f"{wall_time:.2f}s (slowest {_last_tick['slowest_bot_seconds']:.2f}s)"
+    )
+    return _last_tick
 
 
-def start_scheduler():
-    """Start the heartbeat scheduler."""
-    global _current_pace
-    settings = get_settings()
-    _current_pace = settings.heartbeat_interval
+async def run_bot_heartbeat(bot_id: str, reason: HeartbeatReason = "scheduled") -> dict:
+    """Run a scheduled heartbeat (or early wakeup) for a single bot on its own session."""
+    return await _guarded_heartbeat(bot_id, reason)
 
-    # Add job to run heartbeats at configured interval
-    scheduler.add_job(
-        run_all_heartbeats,
-        trigger=IntervalTrigger(seconds=_current_pace),
-        id="heartbeat_all",
-        name="Run heartbeats for all bots",
-        replace_existing=True,
+
+def _is_regular_job(job_id: str) -> bool:
+    """Whether a job is a recurring heartbeat job (not a one-off wakeup)."""
+    return job_id == "heartbeat_all" or job_id.startswith(BOT_JOB_PREFIX)
+
+
+def _is_heartbeat_job(job_id: str) -> bool:
+    return _is_regular_job(job_id) or job_id.startswith(WAKEUP_JOB_PREFIX)
+
+
+def _on_job_event(event: JobEvent) -> None:
+    """Count missed and overlapping heartbeat runs and track start lag."""
+    if not _is_heartbeat_job(event.job_id):
+        return
+
+    if event.code in (EVENT_JOB_EXECUTED, EVENT_JOB_ERROR):
+        # A regular job's next run time has moved on; save it for restarts
+        if _is_regular_job(event.job_id):
+            persist_schedule()
+        return
+
+    if event.code == EVENT_JOB_MISSED:
+        _counters["runs_missed"] += 1
+        logger.warning(
+            f"Job {event.job_id} missed its {event.scheduled_run_time.isoformat()} run "
+            f"(more than {get_settings().scheduler_misfire_grace_seconds}s late)"
+        )
+    elif event.code == EVENT_JOB_MAX_INSTANCES:
+        _counters["runs_skipped_overlap"] += 1
+        logger.warning(f"Job {event.job_id} skipped: its previous run is still in flight")
+    elif event.code == EVENT_JOB_SUBMITTED and event.scheduled_run_times:
+        lag = max(0.0, (datetime.now(timezone.utc) - event.scheduled_run_times[-1]).total_seconds())
+        _lag["last_seconds"] = round(lag, 3)
+        _lag["max_seconds"] = round(max(_lag["max_seconds"], lag), 3)
+        _lag["total_seconds"] += lag
+        _lag["samples"] += 1
+
+
+scheduler.add_listener(
+    _on_job_event,
+    EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES | EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR,
+)
+
+
+def _phase_time(job) -> datetime:
+    """A job's next run time without jitter, so restarts don't drift its phase."""
+    trigger = job.trigger
+    if not isinstance(trigger, IntervalTrigger) or not trigger.jitter:
+        return job.next_run_time
+    periods = round((job.next_run_time - trigger.start_date).total_seconds() / trigger.interval_length)
+    return trigger.start_date + timedelta(seconds=periods * trigger.interval_length)
+
+
+def persist_schedule() -> None:
+    """Store the pace and each regular heartbeat job's next run time.
+
+    ``start_scheduler`` reads this back so a restart resumes every job's
+    phase instead of resetting all bots to the same start time.
+    """
+    if not scheduler.running:
+        return
+    state = {
+        "mode": get_settings().scheduler_mode.lower(),
+        "interval_seconds": _current_pace,
+        "next_runs": {
+            job_id: run_at.isoformat() for job_id, run_at in _live_next_runs().items()
+        },
+    }
+    db = SessionLocal()
+    try:
+        set_scheduler_state(db, "schedule", state)
+    except Exception as e:
+        logger.warning(f"Failed to persist schedule: {e}")
+    finally:
+        db.close()
+
+
+def _load_resume_times(interval_seconds: int) -> dict[str, datetime]:
+    """Persisted next run times, if they were saved for the same mode and pace."""
+    db = SessionLocal()
+    try:
+        state = get_scheduler_state(db, "schedule")
+    finally:
+        db.close()
+
+    if (
+        not state
+        or state.get("mode") != get_settings().scheduler_mode.lower()
+        or state.get("interval_seconds") != interval_seconds
+    ):
+        return {}
+    return {job_id: datetime.fromisoformat(at) for job_id, at in state.get("next_runs", {}).items()}
+
+
+def _live_next_runs() -> dict[str, datetime]:
+    """Next (unjittered) run times of this process's regular heartbeat jobs."""
+    return {
+        job.id: _phase_time(job)
+        for job in scheduler.get_jobs()
+        if _is_regular_job(job.id) and job.next_run_time
+    }
+
+
+def _is_recently_due(run_at: datetime, now: datetime) -> bool:
+    """Whether a persisted run came due while we were down, within the misfire grace."""
+    return run_at <= now and (now - run_at).total_seconds() <= get_settings().scheduler_misfire_grace_seconds
+
+
+def _is_staggered() -> bool:
+    return get_settings().scheduler_mode.lower() == "staggered"
+
+
+def _scheduled_bot_ids() -> set[str]:
+    """Bot ids that currently have a per-bot heartbeat job."""
+    return {
+        job.id[len(BOT_JOB_PREFIX):]
+        for job in scheduler.get_jobs()
+        if job.id.startswith(BOT_JOB_PREFIX)
+    }
+
+
+def _schedule_staggered_jobs(interval_seconds: int, resume: dict[str, datetime] | None = None) -> None:
+    """Lay out one heartbeat job per bot, evenly phase-offset across the interval.
+
+    Bot i (in stable id order) first fires at ``(i + 1) * slot`` from now, where
+    ``slot = interval / N``, then every ``interval`` seconds with up to
+    ``stagger_jitter_fraction * slot`` of random jitter.
+
+    Bots with a time in ``resume`` keep that phase instead. Runs that came due
+    within the misfire grace are queued one slot apart from now; older ones
+    wait for their next run in phase.
+    """
+    db = SessionLocal()
+    try:
+        bot_ids = sorted(bot_id for (bot_id,) in db.query(Bot.id).all())
+    finally:
+        db.close()
+
+    for stale_id in _scheduled_bot_ids() - set(bot_ids):
+        scheduler.remove_job(f"{BOT_JOB_PREFIX}{stale_id}")
+    if scheduler.get_job("heartbeat_all"):
+        scheduler.remove_job("heartbeat_all")
+
+    if not bot_ids:
+        return
+
+    slot = interval_seconds / len(bot_ids)
+    jitter = int(slot * get_settings().stagger_jitter_fraction) or None
+    now = datetime.now(timezone.utc)
+    resume = resume or {}
+    overdue = 0
+    for i, bot_id in enumerate(bot_ids):
+        job_id = f"{BOT_JOB_PREFIX}{bot_id}"
+        start_date = resume.get(job_id)
+        if start_date is None:
+            start_date = now + timedelta(seconds=(i + 1) * slot)
+        elif _is_recently_due(start_date, now):
+            start_date = now + timedelta(seconds=overdue * slot)
+            overdue += 1
+        scheduler.add_job(
+            run_bot_heartbeat,
+            trigger=IntervalTrigger(
+                seconds=interval_seconds,
+                start_date=start_date,
+                jitter=jitter,
+            ),
+            args=[bot_id],
+            id=job_id,
+            name=f"Heartbeat for {bot_id}",
+            replace_existing=True,
+        )
+
+    logger.info(
+        f"Staggered {len(bot_ids)} bot heartbeat(s) every {interval_seconds}s, "
+        f"one every {slot:.0f}s (jitter up to {jitter or 0}s, "
+        f"{len(resume.keys() & {f'{BOT_JOB_PREFIX}{b}' for b in bot_ids})} resumed)"
     )
 
+
+def sync_bot_jobs() -> None:
+    """Re-lay out per-bot jobs if bots were added or removed (staggered mode)."""
+    db = SessionLocal()
+    try:
+        bot_ids = {bot_id for (bot_id,) in db.query(Bot.id).all()}
+    finally:
+        db.close()
+
+    if bot_ids != _scheduled_bot_ids():
+        # Existing bots keep their phase; only new bots get fresh slots
+        _schedule_staggered_jobs(_current_pace, resume=_live_next_runs())
+
+
+def _add_heartbeat_jobs() -> int:
+    """Add (or replace) the heartbeat jobs for the persisted pace and phases.
+
+    Uses the pace and job phases persisted by the previous scheduler owner,
+    falling back to ``heartbeat_interval`` and a fresh layout. Returns the
+    number of job phases resumed.
+    """
+    global _current_pace
+    _current_pace = get_persisted_pace() or get_settings().heartbeat_interval
+    resume = _load_resume_times(_current_pace)
+
+    if _is_staggered():
+        # One phase-offset job per bot, spread across the interval
+        _schedule_staggered_jobs(_current_pace, resume=resume)
+        scheduler.add_job(
+            sync_bot_jobs,
+            trigger=IntervalTrigger(seconds=BOT_JOB_SYNC_INTERVAL),
+            id="bot_jobs_sync",
+            name="Sync per-bot heartbeat jobs",
+            replace_existing=True,
+        )
+    else:
+        # Add job to run heartbeats at configured interval, keeping the
+        # previous phase; a tick that came due during a restart runs now
+        start_date = resume.get("heartbeat_all")
+        if start_date is not None and _is_recently_due(start_date, datetime.now(timezone.utc)):
+            start_date = datetime.now(timezone.utc)
+        scheduler.add_job(
+            run_all_heartbeats,
+            trigger=IntervalTrigger(seconds=_current_pace, start_date=start_date),
+            id="heartbeat_all",
+            name="Run heartbeats for all bots",
+            replace_existing=True,
+        )
+    return len(resume)
+
+
+def start_scheduler():
+    """Start the heartbeat scheduler, resuming the persisted pace and phases."""
+    settings = get_settings()
+    resumed = _add_heartbeat_jobs()
+
     # Weekly cold memory compression (Sunday 3am)
     scheduler.add_job(
         run_weekly_cold_compression,
@@ -77,27 +473,76 @@ def start_scheduler():
     )
 
     scheduler.start()
+    persist_schedule()
     logger.info(
-        f"Scheduler started. Heartbeats every {_current_pace} seconds "
-        f"({_current_pace / 3600:.1f} hours)"
+        f"Scheduler started ({settings.scheduler_mode} mode). Heartbeats every "
+        f"{_current_pace} seconds ({_current_pace / 3600:.1f} hours)"
+        + (f", resuming {resumed} job phase(s)" if resumed else "")
     )
 
 
+def resume_scheduler():
+    """Resume a paused scheduler on reacquiring the lease.
+
+    Jobs are re-laid out from the state persisted by the owner in between,
+    so a stale paused schedule doesn't fire a burst of overdue runs.
+    """
+    resumed = _add_heartbeat_jobs()
+    scheduler.resume()
+    persist_schedule()
+    logger.info(f"Scheduler resumed, {resumed} job phase(s) restored")
+
+
 def get_current_pace() -> int:
-    """Get current pace in seconds."""
-    return _current_pace
+    """Get current pace in seconds.
 
+    Processes that don't run the scheduler (e.g. API replicas alongside a
+    standalone worker, or a standby whose scheduler is paused) report the
+    pace persisted in the database.
+    """
+    if runs_schedule():
+        return _current_pace
+    return get_persisted_pace() or _current_pace
 
-def update_pace(interval_seconds: int) -> None:
-    """Update the heartbeat interval dynamically."""
+
+def get_last_tick() -> dict | None:
+    """Get the summary of the most recently completed tick.
+
+    Falls back to the persisted summary after a restart or in processes
+    that don't run ticks themselves.
+    """
+    if _last_tick is not None:
+        return _last_tick
+    db = SessionLocal()
+    try:
+        return get_scheduler_state(db, "last_tick")
+    finally:
+        db.close()
+
+
+def get_persisted_pace() -> int | None:
+    """Get the pace last set by an operator, as stored in the database."""
+    db = SessionLocal()
+    try:
+        state = get_scheduler_state(db, "pace")
+    finally:
+        db.close()
+    return state.get("interval_seconds") if state else None
+
+
+def _apply_pace(interval_seconds: int) -> None:
+    """Reschedule this process's heartbeat jobs to a new interval."""
     global _current_pace
     _current_pace = interval_seconds
 
-    # Reschedule the job with new interval
-    scheduler.reschedule_job(
-        "heartbeat_all",
-        trigger=IntervalTrigger(seconds=interval_seconds),
-    )
+    # Reschedule with new interval
+    if _is_staggered():
+        _schedule_staggered_jobs(interval_seconds)
+    else:
+        scheduler.reschedule_job(
+            "heartbeat_all",
+            trigger=IntervalTrigger(seconds=interval_seconds),
+        )
 
     logger.info(
         f"Pace updated. Heartbeats every {interval_seconds} seconds "
@@ -105,6 +550,33 @@ def update_pace(interval_seconds: int) -> None:
     )
 
 
+def update_pace(interval_seconds: int) -> None:
+    """Update the heartbeat interval dynamically.
+
+    The pace is persisted so whichever process owns the scheduler picks it
+    up; if that is this process, it is applied immediately.
+    """
+    global _current_pace
+    db = SessionLocal()
+    try:
+        set_scheduler_state(db, "pace", {"interval_seconds": interval_seconds})
+    finally:
+        db.close()
+
+    if scheduler.running:
+        _apply_pace(interval_seconds)
+    else:
+        _current_pace = interval_seconds
+        logger.info(f"Pace set to {interval_seconds} seconds; the scheduler owner will apply it")
+
+
+def sync_pace_from_db() -> None:
+    """Apply a pace change made by another process (scheduler owner only)."""
+    persisted = get_persisted_pace()
+    if persisted and persisted != _current_pace:
+        _apply_pace(persisted)
+
+
 def stop_scheduler():
     """Stop the scheduler."""
     scheduler.shutdown()
@@ -113,9 +585,220 @@ def stop_scheduler():
 
 async def trigger_heartbeat(bot_id: str) -> dict:
     """Manually trigger a heartbeat for a specific bot."""
+    return await _guarded_heartbeat(bot_id, "manual")
+
+
+def runs_schedule() -> bool:
+    """Whether this process currently owns scheduling (started and not paused)."""
+    return scheduler.state == STATE_RUNNING
+
+
+def _should_forward() -> bool:
+    """Whether manual triggers belong to another process's scheduler."""
+    if runs_schedule():
+        return False
+    db = SessionLocal()
+    try:
+        return get_lease_holder(db, SCHEDULER_LEASE) is not None
+    finally:
+        db.close()
+
+
+async def _forward_trigger(bot_id: str | None) -> dict:
+    """Queue a manual trigger for the scheduler owner and wait for its result."""
+    db = SessionLocal()
+    try:
+        trigger_id = enqueue_trigger(db, bot_id)
+    finally:
+        db.close()
+    logger.info(f"Manual trigger {trigger_id} ({bot_id or 'all bots'}) queued for the scheduler owner")
+
+    deadline = time.monotonic() + get_settings().manual_trigger_timeout_seconds
+    while time.monotonic() < deadline:
+        await asyncio.sleep(TRIGGER_POLL_SECONDS)
+        db = SessionLocal()
+        try:
+            trigger = db.get(HeartbeatTrigger, trigger_id)
+            if trigger is not None and trigger.status == "done":
+                return trigger.result
+        finally:
+            db.close()
+
+    db = SessionLocal()
+    try:
+        started = not cancel_trigger(db, trigger_id)
+    finally:
+        db.close()
+    return {
+        "success": False,
+        "timed_out": True,
+        "trigger_id": trigger_id,
+        "error": (
+            "Timed out waiting for the scheduler owner to finish the trigger" if started
+            else "The scheduler owner didn't pick up the trigger; it was withdrawn"
+        ),
+    }
+
+
+async def request_heartbeat(bot_id: str) -> dict:
+    """Manually trigger a bot's heartbeat in the process that owns the scheduler.
+
+    Running it anywhere else would bypass the owner's in-flight guard, so
+    while another process holds the scheduler lease the trigger is queued
+    for it and this call waits for the result. With no owner it runs here.
+    """
+    if _should_forward():
+        return await _forward_trigger(bot_id)
+    return await trigger_heartbeat(bot_id)
+
+
+async def request_tick() -> dict:
+    """Manually run a full tick in the process that owns the scheduler.
+
+    Forwarded like ``request_heartbeat``, so it joins a tick the owner is
+    already running rather than starting a second one alongside it.
+    """
+    if _should_forward():
+        return await _forward_trigger(None)
+    return await run_all_heartbeats()
+
+
+async def _run_trigger(trigger_id: int, bot_id: str | None) -> None:
+    """Run a claimed manual trigger and store its result."""
+    if bot_id is None:
+        result = await run_all_heartbeats()
+    else:
+        result = await trigger_heartbeat(bot_id)
+
+    db = SessionLocal()
+    try:
+        # Results cross processes as JSON
+        finish_trigger(db, trigger_id, json.loads(json.dumps(result, default=str)))
+    except Exception as e:
+        logger.error(f"Failed to store result of manual trigger {trigger_id}: {e}")
+    finally:
+        db.close()
+
+
+async def serve_manual_triggers(stop_event: asyncio.Event) -> None:
+    """Run manual triggers queued by other processes while this one owns scheduling."""
+    while not stop_event.is_set():
+        if runs_schedule():
+            db = SessionLocal()
+            try:
+                claimed = [(trigger.id, trigger.bot_id) for trigger in claim_triggers(db)]
+            except Exception as e:
+                logger.warning(f"Failed to claim manual triggers: {e}")
+                claimed = []
+            finally:
+                db.close()
+
+            for trigger_id, bot_id in claimed:
+                logger.info(f"Running manual trigger {trigger_id} ({bot_id or 'all bots'})")
+                task = asyncio.create_task(_run_trigger(trigger_id, bot_id))
+                _trigger_tasks.add(task)
+                task.add_done_callback(_trigger_tasks.discard)
+
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=TRIGGER_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+def purge_old_triggers() -> None:
+    """Delete manual triggers past their retention (scheduler owner only)."""
+    db = SessionLocal()
+    try:
+        purge_triggers(db, TRIGGER_RETENTION_SECONDS)
+    finally:
+        db.close()
+
+
+def _status_warnings(status: dict) -> list[str]:
+    """Explain, in operator terms, why the current pace may not be sustainable."""
+    warnings = []
+    counters = status["counters"]
+    last_tick = status["last_tick"]
+    if last_tick and (last_tick.get("utilization") or 0) >= 1:
+        warnings.append(
+            f"Last tick took {last_tick['wall_time_seconds']:.0f}s, longer than the "
+            f"{last_tick['pace_seconds']}s pace"
+        )
+    if counters.get("runs_missed"):
+        warnings.append(
+            f"{counters['runs_missed']} scheduled run(s) started more than "
+            f"{status['misfire_grace_seconds']}s late and were skipped"
+        )
+    if counters.get("runs_skipped_overlap"):
+        warnings.append(
+            f"{counters['runs_skipped_overlap']} scheduled run(s) were skipped because "
+            f"the previous run was still in flight"
+        )
+    if counters.get("bot_overlaps_skipped"):
+        warnings.append(
+            f"{counters['bot_overlaps_skipped']} bot heartbeat(s) were skipped because "
+            f"one was already in flight for that bot"
+        )
+    return warnings
+
+
+def get_scheduler_status() -> dict:
+    """Overlap, misfire and lag counters for this process's scheduler.
+
+    Processes that don't run the scheduler, or whose scheduler is paused,
+    report the snapshot last persisted by the scheduler owner.
+    """
+    if not runs_schedule():
+        db = SessionLocal()
+        try:
+            persisted = get_scheduler_state(db, "status")
+        finally:
+            db.close()
+        if persisted:
+            return {**persisted, "source": "persisted"}
+
+    settings = get_settings()
+    lag_samples = _lag["samples"]
+    status = {
+        "source": "local",
+        "running": scheduler.running,
+        "mode": settings.scheduler_mode,
+        "pace_seconds": get_current_pace(),
+        "misfire_grace_seconds": settings.scheduler_misfire_grace_seconds,
+        "coalesce": settings.scheduler_coalesce,
+        "tick_in_flight": _tick_task is not None and not _tick_task.done(),
+        "bots_in_flight": sorted(_in_flight),
+        "counters": {
+            key: _counters[key]
+            for key in (
+                "ticks_started",
+                "ticks_completed",
+                "ticks_coalesced",
+                "ticks_overran",
+                "runs_missed",
+                "runs_skipped_overlap",
+                "bot_overlaps_skipped",
+            )
+        },
+        "lag": {
+            "last_seconds": _lag["last_seconds"],
+            "max_seconds": _lag["max_seconds"],
+            "avg_seconds": round(_lag["total_seconds"] / lag_samples, 3) if lag_samples else 0.0,
+            "samples": lag_samples,
+        },
+        "last_tick": {k: v for k, v in _last_tick.items() if k != "results"} if _last_tick else None,
+    }
+    status["warnings"] = _status_warnings(status)
+    status["sustainable"] = not status["warnings"]
+    return status
+
+
+def persist_scheduler_status() -> None:
+    """Store this process's scheduler status for processes without a scheduler."""
+    status = get_scheduler_status()
+    status["updated_at"] = datetime.now(timezone.utc).isoformat()
     db = SessionLocal()
     try:
-        result = await heartbeat(bot_id, db)
-        return result
+        set_scheduler_state(db, "status", status)
     finally:
         db.close()
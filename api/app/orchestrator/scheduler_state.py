@@ -0,0 +1,172 @@
+"""Database-backed scheduler lease, shared scheduler state and manual trigger queue."""
+
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from api.app.models.scheduler import HeartbeatTrigger, SchedulerLease, SchedulerState
+
+
+logger = logging.getLogger(__name__)
+
+# Lease that gates who runs scheduled heartbeat ticks
+SCHEDULER_LEASE = "heartbeat_scheduler"
+
+
+def try_acquire_lease(db: Session, name: str, owner_id: str, ttl_seconds: int) -> bool:
+    """Acquire or renew a lease. Returns True if owner_id holds it afterwards.
+
+    The holder renews by calling again before ``ttl_seconds`` elapse; anyone
+    else can take the lease over once it has expired.
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+
+    # Renew our own lease
+    renewed = (
+        db.query(SchedulerLease)
+        .filter(SchedulerLease.name == name, SchedulerLease.owner_id == owner_id)
+        .update({"expires_at": expires_at}, synchronize_session=False)
+    )
+    if renewed:
+        db.commit()
+        return True
+
+    # Take over an expired lease
+    taken = (
+        db.query(SchedulerLease)
+        .filter(SchedulerLease.name == name, SchedulerLease.expires_at < now)
+        .update(
+            {"owner_id": owner_id, "acquired_at": now, "expires_at": expires_at},
+            synchronize_session=False,
+        )
+    )
+    if taken:
+        db.commit()
+        logger.info(f"Lease {name} acquired by {owner_id}")
+        return True
+
+    # First-ever acquisition
+    if db.get(SchedulerLease, name) is None:
+        db.add(SchedulerLease(name=name, owner_id=owner_id, acquired_at=now, expires_at=expires_at))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return False
+        logger.info(f"Lease {name} created by {owner_id}")
+        return True
+
+    db.rollback()
+    return False
+
+
+def release_lease(db: Session, name: str, owner_id: str) -> None:
+    """Release a lease we hold so another process can take over immediately."""
+    (
+        db.query(SchedulerLease)
+        .filter(SchedulerLease.name == name, SchedulerLease.owner_id == owner_id)
+        .update({"expires_at": datetime.utcnow()}, synchronize_session=False)
+    )
+    db.commit()
+
+
+def get_lease_holder(db: Session, name: str) -> SchedulerLease | None:
+    """Return the lease row if it is currently held (not expired)."""
+    return (
+        db.query(SchedulerLease)
+        .filter(
+            SchedulerLease.name == name,
+            SchedulerLease.expires_at >= datetime.utcnow(),
+        )
+        .first()
+    )
+
+
+def get_scheduler_state(db: Session, key: str) -> dict | None:
+    """Get a shared scheduler state value."""
+    row = db.get(SchedulerState, key)
+    return row.value if row else None
+
+
+def set_scheduler_state(db: Session, key: str, value: dict) -> None:
+    """Upsert a shared scheduler state value."""
+    row = db.get(SchedulerState, key)
+    if row:
+        row.value = value
+        row.updated_at = datetime.utcnow()
+    else:
+        db.add(SchedulerState(key=key, value=value))
+    db.commit()
+
+
+def enqueue_trigger(db: Session, bot_id: str | None) -> int:
+    """Queue a manual heartbeat (``None``: a full tick) for the scheduler owner."""
+    trigger = HeartbeatTrigger(bot_id=bot_id)
+    db.add(trigger)
+    db.commit()
+    return trigger.id
+
+
+def claim_triggers(db: Session) -> list[HeartbeatTrigger]:
+    """Mark pending triggers as running and return the ones this caller won.
+
+    Each claim is a conditional update, so a trigger is never run by two
+    processes even if a lease handoff briefly leaves two owners polling.
+    """
+    pending = [
+        trigger_id for (trigger_id,) in db.query(HeartbeatTrigger.id)
+        .filter(HeartbeatTrigger.status == "pending")
+        .order_by(HeartbeatTrigger.id)
+        .all()
+    ]
+    claimed = []
+    for trigger_id in pending:
+        won = (
+            db.query(HeartbeatTrigger)
+            .filter(HeartbeatTrigger.id == trigger_id, HeartbeatTrigger.status == "pending")
+            .update({"status": "running", "started_at": datetime.utcnow()}, synchronize_session=False)
+        )
+        db.commit()
+        if won:
+            claimed.append(trigger_id)
+    if not claimed:
+        return []
+    return db.query(HeartbeatTrigger).filter(HeartbeatTrigger.id.in_(claimed)).all()
+
+
+def finish_trigger(db: Session, trigger_id: int, result: dict) -> None:
+    """Store a trigger's result for the process waiting on it."""
+    (
+        db.query(HeartbeatTrigger)
+        .filter(HeartbeatTrigger.id == trigger_id)
+        .update(
+            {"status": "done", "result": result, "finished_at": datetime.utcnow()},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+
+
+def cancel_trigger(db: Session, trigger_id: int) -> bool:
+    """Withdraw a trigger that hasn't started. Returns False if it already has."""
+    cancelled = (
+        db.query(HeartbeatTrigger)
+        .filter(HeartbeatTrigger.id == trigger_id, HeartbeatTrigger.status == "pending")
+        .update({"status": "cancelled", "finished_at": datetime.utcnow()}, synchronize_session=False)
+    )
+    db.commit()
+    return bool(cancelled)
+
+
+def purge_triggers(db: Session, older_than_seconds: int) -> int:
+    """Delete triggers requested more than ``older_than_seconds`` ago."""
+    cutoff = datetime.utcnow() - timedelta(seconds=older_than_seconds)
+    deleted = (
+        db.query(HeartbeatTrigger)
+        .filter(HeartbeatTrigger.requested_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
@@ -0,0 +1,76 @@
+"""Prompt templates compiled once into literal text and placeholder slots."""
+
+import re
+from pathlib import Path
+
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+# Compiled templates by path, with the file mtime they were compiled from
+_compiled: dict[Path, tuple[float, "CompiledTemplate"]] = {}
+
+
+class CompiledTemplate:
+    """A ``{{placeholder}}`` template parsed into alternating literal and slot parts.
+
+    Rendering is a single join instead of one ``str.replace`` pass over the
+    whole text per variable, and values are never re-scanned for placeholders.
+    """
+
+    def __init__(self, source: str):
+        # Even indexes are literal text, odd indexes are placeholder names
+        self._parts = _PLACEHOLDER.split(source)
+
+    @classmethod
+    def _from_parts(cls, parts: list[str]) -> "CompiledTemplate":
+        template = cls.__new__(cls)
+        template._parts = parts
+        return template
+
+    @property
+    def placeholders(self) -> set[str]:
+        return set(self._parts[1::2])
+
+    @property
+    def head(self) -> str:
+        """Literal text before the first placeholder."""
+        return self._parts[0]
+
+    def tail(self) -> "CompiledTemplate":
+        """The template from its first placeholder onwards."""
+        return self._from_parts(["", *self._parts[1:]])
+
+    def render(self, values: dict) -> str:
+        """Fill every placeholder; unknown ones are left as ``{{name}}``."""
+        out = []
+        for i, part in enumerate(self._parts):
+            if i % 2 == 0:
+                out.append(part)
+            elif part in values:
+                out.append(str(values[part]))
+            else:
+                out.append("{{" + part + "}}")
+        return "".join(out)
+
+    def partial(self, values: dict) -> "CompiledTemplate":
+        """Fill the given placeholders now and keep the rest for a later render."""
+        parts = [self._parts[0]]
+        for i in range(1, len(self._parts), 2):
+            name, literal = self._parts[i], self._parts[i + 1]
+            if name in values:
+                parts[-1] += str(values[name]) + literal
+            else:
+                parts.extend([name, literal])
+        return self._from_parts(parts)
+
+
+def get_compiled_template(path: Path) -> CompiledTemplate:
+    """Compile a template file, reusing the result until the file changes."""
+    mtime = path.stat().st_mtime
+    cached = _compiled.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    template = CompiledTemplate(path.read_text(encoding="utf-8"))
+    _compiled[path] = (mtime, template)
+    return template
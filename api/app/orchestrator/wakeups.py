@@ -0,0 +1,110 @@
+"""Event-driven early heartbeats for bots whose content was engaged with."""
+
+import logging
+import re
+import time
+from datetime import datetime, timedelta, timezone
+
+from apscheduler.triggers.date import DateTrigger
+from sqlalchemy.orm import Session
+
+from api.app.config import get_settings
+from api.app.models.bot import Bot
+
+
+logger = logging.getLogger(__name__)
+
+# Job id prefix for pending early wakeups
+WAKEUP_JOB_PREFIX = "wakeup_"
+
+# Monotonic time of the last early wakeup scheduled per bot
+_last_wakeup: dict[str, float] = {}
+
+# When the first request behind each bot's pending wakeup arrived
+_pending_since: dict[str, datetime] = {}
+
+
+def mention_pattern(name: str, bot_id: str) -> re.Pattern:
+    """Match an explicit mention of a bot: ``@name`` or its id in any case,
+    or its display name as written.
+
+    Bare names are case-sensitive so names that are also ordinary words
+    ("Echo", "Sage") don't fire on prose like "echo chamber".
+    """
+    name, bot_id = re.escape(name), re.escape(bot_id)
+    return re.compile(rf"(?:@(?i:{name})|\b{name}|\b(?i:{bot_id}))\b")
+
+
+def find_mentioned_bots(db: Session, content: str, exclude_bot_id: str) -> list[str]:
+    """Return ids of bots mentioned in content (see mention_pattern)."""
+    if not content:
+        return []
+
+    mentioned = []
+    for bot_id, name in db.query(Bot.id, Bot.name).filter(Bot.id != exclude_bot_id).all():
+        if mention_pattern(name, bot_id).search(content):
+            mentioned.append(bot_id)
+    return mentioned
+
+
+def _next_regular_run(bot_id: str, scheduler) -> datetime | None:
+    """Next time the bot's regular (non-wakeup) heartbeat will fire."""
+    from api.app.orchestrator.scheduler import BOT_JOB_PREFIX
+
+    job = scheduler.get_job(f"{BOT_JOB_PREFIX}{bot_id}") or scheduler.get_job("heartbeat_all")
+    return job.next_run_time if job else None
+
+
+def request_wakeup(bot_id: str, reason: str) -> bool:
+    """Schedule a debounced, rate-limited early heartbeat for a bot.
+
+    Repeated requests within the debounce window collapse into a single
+    heartbeat that fires once the burst goes quiet, or at the latest
+    ``wakeup_max_delay_seconds`` after the first request. Requests are dropped when
+    the bot was woken early within ``wakeup_min_interval_seconds``, or when its
+    regular heartbeat is due before the debounced wakeup would fire.
+
+    Returns True if a wakeup was scheduled or pushed back.
+    """
+    from api.app.orchestrator.scheduler import scheduler, run_bot_heartbeat
+
+    settings = get_settings()
+    if not settings.wakeup_enabled or not scheduler.running:
+        return False
+
+    job_id = f"{WAKEUP_JOB_PREFIX}{bot_id}"
+    now = datetime.now(timezone.utc)
+    run_at = now + timedelta(seconds=settings.wakeup_debounce_seconds)
+    pending = scheduler.get_job(job_id) is not None
+    if pending:
+        # A steady stream of mentions mustn't postpone the wakeup forever
+        deadline = _pending_since.get(bot_id, now) + timedelta(seconds=settings.wakeup_max_delay_seconds)
+        run_at = max(now, min(run_at, deadline))
+
+    if not pending:
+        last = _last_wakeup.get(bot_id)
+        if last is not None and time.monotonic() - last < settings.wakeup_min_interval_seconds:
+            logger.debug(f"Wakeup for {bot_id} rate-limited ({reason})")
+            return False
+
+        next_regular = _next_regular_run(bot_id, scheduler)
+        if next_regular is not None and next_regular <= run_at:
+            logger.debug(f"Wakeup for {bot_id} skipped, regular heartbeat due first ({reason})")
+            return False
+
+        _last_wakeup[bot_id] = time.monotonic()
+        _pending_since[bot_id] = now
+
+    scheduler.add_job(
+        run_bot_heartbeat,
+        trigger=DateTrigger(run_date=run_at),
+        args=[bot_id, "wakeup"],
+        id=job_id,
+        name=f"Early wakeup for {bot_id}",
+        replace_existing=True,
+    )
+    logger.info(
+        f"{'Debounced' if pending else 'Scheduled'} early wakeup for {bot_id} "
+        f"at {run_at.isoformat()} ({reason})"
+    )
+    return True
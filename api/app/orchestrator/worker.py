@@ -0,0 +1,161 @@
+"""Standalone heartbeat worker.
+
+Owns scheduling and heartbeats so API processes can scale horizontally
+without each one running its own scheduler. Run with::
+
+    python -m api.app.orchestrator.worker
+
+Any number of workers (and API processes with ``EMBEDDED_SCHEDULER`` on) may
+run at once; they coordinate through a database lease so only the holder
+runs scheduled ticks. The others stand by and take over if it goes away.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+
+from api.app.config import get_settings
+from api.app.database import create_tables, SessionLocal
+from api.app.bot_loader import sync_bots_to_db
+from api.app.llm import close_llm_clients, start_llm_clients
+from api.app.llm.limiter import persist_limiter_stats
+from api.app.orchestrator.post_processing import event_bus
+from api.app.orchestrator.scheduler import (
+    persist_schedule,
+    persist_scheduler_status,
+    purge_old_triggers,
+    resume_scheduler,
+    scheduler,
+    serve_manual_triggers,
+    start_scheduler,
+    stop_scheduler,
+    sync_pace_from_db,
+)
+from api.app.orchestrator.scheduler_state import (
+    SCHEDULER_LEASE,
+    try_acquire_lease,
+    release_lease,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def make_owner_id() -> str:
+    """Unique id for this process as a lease holder."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _try_acquire(owner_id: str, ttl_seconds: int) -> bool:
+    db = SessionLocal()
+    try:
+        return try_acquire_lease(db, SCHEDULER_LEASE, owner_id, ttl_seconds)
+    except Exception as e:
+        logger.error(f"Lease check failed for {owner_id}: {e}")
+        return False
+    finally:
+        db.close()
+
+
+async def run_scheduler_with_lease(stop_event: asyncio.Event) -> None:
+    """Run the scheduler only while holding the scheduler lease.
+
+    Renews the lease every third of its TTL. The scheduler starts on first
+    acquisition, is paused if the lease is lost, and resumes on reacquisition.
+    While it owns the scheduler it also runs manual triggers queued by other
+    processes. Returns (releasing the lease) once ``stop_event`` is set.
+    """
+    settings = get_settings()
+    ttl = settings.scheduler_lease_ttl_seconds
+    owner_id = make_owner_id()
+    is_owner = False
+
+    logger.info(f"Scheduler lease loop started as {owner_id}")
+    triggers_task = asyncio.create_task(serve_manual_triggers(stop_event))
+    try:
+        while not stop_event.is_set():
+            held = _try_acquire(owner_id, ttl)
+
+            if held and not is_owner:
+                if scheduler.running:
+                    resume_scheduler()
+                else:
+                    start_scheduler()
+                is_owner = True
+                logger.info(f"{owner_id} now owns the heartbeat scheduler")
+            elif not held and is_owner:
+                scheduler.pause()
+                is_owner = False
+                logger.warning(f"{owner_id} lost the scheduler lease; pausing ticks")
+
+            if is_owner:
+                try:
+                    sync_pace_from_db()
+                    persist_scheduler_status()
+                    persist_limiter_stats()
+                    purge_old_triggers()
+                except Exception as e:
+                    logger.warning(f"Failed to sync scheduler state: {e}")
+
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=max(1, ttl / 3))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        await triggers_task
+        if is_owner:
+            persist_schedule()
+        if scheduler.running:
+            stop_scheduler()
+        if is_owner:
+            db = SessionLocal()
+            try:
+                release_lease(db, SCHEDULER_LEASE, owner_id)
+            finally:
+                db.close()
+        logger.info(f"Scheduler lease loop stopped for {owner_id}")
+
+
+async def run_worker() -> None:
+    """Prepare the database and run the lease-gated scheduler until signalled."""
+    create_tables()
+    db = SessionLocal()
+    try:
+        bots_loaded = sync_bots_to_db(db)
+        logger.info(f"Loaded {len(bots_loaded)} bot(s) from config")
+    finally:
+        db.close()
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    await start_llm_clients()
+    await event_bus.start()
+    try:
+        await run_scheduler_with_lease(stop_event)
+    finally:
+        await event_bus.stop()
+        await close_llm_clients()
+
+
+def main() -> None:
+    settings = get_settings()
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger.info("Starting Botastrophic heartbeat worker...")
+    asyncio.run(run_worker())
+    logger.info("Botastrophic heartbeat worker shutdown complete")
+
+
+if __name__ == "__main__":
+    main()
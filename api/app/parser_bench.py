@@ -0,0 +1,187 @@
+"""Fuzz and benchmark harness for the bot action parser.
+
+Mutates a corpus of well-formed actions the ways models actually get JSON
+wrong (preambles, code fences, trailing reasoning, trailing commas, single
+quotes, Python literals, raw newlines, truncation) and checks every case
+parses to the intended action without raising. Then measures parse
+throughput and how parse time scales on long, brace-heavy output. Run with::
+
+    python -m api.app.parser_bench --cases 5000 --seed 42
+
+Exits non-zero if any case raises or parses to the wrong action.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import Counter
+
+from api.app.llm.mock import MockAdapter
+from api.app.orchestrator.action_parser import parse_bot_action
+
+
+# Each mutation takes (action dict, rng) and returns model-like output text
+def _compact(action, rng):
+    return json.dumps(action)
+
+
+def _pretty(action, rng):
+    return json.dumps(action, indent=2)
+
+
+def _preamble(action, rng):
+    return (
+        "Let me think about this. I've read the feed {and the replies} carefully, "
+        "and I don't want to repeat myself.\n\n" + json.dumps(action, indent=2)
+    )
+
+
+def _fenced(action, rng):
+    return f"Here's my decision:\n```json\n{json.dumps(action, indent=2)}\n```\nThat's it."
+
+
+def _trailing_reasoning(action, rng):
+    return json.dumps(action) + "\n\nI chose this because " + "the thread {really} matters. " * rng.randint(1, 40)
+
+
+def _trailing_commas(action, rng):
+    text = json.dumps(action, indent=2)
+    return text.replace("\n  ]", ",\n  ]")[:-2] + ",\n}"
+
+
+def _python_repr(action, rng):
+    return repr(action)
+
+
+def _python_literals(action, rng):
+    return json.dumps({**action, "confident": True, "extra": None})
+
+
+def _raw_newlines(action, rng):
+    text = json.dumps(action)
+    return text.replace(". ", ".\n", 1) if ". " in text else text
+
+
+def _braces_in_strings(action, rng):
+    if "content" not in action:
+        return json.dumps(action)
+    return json.dumps({**action, "content": action["content"] + " Consider {x: 1} and the set {a, b}}."})
+
+
+def _unquoted_keys(action, rng):
+    text = json.dumps(action)
+    for key in action:
+        text = text.replace(f'"{key}":', f"{key}:", 1)
+    return text
+
+
+def _truncated(action, rng):
+    text = json.dumps(action, indent=2)
+    # Cut somewhere after the action value, like a max_tokens cutoff
+    earliest = text.index('"action"') + len(f'"action": "{action["action"]}"') + 1
+    return text[:rng.randint(earliest, len(text) - 1)]
+
+
+MUTATIONS = [
+    _compact, _pretty, _preamble, _fenced, _trailing_reasoning, _trailing_commas,
+    _python_repr, _python_literals, _raw_newlines, _braces_in_strings, _unquoted_keys,
+    _truncated,
+]
+
+
+def build_corpus() -> list[dict]:
+    """Well-formed actions covering every action type."""
+    corpus = [dict(a) for a in MockAdapter.MOCK_ACTIONS]
+    corpus.append({"action": "web_search", "query": "emergent behavior", "reason": "Curious about the origins."})
+    corpus.append({"action": "reply", "thread_id": 4, "parent_reply_id": 12, "content": "Quoting you: \"order from rules\" isn't the whole story; it's also about {feedback}."})
+    return corpus
+
+
+def fuzz(cases: int, rng: random.Random) -> dict:
+    """Parse ``cases`` mutated actions; count failures per mutation."""
+    corpus = build_corpus()
+    totals: Counter = Counter()
+    wrong: Counter = Counter()
+    repaired = 0
+    errors = []
+    for _ in range(cases):
+        action = rng.choice(corpus)
+        mutation = rng.choice(MUTATIONS)
+        text = mutation(action, rng)
+        totals[mutation.__name__] += 1
+        try:
+            parsed = parse_bot_action(text)
+        except Exception as e:  # The parser must never raise
+            errors.append(f"{mutation.__name__}: {e!r} on {text[:120]!r}")
+            continue
+        repaired += parsed.repaired
+        if parsed.action != action["action"]:
+            wrong[mutation.__name__] += 1
+
+    return {
+        "cases": cases,
+        "wrong_action": sum(wrong.values()),
+        "wrong_by_mutation": {name: f"{wrong[name]}/{totals[name]}" for name in totals if wrong[name]},
+        "repaired": repaired,
+        "exceptions": errors[:10],
+        "exception_count": len(errors),
+    }
+
+
+def _time_parse(text: str, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse_bot_action(text)
+    return (time.perf_counter() - started) / repeat
+
+
+def benchmark(repeat: int) -> dict:
+    """Parse throughput on typical responses, and scaling on brace-heavy ones."""
+    typical = [_pretty(a, None) for a in build_corpus()] + [_preamble(a, None) for a in build_corpus()]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in typical:
+            parse_bot_action(text)
+    elapsed = time.perf_counter() - started
+    parsed = repeat * len(typical)
+
+    # Long reasoning that sketches JSON, with the real action at the end or
+    # missing entirely (the worst case for backtracking regexes); parse
+    # time should grow linearly with length
+    action = json.dumps({"action": "do_nothing", "reason": "done"})
+    with_action = {}
+    without_action = {}
+    for size in (250, 500, 1000, 2000, 4000):
+        noise = "Draft: " + '{"note": "step {x}", "depth": {"a": {"b": [1, 2]}}}, ' * size
+        label = f"{len(noise) // 1024}KiB"
+        runs = max(1, repeat // 100)
+        with_action[label] = round(_time_parse(noise + action, runs) * 1000, 2)
+        without_action[label] = round(_time_parse(noise + "I'll pass.", runs) * 1000, 2)
+
+    return {
+        "responses_per_second": round(parsed / elapsed),
+        "brace_heavy_ms_by_size": with_action,
+        "brace_heavy_no_action_ms_by_size": without_action,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fuzz and benchmark the bot action parser.")
+    parser.add_argument("--cases", type=int, default=5000, help="Mutated responses to fuzz")
+    parser.add_argument("--repeat", type=int, default=500, help="Benchmark repetitions")
+    parser.add_argument("--seed", type=int, default=42, help="Fuzz seed")
+    args = parser.parse_args()
+
+    report = {
+        "fuzz": fuzz(args.cases, random.Random(args.seed)),
+        "benchmark": benchmark(args.repeat),
+    }
+    print(json.dumps(report, indent=2))
+    if report["fuzz"]["wrong_action"] or report["fuzz"]["exception_count"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
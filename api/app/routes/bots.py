@@ -16,6 +16,7 @@ from api.app.models.bot import Bot
 from api.app.models.thread import Thread
 from api.app.models.reply import Reply
 from api.app.models.follow import Follow
+from api.app.orchestrator.prompt_builder import invalidate_prompt_cache
 
 
 router = APIRouter(prefix="/api/bots", tags=["bots"])
@@ -42,10 +43,11 @@ class PersonalityConfig(BaseModel):
 
 
 class ModelConfig(BaseModel):
-    provider: str = "anthropic"
+    provider: str = Field(default="anthropic", pattern="^(anthropic|ollama|mock)$")  # Used when LLM_ROUTING_ENABLED
     model: str = "claude-sonnet-4-5-20250929"
     temperature: float = Field(default=0.8, ge=0, le=2)
     max_tokens: int = Field(default=1000, ge=100, le=4096)
+    max_input_tokens: int | None = Field(default=None, ge=1000, le=200000)
 
 
 class CustomBotCreate(BaseModel):
@@ -266,6 +268,8 @@ def create_custom_bot(request: CustomBotCreate, db: Session = Depends(get_db)):
             "max_tokens": model_cfg.max_tokens,
         },
     }
+    if model_cfg.max_input_tokens:
+        personality_config["model"]["max_input_tokens"] = model_cfg.max_input_tokens
 
     db_bot = Bot(
         id=bot_id,
@@ -276,6 +280,7 @@ def create_custom_bot(request: CustomBotCreate, db: Session = Depends(get_db)):
     db.add(db_bot)
     db.commit()
     db.refresh(db_bot)
+    invalidate_prompt_cache()
 
     followers, following = get_follower_counts(db, db_bot.id)
     return BotResponse(
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from api.app.database import get_db
 from api.app.models.bot import Bot
+from api.app.orchestrator.prompt_builder import invalidate_prompt_cache
 from api.app.usage import DAILY_TOKEN_CAP, DAILY_COST_CAP_USD
 
 router = APIRouter(prefix="/api/bots", tags=["config"])
@@ -67,6 +68,7 @@ def update_bot_config(bot_id: str, config: BotConfigUpdate, db: Session = Depend
 
     bot.personality_config = updated
     db.commit()
+    invalidate_prompt_cache()
 
     return {"success": True, "bot_id": bot_id, "personality_config": updated}
 
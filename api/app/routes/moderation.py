@@ -9,6 +9,7 @@ from api.app.models.bot import Bot
 from api.app.models.thread import Thread
 from api.app.models.reply import Reply
 from api.app.models.moderation import ContentFlag
+from api.app.orchestrator.feed import record_feed_deletion
 
 
 router = APIRouter(prefix="/api/moderation", tags=["moderation"])
@@ -81,6 +82,7 @@ def delete_thread(thread_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Thread not found")
     db.delete(thread)
     db.commit()
+    record_feed_deletion(db)
     return {"deleted": True, "thread_id": thread_id}
 
 
@@ -92,4 +94,5 @@ def delete_reply(reply_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Reply not found")
     db.delete(reply)
     db.commit()
+    record_feed_deletion(db)
     return {"deleted": True, "reply_id": reply_id}
@@ -4,7 +4,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from api.app.config import get_settings
-from api.app.orchestrator.scheduler import update_pace, get_current_pace, trigger_heartbeat
+from api.app.orchestrator.scheduler import update_pace, get_current_pace, request_heartbeat, request_tick
 
 
 router = APIRouter(prefix="/api/pace", tags=["pace"])
@@ -84,16 +84,33 @@ def set_pace(pace: PaceUpdate):
 @router.post("/trigger/{bot_id}")
 async def trigger_bot_heartbeat(bot_id: str):
     """Manually trigger a heartbeat for a specific bot."""
-    result = await trigger_heartbeat(bot_id)
+    result = await request_heartbeat(bot_id)
     return result
 
 
 @router.post("/trigger")
 async def trigger_all_heartbeats():
     """Manually trigger heartbeats for all bots."""
-    from api.app.orchestrator.scheduler import run_all_heartbeats
-    await run_all_heartbeats()
-    return {"status": "ok", "message": "All heartbeats triggered"}
+    tick = await request_tick()
+    if tick.get("timed_out"):
+        return {"status": "error", "message": tick["error"], "tick": None}
+    if tick.get("coalesced"):
+        return {"status": "ok", "message": "A tick was already running; joined it", "tick": tick}
+    return {"status": "ok", "message": "All heartbeats triggered", "tick": tick}
+
+
+@router.get("/last-tick")
+def get_last_tick_summary():
+    """Get wall time and per-bot durations for the most recent tick."""
+    from api.app.orchestrator.scheduler import get_last_tick
+    return {"tick": get_last_tick()}
+
+
+@router.get("/status")
+def get_status():
+    """Get scheduler lag, missed/overlapping run counters and pace warnings."""
+    from api.app.orchestrator.scheduler import get_scheduler_status
+    return get_scheduler_status()
 
 
 @router.get("/presets")
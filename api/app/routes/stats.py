@@ -15,7 +15,9 @@ from api.app.models.vote import Vote
 from api.app.models.activity_log import ActivityLog
 from api.app.models.warm_memory import WarmMemory
 from api.app.models.cold_memory import ColdMemory
+from api.app.models.perf import HeartbeatPerf
 from api.app.usage import DAILY_TOKEN_CAP, DAILY_COST_CAP_USD
+from api.app.orchestrator.perf import summarize
 
 
 router = APIRouter(prefix="/api/stats", tags=["stats"])
@@ -27,6 +29,8 @@ class BotUsageResponse(BaseModel):
     date: date
     input_tokens: int
     output_tokens: int
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     total_tokens: int
     estimated_cost_usd: float
     token_cap: int
@@ -34,11 +38,17 @@ class BotUsageResponse(BaseModel):
     cap_exceeded: bool
 
 
+class ProviderUsageResponse(BaseModel):
+    total_tokens: int
+    estimated_cost_usd: float
+
+
 class UsageSummaryResponse(BaseModel):
     period: str
     bots: list[BotUsageResponse]
     total_tokens: int
     total_cost_usd: float
+    by_provider: dict[str, ProviderUsageResponse] = {}
 
 
 @router.get("/usage", response_model=UsageSummaryResponse)
@@ -65,6 +75,8 @@ def get_usage(
             TokenUsage.bot_id,
             func.sum(TokenUsage.input_tokens).label("input_tokens"),
             func.sum(TokenUsage.output_tokens).label("output_tokens"),
+            func.sum(TokenUsage.cache_read_tokens).label("cache_read_tokens"),
+            func.sum(TokenUsage.cache_write_tokens).label("cache_write_tokens"),
             func.sum(TokenUsage.estimated_cost_usd).label("cost"),
         )
         .filter(TokenUsage.date >= start_date)
@@ -79,7 +91,9 @@ def get_usage(
     for row in rows:
         inp = row.input_tokens or 0
         out = row.output_tokens or 0
-        total = inp + out
+        cache_read = row.cache_read_tokens or 0
+        cache_write = row.cache_write_tokens or 0
+        total = inp + out + cache_read + cache_write
         cost = row.cost or 0.0
         total_tokens += total
         total_cost += cost
@@ -100,6 +114,8 @@ def get_usage(
             date=today,
             input_tokens=inp,
             output_tokens=out,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
             total_tokens=total,
             estimated_cost_usd=round(cost, 4),
             token_cap=token_cap,
@@ -107,11 +123,34 @@ def get_usage(
             cap_exceeded=total >= token_cap or cost >= cost_cap,
         ))
 
+    # Heartbeats, extraction and compression are each recorded under the
+    # provider that served them
+    provider_rows = (
+        db.query(
+            TokenUsage.provider,
+            func.sum(
+                TokenUsage.input_tokens + TokenUsage.output_tokens
+                + TokenUsage.cache_read_tokens + TokenUsage.cache_write_tokens
+            ).label("tokens"),
+            func.sum(TokenUsage.estimated_cost_usd).label("cost"),
+        )
+        .filter(TokenUsage.date >= start_date)
+        .group_by(TokenUsage.provider)
+        .all()
+    )
+
     return UsageSummaryResponse(
         period=period,
         bots=bot_usage,
         total_tokens=total_tokens,
         total_cost_usd=round(total_cost, 4),
+        by_provider={
+            row.provider: ProviderUsageResponse(
+                total_tokens=row.tokens or 0,
+                estimated_cost_usd=round(row.cost or 0.0, 4),
+            )
+            for row in provider_rows
+        },
     )
 
 
@@ -414,3 +453,172 @@ def _net_votes_between(db: Session, voter_id: str, author_id: str) -> int:
         .scalar() or 0
     )
     return thread_votes + reply_votes
+
+
+@router.get("/events")
+def get_event_bus_stats():
+    """Return heartbeat event bus counters: events published per type and per-consumer progress."""
+    from api.app.orchestrator.post_processing import event_bus
+    return event_bus.stats()
+
+
+@router.get("/skipped-llm")
+def get_skipped_llm(
+    hours: int = Query(24, ge=1, le=720),
+    db: Session = Depends(get_db),
+):
+    """Return LLM calls saved by the heartbeat fast path, per bot, over a time window.
+
+    Saved tokens are estimated from each bot's average tokens per LLM
+    heartbeat in the same window.
+    """
+    from api.app.orchestrator.fast_path import fast_path_stats
+
+    cutoff = datetime.utcnow() - timedelta(hours=hours)
+    logs = (
+        db.query(ActivityLog.bot_id, ActivityLog.details, ActivityLog.tokens_used)
+        .filter(ActivityLog.created_at >= cutoff)
+        .all()
+    )
+
+    per_bot: dict[str, dict] = {}
+    for bot_id, details, tokens_used in logs:
+        entry = per_bot.setdefault(bot_id, {"skipped_llm": 0, "llm_heartbeats": 0, "llm_tokens": 0})
+        if (details or {}).get("skipped_llm"):
+            entry["skipped_llm"] += 1
+        elif tokens_used:
+            entry["llm_heartbeats"] += 1
+            entry["llm_tokens"] += tokens_used
+
+    bots = {}
+    for bot_id, entry in per_bot.items():
+        average = entry.pop("llm_tokens") / entry["llm_heartbeats"] if entry["llm_heartbeats"] else 0
+        entry["estimated_tokens_saved"] = round(average * entry["skipped_llm"])
+        bots[bot_id] = entry
+
+    return {
+        "window_hours": hours,
+        "skipped_llm": sum(e["skipped_llm"] for e in bots.values()),
+        "llm_heartbeats": sum(e["llm_heartbeats"] for e in bots.values()),
+        "estimated_tokens_saved": sum(e["estimated_tokens_saved"] for e in bots.values()),
+        "by_bot": bots,
+        "process": fast_path_stats(),
+    }
+
+
+@router.get("/llm-cache")
+def get_llm_cache_stats(db: Session = Depends(get_db)):
+    """Return LLM response cache hits, misses and evictions, and tokens saved.
+
+    Process counters cover this API process since it started; stored
+    figures cover every process sharing the database.
+    """
+    from api.app.llm.cache import llm_cache_stats
+
+    return llm_cache_stats(db)
+
+
+@router.get("/llm-limits")
+def get_llm_limit_stats():
+    """Return each LLM provider's rate limiter state and congestion counters.
+
+    ``window`` is the current adaptive concurrency limit; ``backoffs``
+    counts how often a 429, 5xx or latency spike halved it. Every LLM call
+    is made by the scheduler owner, so other processes report the state it
+    last persisted (``source: persisted``, refreshed every third of the
+    scheduler lease TTL).
+    """
+    from api.app.config import get_settings
+    from api.app.llm.limiter import get_persisted_limiter_stats, limiter_stats
+    from api.app.orchestrator.scheduler import runs_schedule
+
+    enabled = get_settings().llm_limiter_enabled
+    if not runs_schedule():
+        persisted = get_persisted_limiter_stats()
+        if persisted:
+            return {"enabled": enabled, "source": "persisted", **persisted}
+    return {"enabled": enabled, "source": "local", "providers": limiter_stats()}
+
+
+@router.get("/parsing")
+def get_parse_stats(
+    hours: int = Query(24, ge=1, le=720),
+    db: Session = Depends(get_db),
+):
+    """Return action parse failures and repairs over a time window, per action mode and bot.
+
+    A parse failure is an LLM response with no usable action, logged as a
+    do_nothing; a repair is one that only parsed after fixing its JSON.
+    With multi-action heartbeats, ``actions_per_response`` shows how many
+    actions each prompt paid for.
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=hours)
+    logs = (
+        db.query(ActivityLog.bot_id, ActivityLog.details)
+        .filter(ActivityLog.created_at >= cutoff, ActivityLog.tokens_used > 0)
+        .all()
+    )
+
+    def _empty() -> dict:
+        return {"responses": 0, "actions": 0, "parse_failed": 0, "repaired": 0}
+
+    overall = _empty()
+    by_mode: dict[str, dict] = {}
+    by_bot: dict[str, dict] = {}
+    for bot_id, details in logs:
+        details = details or {}
+        if "raw_response" not in details:
+            continue  # Not an action chosen by the LLM
+        mode = details.get("action_mode", "json")
+        for entry in (overall, by_mode.setdefault(mode, _empty()), by_bot.setdefault(bot_id, _empty())):
+            entry["responses"] += 1
+            entry["actions"] += details.get("batch_size", 1)
+            entry["parse_failed"] += bool(details.get("parse_failed"))
+            entry["repaired"] += bool(details.get("parse_repaired"))
+
+    for entry in (overall, *by_mode.values(), *by_bot.values()):
+        entry["failure_rate"] = round(entry["parse_failed"] / entry["responses"], 4) if entry["responses"] else 0.0
+        entry["actions_per_response"] = round(entry["actions"] / entry["responses"], 2) if entry["responses"] else 0.0
+
+    return {"window_hours": hours, **overall, "by_mode": by_mode, "by_bot": by_bot}
+
+
+@router.get("/perf")
+def get_heartbeat_perf(
+    hours: int = Query(24, ge=1, le=720),
+    bot_id: str | None = None,
+    provider: str | None = None,
+    db: Session = Depends(get_db),
+):
+    """Return p50/p95/p99 heartbeat stage durations (ms) over a time window.
+
+    Stages cover the critical path (usage cap, prompt sections, LLM call,
+    parse, execute) plus event-bus consumers (moderation, memory extraction,
+    cold compression). Broken down overall, per bot and per provider.
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=hours)
+    query = db.query(HeartbeatPerf).filter(HeartbeatPerf.created_at >= cutoff)
+    if bot_id:
+        query = query.filter(HeartbeatPerf.bot_id == bot_id)
+    if provider:
+        query = query.filter(HeartbeatPerf.provider == provider)
+
+    overall: dict[str, list[int]] = {}
+    by_bot: dict[str, dict[str, list[int]]] = {}
+    by_provider: dict[str, dict[str, list[int]]] = {}
+    count = 0
+    for row in query.all():
+        count += 1
+        samples = {**(row.stages or {}), "total": row.total_ms}
+        for stage, ms in samples.items():
+            overall.setdefault(stage, []).append(ms)
+            by_bot.setdefault(row.bot_id, {}).setdefault(stage, []).append(ms)
+            by_provider.setdefault(row.provider, {}).setdefault(stage, []).append(ms)
+
+    return {
+        "window_hours": hours,
+        "heartbeats": count,
+        "overall": summarize(overall),
+        "by_bot": {bid: summarize(stages) for bid, stages in by_bot.items()},
+        "by_provider": {name: summarize(stages) for name, stages in by_provider.items()},
+    }
@@ -11,6 +11,7 @@ from api.app.database import get_db
 from api.app.models.thread import Thread
 from api.app.models.reply import Reply
 from api.app.models.vote import Vote
+from api.app.orchestrator.feed import invalidate_feed_cache
 
 
 router = APIRouter(prefix="/api/threads", tags=["threads"])
@@ -83,6 +84,7 @@ def create_thread(thread: ThreadCreate, db: Session = Depends(get_db)):
     db.add(db_thread)
     db.commit()
     db.refresh(db_thread)
+    invalidate_feed_cache()
     return db_thread
 
 
@@ -253,6 +255,7 @@ def create_reply(
     thread.last_reply_at = datetime.utcnow()
     db.commit()
     db.refresh(db_reply)
+    invalidate_feed_cache()
     return db_reply
 
 
@@ -1,5 +1,6 @@
 """WebSocket activity stream for real-time dashboard updates."""
 
+import asyncio
 import logging
 from typing import Set
 
@@ -37,6 +38,71 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
+async def relay_activity_logs(stop_event: asyncio.Event, poll_seconds: float = 2.0):
+    """Broadcast new activity to this process's WebSocket clients.
+
+    Runs in every API process. Heartbeats run only in the scheduler owner
+    (an API worker or the standalone worker), so instead of broadcasting from
+    the heartbeat it polls for new ActivityLog rows, whichever process wrote
+    them, and each process's clients see the same live activity once.
+    """
+    from sqlalchemy import func
+    from api.app.database import SessionLocal
+    from api.app.models.activity_log import ActivityLog
+    from api.app.models.bot import Bot
+
+    def latest_id() -> int:
+        db = SessionLocal()
+        try:
+            return db.query(func.max(ActivityLog.id)).scalar() or 0
+        finally:
+            db.close()
+
+    last_id = latest_id()
+    while not stop_event.is_set():
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=poll_seconds)
+        except asyncio.TimeoutError:
+            pass
+        if stop_event.is_set():
+            continue
+        if not manager.active_connections:
+            # Skip ahead, so the next client to connect only gets live activity
+            try:
+                last_id = latest_id()
+            except Exception as e:
+                logger.debug(f"Activity relay poll failed: {e}")
+            continue
+
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(ActivityLog, Bot.name)
+                .outerjoin(Bot, Bot.id == ActivityLog.bot_id)
+                .filter(ActivityLog.id > last_id)
+                .order_by(ActivityLog.id.asc())
+                .limit(100)
+                .all()
+            )
+        except Exception as e:
+            logger.debug(f"Activity relay poll failed: {e}")
+            rows = []
+        finally:
+            db.close()
+
+        for log, bot_name in rows:
+            last_id = log.id
+            await manager.broadcast({
+                "type": "heartbeat_complete",
+                "bot_id": log.bot_id,
+                "bot_name": bot_name or log.bot_id,
+                "action": log.action_type,
+                "details": {k: v for k, v in (log.details or {}).items() if k != "raw_response"},
+                "tokens_used": log.tokens_used,
+                "timestamp": log.created_at.isoformat(),
+            })
+
+
 @router.websocket("/ws/activity")
 async def activity_stream(websocket: WebSocket):
     """WebSocket endpoint for real-time activity updates."""
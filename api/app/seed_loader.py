@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from api.app.models.thread import Thread
 from api.app.models.bot import Bot
+from api.app.orchestrator.prompt_builder import invalidate_prompt_cache
 
 
 logger = logging.getLogger(__name__)
@@ -55,6 +56,7 @@ def load_seeds(db: Session) -> int:
         )
         db.add(system_bot)
         db.commit()
+        invalidate_prompt_cache()
         logger.info("Created system bot for seed threads")
 
     # Create threads
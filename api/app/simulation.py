@@ -0,0 +1,201 @@
+"""Offline simulation harness: replay N bots x M ticks on a virtual clock.
+
+Runs the real ``heartbeat()`` path against a throwaway SQLite database with
+the seeded mock LLM, advancing a virtual clock instead of waiting, so weeks
+of forum activity take seconds. Reports throughput (heartbeats/sec), DB
+queries per heartbeat and DB size growth. Run with::
+
+    python -m api.app.simulation --bots 6 --ticks 200 --seed 42
+
+App modules are imported only after ``DATABASE_URL`` and ``LLM_PROVIDER``
+are pointed at the simulation, so nothing touches the real database.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+
+def _configure_environment(db_path: Path) -> None:
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["LLM_PROVIDER"] = "mock"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+def _create_bots(db, count: int) -> list[str]:
+    """Create ``count`` bots by cycling the YAML personalities."""
+    from api.app.bot_loader import load_all_bot_configs
+    from api.app.models.bot import Bot
+
+    configs = sorted(load_all_bot_configs(), key=lambda c: c.get("id", ""))
+    if not configs:
+        raise RuntimeError("No bot configs found to simulate")
+
+    bot_ids = []
+    for i in range(count):
+        base = configs[i % len(configs)]
+        round_no = i // len(configs)
+        bot_id = base["id"] if round_no == 0 else f"{base['id']}_{round_no + 1}"
+        name = base.get("name", bot_id) if round_no == 0 else f"{base.get('name', bot_id)} {round_no + 1}"
+        db.add(Bot(id=bot_id, name=name, personality_config={**base, "id": bot_id, "name": name}))
+        bot_ids.append(bot_id)
+    db.commit()
+    return bot_ids
+
+
+async def run_simulation(
+    bots: int,
+    ticks: int,
+    interval_seconds: int,
+    seed: int,
+    start: datetime,
+    db_path: Path,
+) -> dict:
+    """Run the simulation and return a throughput report."""
+    from sqlalchemy import event
+
+    from api.app import clock
+    from api.app.database import create_tables, engine, SessionLocal
+    from api.app.llm import close_llm_clients
+    from api.app.llm.cache import llm_cache_stats
+    from api.app.llm.mock import seed_mock
+    from api.app.orchestrator.fast_path import seed_fast_path
+    from api.app.models.activity_log import ActivityLog
+    from api.app.orchestrator.heartbeat import heartbeat
+    from api.app.seed_loader import load_seeds
+
+    virtual_clock = clock.VirtualClock(start)
+    clock.set_clock(virtual_clock)
+    seed_mock(seed)
+    seed_fast_path(seed)
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        bot_ids = _create_bots(db, bots)
+        load_seeds(db)
+    finally:
+        db.close()
+
+    queries = 0
+
+    def _count_query(*args, **kwargs):
+        nonlocal queries
+        queries += 1
+
+    event.listen(engine, "before_cursor_execute", _count_query)
+
+    size_before = db_path.stat().st_size
+    actions: Counter = Counter()
+    failures = 0
+    heartbeats = 0
+    step = interval_seconds / len(bot_ids)
+
+    started = time.perf_counter()
+    try:
+        for _ in range(ticks):
+            # Bots take turns, evenly spaced across each virtual interval
+            for bot_id in bot_ids:
+                virtual_clock.advance(step)
+                db = SessionLocal()
+                try:
+                    result = await heartbeat(bot_id, db)
+                finally:
+                    db.close()
+                heartbeats += 1
+                for taken in result.get("actions", [result]):
+                    if taken.get("success"):
+                        actions[taken.get("action", "unknown")] += 1
+                    else:
+                        failures += 1
+    finally:
+        elapsed = time.perf_counter() - started
+        event.remove(engine, "before_cursor_execute", _count_query)
+        clock.set_clock(None)
+        await close_llm_clients()
+
+    db = SessionLocal()
+    try:
+        capped = (
+            db.query(ActivityLog)
+            .filter(ActivityLog.action_type == "do_nothing")
+            .all()
+        )
+        cap_hits = sum(1 for log in capped if (log.details or {}).get("cap_exceeded"))
+        skipped_llm = sum(1 for log in capped if (log.details or {}).get("skipped_llm"))
+        parse_failures = sum(1 for log in capped if (log.details or {}).get("parse_failed"))
+        llm_cache = llm_cache_stats(db)
+    finally:
+        db.close()
+
+    size_after = db_path.stat().st_size
+    return {
+        "bots": len(bot_ids),
+        "ticks": ticks,
+        "heartbeats": heartbeats,
+        "failures": failures,
+        "cap_hits": cap_hits,
+        "skipped_llm": skipped_llm,
+        "parse_failures": parse_failures,
+        "llm_cache": {**llm_cache["process"], "entries": llm_cache["entries"]},
+        "actions": dict(actions),
+        "virtual_start": start.isoformat(),
+        "virtual_end": virtual_clock.now.isoformat(),
+        "virtual_days": round((virtual_clock.now - start).total_seconds() / 86400, 2),
+        "wall_seconds": round(elapsed, 3),
+        "heartbeats_per_second": round(heartbeats / elapsed, 2) if elapsed else 0.0,
+        "db_queries": queries,
+        "db_queries_per_heartbeat": round(queries / heartbeats, 1) if heartbeats else 0.0,
+        "db_size_before_bytes": size_before,
+        "db_size_after_bytes": size_after,
+        "db_growth_bytes_per_heartbeat": round((size_after - size_before) / heartbeats) if heartbeats else 0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run Botastrophic heartbeats on a virtual clock.")
+    parser.add_argument("--bots", type=int, default=6, help="Number of bots (YAML personalities are cycled)")
+    parser.add_argument("--ticks", type=int, default=100, help="Heartbeat ticks to replay")
+    parser.add_argument("--interval", type=int, default=3600, help="Virtual seconds per tick")
+    parser.add_argument("--seed", type=int, default=42, help="Mock LLM seed")
+    parser.add_argument("--start", default="2026-01-01T00:00:00", help="Virtual start time (ISO 8601, UTC)")
+    parser.add_argument("--db", help="SQLite file to use (default: a new temp file)")
+    parser.add_argument("--keep-db", action="store_true", help="Keep the temp database afterwards")
+    args = parser.parse_args()
+
+    if args.db:
+        db_path = Path(args.db).resolve()
+        if db_path.exists():
+            parser.error(f"{db_path} already exists; simulations need a fresh database")
+    else:
+        fd, name = tempfile.mkstemp(prefix="botastrophic-sim-", suffix=".db")
+        os.close(fd)
+        os.unlink(name)
+        db_path = Path(name)
+
+    _configure_environment(db_path)
+    try:
+        report = asyncio.run(run_simulation(
+            bots=args.bots,
+            ticks=args.ticks,
+            interval_seconds=args.interval,
+            seed=args.seed,
+            start=datetime.fromisoformat(args.start),
+            db_path=db_path,
+        ))
+    finally:
+        if not args.db and not args.keep_db:
+            db_path.unlink(missing_ok=True)
+
+    report["database"] = str(db_path)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
 """Cost tracking and daily usage caps."""
 
 import logging
-from datetime import date
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from api.app import clock
+from api.app.llm.client import LLMResponse
 from api.app.models.usage import TokenUsage
 from api.app.models.bot import Bot
 
@@ -18,15 +19,30 @@ DAILY_COST_CAP_USD = 1.00
 COST_PER_1M_INPUT = 3.00
 COST_PER_1M_OUTPUT = 15.00
 
+# Prompt cache pricing relative to regular input tokens
+CACHE_READ_COST_FACTOR = 0.1
+CACHE_WRITE_COST_FACTOR = 1.25
 
-def estimate_cost(input_tokens: int, output_tokens: int, provider: str = "anthropic") -> float:
+
+def estimate_cost(
+    input_tokens: int,
+    output_tokens: int,
+    provider: str = "anthropic",
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> float:
     """Estimate cost in USD for token usage."""
     if provider == "ollama":
         return 0.0  # Local models are free
     if provider == "mock":
         return 0.0
     # Anthropic pricing
-    return (input_tokens * COST_PER_1M_INPUT + output_tokens * COST_PER_1M_OUTPUT) / 1_000_000
+    billed_input = (
+        input_tokens
+        + cache_read_tokens * CACHE_READ_COST_FACTOR
+        + cache_write_tokens * CACHE_WRITE_COST_FACTOR
+    )
+    return (billed_input * COST_PER_1M_INPUT + output_tokens * COST_PER_1M_OUTPUT) / 1_000_000
 
 
 def record_usage(
@@ -35,9 +51,19 @@ def record_usage(
     input_tokens: int,
     output_tokens: int,
     provider: str,
+    commit: bool = True,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
 ) -> TokenUsage:
-    """Record token usage for a bot. Upserts into today's row."""
-    today = date.today()
+    """Record token usage for a bot. Upserts into today's row.
+
+    ``input_tokens`` excludes prompt-cache reads and writes, which are
+    tracked (and priced) separately.
+
+    With ``commit=False`` the write is only flushed, so it lands (or rolls
+    back) with the rest of the caller's transaction.
+    """
+    today = clock.today()
 
     existing = db.query(TokenUsage).filter(
         TokenUsage.bot_id == bot_id,
@@ -45,13 +71,18 @@ def record_usage(
         TokenUsage.provider == provider,
     ).first()
 
-    cost = estimate_cost(input_tokens, output_tokens, provider)
+    cost = estimate_cost(input_tokens, output_tokens, provider, cache_read_tokens, cache_write_tokens)
 
     if existing:
         existing.input_tokens += input_tokens
         existing.output_tokens += output_tokens
+        existing.cache_read_tokens += cache_read_tokens
+        existing.cache_write_tokens += cache_write_tokens
         existing.estimated_cost_usd += cost
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
         return existing
 
     usage = TokenUsage(
@@ -59,17 +90,43 @@ def record_usage(
         date=today,
         input_tokens=input_tokens,
         output_tokens=output_tokens,
+        cache_read_tokens=cache_read_tokens,
+        cache_write_tokens=cache_write_tokens,
         estimated_cost_usd=cost,
         provider=provider,
     )
     db.add(usage)
-    db.commit()
+    if commit:
+        db.commit()
+    else:
+        db.flush()
     return usage
 
 
+def record_llm_usage(
+    db: Session, bot_id: str, response: LLMResponse, provider: str, commit: bool = True,
+) -> TokenUsage | None:
+    """Record the tokens an LLM response spent under the provider that served it.
+
+    Responses served from the local response cache spent nothing and are skipped.
+    """
+    if response.cached:
+        return None
+    return record_usage(
+        db,
+        bot_id,
+        response.input_tokens,
+        response.output_tokens,
+        provider,
+        commit=commit,
+        cache_read_tokens=response.cache_read_tokens,
+        cache_write_tokens=response.cache_write_tokens,
+    )
+
+
 def get_today_usage(db: Session, bot_id: str) -> dict:
     """Get aggregated usage for a bot today across all providers."""
-    today = date.today()
+    today = clock.today()
     rows = db.query(TokenUsage).filter(
         TokenUsage.bot_id == bot_id,
         TokenUsage.date == today,
@@ -77,12 +134,17 @@ def get_today_usage(db: Session, bot_id: str) -> dict:
 
     total_input = sum(r.input_tokens for r in rows)
     total_output = sum(r.output_tokens for r in rows)
+    total_cache_read = sum(r.cache_read_tokens for r in rows)
+    total_cache_write = sum(r.cache_write_tokens for r in rows)
     total_cost = sum(r.estimated_cost_usd for r in rows)
 
     return {
         "input_tokens": total_input,
         "output_tokens": total_output,
-        "total_tokens": total_input + total_output,
+        "cache_read_tokens": total_cache_read,
+        "cache_write_tokens": total_cache_write,
+        # Cached prompt tokens still count towards the token cap
+        "total_tokens": total_input + total_output + total_cache_read + total_cache_write,
         "estimated_cost_usd": total_cost,
     }
 